@@ -3,4 +3,9 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-__all__ = ['errors', 'stream_readers', 'stream_writers', 'task']
+from artdaq.errors import DaqError, DaqWarning, DaqResourceWarning
+
+__all__ = ['archive', 'decimation', 'errors', 'multi_device', 'processing',
+           'scaling', 'stream_logger', 'stream_readers', 'stream_statistics',
+           'stream_writers', 'synchronization', 'task', 'task_pool',
+           'task_templates', 'waveforms']
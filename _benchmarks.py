@@ -0,0 +1,247 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import ctypes
+import re
+import timeit
+
+import numpy
+from artdaq._lib import lib_importer, wrapped_ndpointer, c_bool32
+from artdaq._task_modules.read_functions import _read_analog_f_64
+from artdaq.constants import AcquisitionType, FillMode
+from artdaq.errors import DaqError, check_for_error
+from artdaq.utils import flatten_channel_string, unflatten_channel_string
+
+__all__ = ['benchmark_read_analog_f_64', 'benchmark_channel_strings']
+
+
+def _legacy_read_analog_f_64(
+        task_handle, read_array, num_samps_per_chan, timeout,
+        fill_mode=FillMode.GROUP_BY_CHANNEL):
+    """
+    Reads analog samples through DaqFunctionImporter, checking argtypes
+    on every call, as _read_analog_f_64 did before the function table.
+    """
+    samps_per_chan_read = ctypes.c_int()
+    cfunc = lib_importer.windll.ArtDAQ_ReadAnalogF64
+    if cfunc.argtypes is None:
+        with cfunc.arglock:
+            if cfunc.argtypes is None:
+                cfunc.argtypes = [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    c_bool32,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
+                    ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                    ctypes.POINTER(c_bool32)]
+
+    error_code = cfunc(
+        task_handle, num_samps_per_chan, timeout, fill_mode.value,
+        read_array, numpy.prod(read_array.shape),
+        ctypes.byref(samps_per_chan_read), None)
+    check_for_error(error_code)
+
+    return samps_per_chan_read.value
+
+
+def _legacy_unflatten_channel_string(channel_names):
+    """
+    Expands a channel string into a list of names, compiling the patterns
+    and building every name on every call, as unflatten_channel_string
+    did before it was cached.
+    """
+    channel_list_to_return = []
+    channel_list = [c for c in channel_names.strip().split(',') if c]
+
+    for channel in channel_list:
+        channel = channel.strip()
+        colon_index = channel.find(':')
+
+        if colon_index == -1:
+            channel_list_to_return.append(channel)
+        else:
+            m_before = re.match('(.*?)([0-9]+)$', channel[:colon_index])
+            m_after = re.match('(.*?)([0-9]+)$', channel[colon_index+1:])
+
+            if not m_before or not m_after:
+                raise DaqError('Invalid range.', error_code=-200498)
+
+            num_before = int(m_before.group(2))
+            num_after = int(m_after.group(2))
+            num_min = min([num_before, num_after])
+            number_of_channels = abs(num_after - num_before) + 1
+
+            colon_expanded_channel = []
+            for i in range(number_of_channels):
+                colon_expanded_channel.append(
+                    '{0}{1}'.format(m_before.group(1), num_min + i))
+
+            if num_after < num_before:
+                colon_expanded_channel.reverse()
+
+            channel_list_to_return.extend(colon_expanded_channel)
+
+    return channel_list_to_return
+
+
+def _legacy_flatten_channel_string(channel_names):
+    """
+    Flattens a list of channel names, matching every expanded name
+    against an uncompiled pattern, as flatten_channel_string did before
+    it was cached.
+    """
+    unflattened_channel_names = []
+    for channel_name in channel_names:
+        unflattened_channel_names.extend(
+            _legacy_unflatten_channel_string(channel_name))
+
+    flattened = []
+    base_name, start_index, end_index = '', -1, -1
+    for channel_name in unflattened_channel_names:
+        m = re.search('(.*[^0-9])?([0-9]+)$', channel_name)
+        if not m:
+            flattened.append((base_name, start_index, end_index))
+            base_name, start_index, end_index = channel_name, -1, -1
+            continue
+
+        index = int(m.group(2))
+        if m.group(1) == base_name and (
+                (index == end_index + 1 and end_index >= start_index) or
+                (index == end_index - 1 and end_index <= start_index)):
+            end_index = index
+        else:
+            flattened.append((base_name, start_index, end_index))
+            base_name, start_index, end_index = m.group(1), index, index
+    flattened.append((base_name, start_index, end_index))
+
+    names = []
+    for base_name, start_index, end_index in flattened:
+        if start_index == -1:
+            names.append(base_name)
+        elif start_index == end_index:
+            names.append('{0}{1}'.format(base_name, start_index))
+        else:
+            names.append('{0}{1}:{2}'.format(
+                base_name, start_index, end_index))
+    return ','.join([n for n in names if n]).strip()
+
+
+def _time_per_call(function, iterations, repeat):
+    timer = timeit.Timer(function)
+    return min(timer.repeat(repeat=repeat, number=iterations)) / iterations
+
+
+def benchmark_read_analog_f_64(iterations=20000, repeat=5,
+                               number_of_channels=1,
+                               number_of_samples_per_channel=1):
+    """
+    Measures the per-call time of reading analog samples through the
+    function table and through the legacy DaqFunctionImporter path.
+
+    Both paths call the same entry point of the same task, so the
+    difference between the two is the per-call dispatch overhead. The
+    benchmark runs against the simulated driver in free-running mode,
+    so it does not need hardware and never waits for samples.
+
+    Args:
+        iterations (Optional[int]): Specifies the number of calls per
+            measurement.
+        repeat (Optional[int]): Specifies the number of measurements
+            per path. The fastest measurement is reported.
+        number_of_channels (Optional[int]): Specifies the number of
+            analog input channels to read.
+        number_of_samples_per_channel (Optional[int]): Specifies the
+            number of samples per channel to read per call.
+    Returns:
+        Dict[str, float]:
+
+        Indicates the time per call in seconds of the "legacy" and
+        "function_table" paths.
+    """
+    from artdaq.task import Task
+
+    previous_windll = lib_importer._windll
+    lib_importer.use_simulated_library(time_scale=None)
+    try:
+        with Task() as task:
+            task.ai_channels.add_ai_voltage_chan(
+                'Dev1/ai0:{0}'.format(number_of_channels - 1))
+            task.timing.cfg_samp_clk_timing(
+                rate=1000.0, sample_mode=AcquisitionType.CONTINUOUS,
+                samps_per_chan=number_of_samples_per_channel)
+            task.start()
+
+            handle = task._handle
+            data = numpy.zeros(
+                (number_of_channels, number_of_samples_per_channel),
+                dtype=numpy.float64)
+
+            results = {}
+            for name, read_function in (
+                    ('legacy', _legacy_read_analog_f_64),
+                    ('function_table', _read_analog_f_64)):
+                results[name] = _time_per_call(
+                    lambda: read_function(
+                        handle, data, number_of_samples_per_channel, 10.0),
+                    iterations, repeat)
+
+            task.stop()
+    finally:
+        if previous_windll is None:
+            lib_importer._windll = None
+            lib_importer.function_table.reset()
+        else:
+            lib_importer.set_library(previous_windll._library)
+
+    return results
+
+
+def benchmark_channel_strings(iterations=2000, repeat=5):
+    """
+    Measures the per-call time of the cached channel string functions of
+    artdaq.utils and of the implementations they replaced, on the
+    channel strings tasks typically pass around.
+
+    Args:
+        iterations (Optional[int]): Specifies the number of calls per
+            measurement.
+        repeat (Optional[int]): Specifies the number of measurements
+            per function. The fastest measurement is reported.
+    Returns:
+        Dict[str, float]:
+
+        Indicates the time per call in seconds, keyed by the name of the
+        operation and of the implementation, such as
+        "unflatten Dev1/ai0:4095 [legacy]".
+    """
+    cases = (
+        ('unflatten', 'Dev1/ai0:7',
+         _legacy_unflatten_channel_string, unflatten_channel_string),
+        ('unflatten', 'Dev1/ai0:4095',
+         _legacy_unflatten_channel_string, unflatten_channel_string),
+        ('flatten', ['Dev1/ai0:3', 'Dev1/ai4', 'Dev1/ai5:7'],
+         _legacy_flatten_channel_string, flatten_channel_string),
+        ('flatten', ['Dev1/ai0:4095'],
+         _legacy_flatten_channel_string, flatten_channel_string),
+    )
+
+    results = {}
+    for operation, argument, legacy_function, function in cases:
+        label = '{0} {1}'.format(
+            operation, argument if operation == 'unflatten'
+            else ','.join(argument))
+        for name, implementation in (('legacy', legacy_function),
+                                     ('cached', function)):
+            results['{0} [{1}]'.format(label, name)] = _time_per_call(
+                lambda: implementation(argument), iterations, repeat)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(benchmark_read_analog_f_64().items()):
+        print('_read_analog_f_64 [{0}]: {1:.2f} us/call'.format(
+            name, seconds * 1e6))
+    for name, seconds in sorted(benchmark_channel_strings().items()):
+        print('{0}: {1:.2f} us/call'.format(name, seconds * 1e6))
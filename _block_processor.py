@@ -0,0 +1,172 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import six
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+
+class BlockProcessor(object):
+    """
+    Defines the channel selection and reader attachment shared by the
+    objects that process the blocks of samples a stream reader reads,
+    such as decimators and statistics accumulators.
+
+    Channels are selected by row of the blocks, with a slice or a
+    sequence of indices, or by name. Names are resolved against the
+    channels the reader reads, which are the rows of its blocks, and
+    resolved again whenever the channels of the task or the channels to
+    read change.
+
+    Subclasses implement "_on_block", which the reader calls with each
+    block once attached, and take the rows of the selected channels from
+    a block with "_select". An exception raised while processing a block
+    of the reader, for example because a channel selected by name is no
+    longer read, is recorded instead of failing the read, and raised by
+    the next call to "_raise_error", which subclasses make when their
+    results are read.
+    """
+
+    def __init__(self, channels=None):
+        """
+        Args:
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels of the reader, to process. None selects every
+                channel.
+        """
+        self._channels = channels
+        self._reader = None
+        self._rows = None
+        self._rows_version = None
+        self._max_row = None
+        self._error = None
+
+        if channels is None or isinstance(channels, slice):
+            self._rows = channels
+            self._channel_names = None
+        else:
+            channels = list(channels)
+            if channels and all(
+                    isinstance(c, six.string_types) for c in channels):
+                self._channel_names = tuple(channels)
+            else:
+                self._channel_names = None
+                self._set_rows(numpy.asarray(channels, dtype=numpy.intp))
+
+    @property
+    def channels(self):
+        """
+        Optional[Union[slice, Sequence[int], Sequence[str]]]: Indicates
+            the channels that are processed. None selects every channel.
+        """
+        return self._channels
+
+    def attach(self, reader):
+        """
+        Processes every block of samples a stream reader reads.
+
+        Args:
+            reader (artdaq.stream_readers.ChannelReaderBase): Specifies
+                the reader.
+        """
+        if self._reader is not None:
+            raise DaqError(
+                'The block processor is already attached to a reader.',
+                Errors.UNKNOWN.value)
+
+        if self._channel_names is not None:
+            self._resolve_channel_names(reader)
+        reader.add_block_processor(self._process_reader_block)
+        self._reader = reader
+
+    def detach(self):
+        """
+        Stops processing the blocks of the reader it is attached to.
+        """
+        if self._reader is not None:
+            self._reader.remove_block_processor(self._process_reader_block)
+            self._reader = None
+
+    def _on_block(self, data):
+        raise NotImplementedError()
+
+    def _process_reader_block(self, data):
+        # The samples are already consumed from the buffer when a block is
+        # processed, so failing the read would lose them.
+        try:
+            self._on_block(data)
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _select(self, data):
+        """
+        Returns the rows of the selected channels of a block, as a 2D
+        array. A 1D block holds the samples of a single channel.
+        """
+        if data.ndim == 1:
+            return data[numpy.newaxis, :]
+
+        if self._channel_names is not None:
+            if self._reader is None:
+                raise DaqError(
+                    'Channels selected by name can only be processed once '
+                    'attached to a reader.', Errors.UNKNOWN.value)
+            if self._rows_version != self._reader._task._metadata.version:
+                self._resolve_channel_names(self._reader)
+
+        rows = self._rows
+        if rows is None:
+            return data
+        if self._max_row is not None and self._max_row >= data.shape[0]:
+            raise DaqError(
+                'The selected channels are not in the block.\n'
+                'Rows selected: {0}\nRows in block: {1}'.format(
+                    ', '.join(str(row) for row in rows), data.shape[0]),
+                Errors.UNKNOWN.value)
+        return data[rows]
+
+    def _resolve_channel_names(self, reader):
+        metadata = reader._task._metadata
+        # Reads the version first, so that a concurrent change resolves
+        # the names again on the next block.
+        version = metadata.version
+        read_channel_index = {
+            name: index
+            for index, name in enumerate(metadata.read_channel_names)}
+
+        missing = [name for name in self._channel_names
+                   if name not in read_channel_index]
+        if missing:
+            raise DaqError(
+                'The selected channels are not channels the task reads.\n'
+                'Channels: {0}'.format(', '.join(missing)),
+                Errors.UNKNOWN.value, task_name=reader._task.name)
+
+        self._set_rows(numpy.asarray(
+            [read_channel_index[name] for name in self._channel_names],
+            dtype=numpy.intp))
+        self._rows_version = version
+
+    def _set_rows(self, rows):
+        self._rows = rows
+        self._max_row = int(rows.max()) if len(rows) else None
+
+    @staticmethod
+    def _verify_number_of_channels(previous, current):
+        if previous and previous != current:
+            raise DaqError(
+                'The number of channels of a block does not match the '
+                'previous blocks. Reset the state before processing blocks '
+                'of a different set of channels.\n'
+                'Channels in block: {0}\nChannels in previous blocks: {1}'
+                .format(current, previous), Errors.UNKNOWN.value)
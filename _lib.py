@@ -4,10 +4,12 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import ctypes
+import os
 import platform
 import sys
 import threading
 
+import numpy
 import six
 from artdaq.errors import Error
 from numpy.ctypeslib import ndpointer
@@ -148,6 +150,174 @@ class DaqFunctionImporter(object):
                 'version of Art_DAQ.'.format(function))
 
 
+def _read_write_function_prototypes(task_handle):
+    """
+    Returns the argument types of the Art_DAQ read and write entry
+    points bound by DaqFunctionTable.
+
+    Args:
+        task_handle: Specifies the ctypes type of a task handle.
+    Returns:
+        Dict[str, List]: Indicates the argument types of each entry
+        point, keyed by function name.
+    """
+    def array(dtype):
+        return wrapped_ndpointer(dtype=dtype, flags=('C', 'W'))
+
+    # The driver only reads the arrays passed to write functions, so they
+    # may be read-only, such as cached waveforms.
+    def const_array(dtype):
+        return wrapped_ndpointer(dtype=dtype, flags=('C',))
+
+    int_ptr = ctypes.POINTER(ctypes.c_int)
+    reserved = ctypes.POINTER(c_bool32)
+
+    def read(dtype):
+        return [task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+                array(dtype), ctypes.c_uint, int_ptr, reserved]
+
+    def read_counter(dtype):
+        return [task_handle, ctypes.c_int, ctypes.c_double, array(dtype),
+                ctypes.c_uint, int_ptr, reserved]
+
+    def read_pulse(dtype):
+        return [task_handle, ctypes.c_int, ctypes.c_double, array(dtype),
+                array(dtype), ctypes.c_uint, int_ptr, reserved]
+
+    def read_scalar(*ctypes_types):
+        return ([task_handle, ctypes.c_double] +
+                [ctypes.POINTER(t) for t in ctypes_types] + [reserved])
+
+    def write(dtype):
+        return [task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+                ctypes.c_int, const_array(dtype), int_ptr, reserved]
+
+    def write_pulse(dtype):
+        return [task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+                const_array(dtype), const_array(dtype), int_ptr, reserved]
+
+    def write_scalar(*ctypes_types):
+        return ([task_handle, c_bool32, ctypes.c_double] +
+                list(ctypes_types) + [reserved])
+
+    return {
+        'ArtDAQ_ReadAnalogF64': read(numpy.float64),
+        'ArtDAQ_ReadAnalogScalarF64': read_scalar(ctypes.c_double),
+        'ArtDAQ_ReadBinaryI16': read(numpy.int16),
+        'ArtDAQ_ReadBinaryU16': read(numpy.uint16),
+        'ArtDAQ_ReadBinaryI32': read(numpy.int32),
+        'ArtDAQ_ReadBinaryU32': read(numpy.uint32),
+        'ArtDAQ_ReadDigitalU8': read(numpy.uint8),
+        'ArtDAQ_ReadDigitalU16': read(numpy.uint16),
+        'ArtDAQ_ReadDigitalU32': read(numpy.uint32),
+        'ArtDAQ_ReadDigitalScalarU32': read_scalar(ctypes.c_uint),
+        'ArtDAQ_ReadDigitalLines': [
+            task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+            array(numpy.bool_), ctypes.c_uint, ctypes.POINTER(ctypes.c_int32),
+            int_ptr, reserved],
+        'ArtDAQ_ReadCounterF64': read_counter(numpy.float64),
+        'ArtDAQ_ReadCounterU32': read_counter(numpy.uint32),
+        'ArtDAQ_ReadCounterScalarF64': read_scalar(ctypes.c_double),
+        'ArtDAQ_ReadCounterScalarU32': read_scalar(ctypes.c_uint),
+        'ArtDAQ_ReadCtrFreq': read_pulse(numpy.float64),
+        'ArtDAQ_ReadCtrTime': read_pulse(numpy.float64),
+        'ArtDAQ_ReadCtrTicks': read_pulse(numpy.uint32),
+        'ArtDAQ_ReadCtrFreqScalar': read_scalar(
+            ctypes.c_double, ctypes.c_double),
+        'ArtDAQ_ReadCtrTimeScalar': read_scalar(
+            ctypes.c_double, ctypes.c_double),
+        'ArtDAQ_ReadCtrTicksScalar': read_scalar(
+            ctypes.c_uint, ctypes.c_uint),
+        'ArtDAQ_WriteAnalogF64': write(numpy.float64),
+        'ArtDAQ_WriteAnalogScalarF64': write_scalar(ctypes.c_double),
+        'ArtDAQ_WriteBinaryI16': write(numpy.int16),
+        'ArtDAQ_WriteBinaryU16': write(numpy.uint16),
+        'ArtDAQ_WriteDigitalU8': write(numpy.uint8),
+        'ArtDAQ_WriteDigitalU16': write(numpy.uint16),
+        'ArtDAQ_WriteDigitalU32': write(numpy.uint32),
+        'ArtDAQ_WriteDigitalScalarU32': write_scalar(ctypes.c_uint),
+        'ArtDAQ_WriteDigitalLines': write(numpy.uint8),
+        'ArtDAQ_WriteCtrFreq': write_pulse(numpy.float64),
+        'ArtDAQ_WriteCtrTime': write_pulse(numpy.float64),
+        'ArtDAQ_WriteCtrTicks': write_pulse(numpy.uint32),
+        'ArtDAQ_WriteCtrFreqScalar': write_scalar(
+            ctypes.c_double, ctypes.c_double),
+        'ArtDAQ_WriteCtrTimeScalar': write_scalar(
+            ctypes.c_double, ctypes.c_double),
+        'ArtDAQ_WriteCtrTicksScalar': write_scalar(
+            ctypes.c_uint, ctypes.c_uint),
+    }
+
+
+class DaqFunctionTable(object):
+    """
+    Dispatch table of the Art_DAQ read and write entry points.
+
+    On first use, every entry point is bound once to a fresh, fully
+    typed function object, stored as an attribute of the table. Later
+    accesses are plain instance attribute lookups, so the read and write
+    functions call the entry points without going through
+    DaqFunctionImporter or checking argtypes on every call.
+    """
+
+    def __init__(self, importer):
+        """
+        Args:
+            importer (DaqLibImporter): Specifies the importer whose
+                library to bind the entry points from.
+        """
+        self._importer = importer
+        self._lock = threading.Lock()
+        self._bound = False
+
+    def __getattr__(self, function):
+        # Only reached for functions not bound yet.
+        if function.startswith('_'):
+            raise AttributeError(function)
+
+        with self._lock:
+            if not self._bound:
+                self._bind()
+
+        try:
+            return self.__dict__[function]
+        except KeyError:
+            raise DaqFunctionNotSupportedError(
+                'The Art_DAQ function "{0}" is not supported in this '
+                'version of Art_DAQ. Visit ni.com/downloads to upgrade your '
+                'version of Art_DAQ.'.format(function))
+
+    def reset(self):
+        """
+        Discards all bound entry points, so that they are bound again
+        from the current library on next use.
+        """
+        with self._lock:
+            for function in list(self.__dict__):
+                if not function.startswith('_'):
+                    del self.__dict__[function]
+            self._bound = False
+
+    def _bind(self):
+        library = self._importer.windll._library
+        prototypes = _read_write_function_prototypes(
+            self._importer.task_handle)
+
+        for function, argtypes in six.iteritems(prototypes):
+            try:
+                # Index the library rather than getting an attribute, to
+                # obtain a function object not shared with the
+                # DaqFunctionImporter path.
+                cfunc = library[function]
+            except (AttributeError, KeyError):
+                continue
+            cfunc.argtypes = argtypes
+            cfunc.restype = ctypes.c_int
+            self.__dict__[function] = cfunc
+
+        self._bound = True
+
+
 class DaqLibImporter(object):
     """
     Encapsulates Art_DAQ library importing and handle type parsing logic.
@@ -158,6 +328,7 @@ class DaqLibImporter(object):
         self._cdll = None
         self._cal_handle = None
         self._task_handle = None
+        self._function_table = DaqFunctionTable(self)
 
     @property
     def windll(self):
@@ -165,12 +336,55 @@ class DaqLibImporter(object):
             self._import_lib()
         return self._windll
 
+    @property
+    def function_table(self):
+        """
+        :class:`DaqFunctionTable`: Indicates the dispatch table of the
+            Art_DAQ read and write entry points. The table object stays
+            the same for the lifetime of the importer, so callers may
+            keep a reference to it.
+        """
+        return self._function_table
+
     # @property
     # def cdll(self):
     #     if self._cdll is None:
     #         self._import_lib()
     #     return self._cdll
 
+    def set_library(self, library):
+        """
+        Replaces the library through which the Art_DAQ entry points are
+        called.
+
+        Args:
+            library: Specifies the library to use. This can be a loaded
+                ctypes library or any object that exposes the ArtDAQ_*
+                entry points as attributes, such as
+                artdaq._simulated_lib.SimulatedLibrary.
+        """
+        self._windll = DaqFunctionImporter(library)
+        self._function_table.reset()
+
+    def use_simulated_library(self, **kwargs):
+        """
+        Routes every Art_DAQ call through a new pure-Python simulated
+        driver instead of the Art_DAQ DLL.
+
+        Args:
+            kwargs: Specifies the keyword arguments to pass to
+                artdaq._simulated_lib.SimulatedLibrary.
+        Returns:
+            artdaq._simulated_lib.SimulatedLibrary:
+
+            Indicates the simulated library now in use.
+        """
+        from artdaq._simulated_lib import SimulatedLibrary
+
+        library = SimulatedLibrary(**kwargs)
+        self.set_library(library)
+        return library
+
     @property
     def task_handle(self):
         if self._task_handle is None:
@@ -186,7 +400,14 @@ class DaqLibImporter(object):
     def _import_lib(self):
         """
         Determines the location of and loads the Art_DAQ CAI DLL.
+
+        If the ARTDAQ_SIMULATE environment variable is set to a non-empty
+        value other than "0", the simulated driver is loaded instead, on
+        any platform.
         """
+        if os.environ.get('ARTDAQ_SIMULATE', '0') not in ('', '0'):
+            self.use_simulated_library()
+            return
 
         if sys.platform.startswith('win') or sys.platform.startswith('cli'):
             lib_name = "Art_DAQ"
@@ -0,0 +1,1263 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import ctypes
+import math
+import threading
+import time
+
+import numpy
+import six
+
+from artdaq.constants import (
+    AcquisitionType, EveryNSamplesEventType, FillMode, OverwriteMode,
+    RegenerationMode, TaskControl)
+from artdaq.error_codes import Errors, Warnings
+from artdaq.utils import flatten_channel_string, unflatten_channel_string
+
+__all__ = ['SimulatedLibrary']
+
+
+# Task attribute IDs understood by ArtDAQ_GetTaskAttribute.
+_TASK_CHANNELS = 0x1273
+_TASK_NAME = 0x1276
+
+# Index of the min_val argument for channel creation functions whose
+# signature does not follow the (handle, channel, name, min, max) layout.
+_MIN_VAL_ARG_INDEX = {
+    'ArtDAQ_CreateAIVoltageChan': 4,
+    'ArtDAQ_CreateAIVoltageIEPEChan': 5,
+    'ArtDAQ_CreateAICurrentChan': 5,
+}
+
+_DEFAULT_MIN_VAL = -10.0
+_DEFAULT_MAX_VAL = 10.0
+_ON_DEMAND_RATE = 1000.0
+
+# Values returned by attribute getters when the attribute was never set.
+_ATTRIBUTE_DEFAULTS = {
+    'ReadAutoStart': True,
+    'ReadOverWrite': OverwriteMode.DO_NOT_OVERWRITE_UNREAD_SAMPLES.value,
+    'WriteRegenMode': RegenerationMode.ALLOW_REGENERATION.value,
+}
+
+# Attributes that live on the simulated channels rather than in the
+# generic attribute store.
+_CHANNEL_RANGE_ATTRIBUTES = {
+    'AIMax': 'max_val', 'AIMin': 'min_val',
+    'AOMax': 'max_val', 'AOMin': 'min_val',
+}
+
+
+def _deref(arg):
+    """
+    Returns the ctypes object wrapped by a ctypes.byref() argument.
+    """
+    return getattr(arg, '_obj', arg)
+
+
+def _to_text(arg):
+    arg = _deref(arg)
+    if arg is None:
+        return ''
+    if isinstance(arg, (ctypes.Array, ctypes.c_char_p)):
+        arg = arg.value
+    if isinstance(arg, six.binary_type):
+        return arg.decode('ascii')
+    return six.text_type(arg)
+
+
+def _handle_value(handle):
+    return getattr(_deref(handle), 'value', handle)
+
+
+def _set_out(ref, value):
+    if ref is not None:
+        _deref(ref).value = value
+
+
+def _copy_string(text, buffer, buffer_size):
+    """
+    Copies text into a caller-supplied string buffer with the same size
+    negotiation semantics as the Art_DAQ C API.
+    """
+    data = text.encode('ascii')
+    if buffer_size == 0 or buffer is None:
+        return len(data) + 1
+    if len(data) + 1 > buffer_size:
+        return Errors.BUFFER_TOO_SMALL_FOR_STRING.value
+    ctypes.memmove(buffer, data + b'\0', len(data) + 1)
+    return 0
+
+
+def _describe(code):
+    for enum_type in (Errors, Warnings):
+        try:
+            name = enum_type(code).name
+        except ValueError:
+            continue
+        return name.replace('_', ' ').capitalize() + '.'
+    return 'Unknown error.'
+
+
+class SimulatedFunction(object):
+    """
+    Stands in for a ctypes function pointer exported by the Art_DAQ
+    library.
+
+    Like a ctypes function pointer it carries settable argtypes and
+    restype attributes, so the rest of the package binds and calls it
+    exactly as it would the real entry point. The arguments are passed
+    through to the simulation unconverted.
+    """
+
+    def __init__(self, name, implementation):
+        self.__name__ = str(name)
+        self._implementation = implementation
+        self.argtypes = None
+        self.restype = ctypes.c_int
+
+    def __call__(self, *args):
+        return self._implementation(*args)
+
+    def __repr__(self):
+        return 'SimulatedFunction({0})'.format(self.__name__)
+
+
+class _SimulatedChannel(object):
+    __slots__ = ['name', 'physical_channel', 'kind', 'function', 'index',
+                 'min_val', 'max_val']
+
+    def __init__(self, name, physical_channel, kind, function, index,
+                 min_val, max_val):
+        self.name = name
+        self.physical_channel = physical_channel
+        self.kind = kind
+        self.function = function
+        self.index = index
+        self.min_val = min_val
+        self.max_val = max_val
+
+    @property
+    def code_width(self):
+        return (self.max_val - self.min_val) / 65536.0
+
+    @property
+    def offset(self):
+        return (self.max_val + self.min_val) / 2.0
+
+
+class _SimulatedTask(object):
+    """
+    Holds the state of one simulated task: its channels, timing, sample
+    clock, circular buffer and registered events.
+    """
+
+    def __init__(self, library, handle, name):
+        self._library = library
+        self.handle = handle
+        self.name = name
+        self.channels = []
+        self.attributes = {}
+        self.lock = threading.RLock()
+        self._cond = threading.Condition(self.lock)
+
+        self.rate = None
+        self.sample_mode = None
+        self.samps_per_chan = 0
+
+        self.running = False
+        self.committed = False
+        self._implicitly_started = False
+        self._error = 0
+        self._start_time = 0.0
+        self._frozen_count = 0
+        self._buffer = None
+        self._capacity = 0
+        self._read_pos = 0
+        self._gen_pos = 0
+        self._write_pos = 0
+        self._output = None
+
+        self.every_n_events = {}
+        self.done_event = None
+        self.signal_events = {}
+        self._event_thread = None
+        self._stop_event = threading.Event()
+
+    # ---------------------------------------------------------------------
+    # Configuration
+    # ---------------------------------------------------------------------
+    def attribute(self, name, channel=''):
+        return self.attributes.get(
+            (name, channel), _ATTRIBUTE_DEFAULTS.get(name, 0))
+
+    @property
+    def is_output(self):
+        return bool(self.channels) and self.channels[0].kind in (
+            'AO', 'DO', 'CO')
+
+    @property
+    def is_buffered(self):
+        return self.rate is not None
+
+    @property
+    def total(self):
+        """
+        Returns the number of samples per channel in a finite task, or None
+        for continuous and on-demand tasks.
+        """
+        if self.sample_mode == AcquisitionType.FINITE.value:
+            return self.samps_per_chan
+        return None
+
+    def find_channels(self, channel_string):
+        names = unflatten_channel_string(channel_string)
+        return [c for c in self.channels
+                if c.name in names or c.physical_channel in names]
+
+    def _default_capacity(self):
+        if self.total is not None:
+            return max(self.total, 1)
+        # Mirrors the automatic input buffer sizing of the driver.
+        if self.rate <= 100:
+            minimum = 1000
+        elif self.rate <= 10000:
+            minimum = 10000
+        elif self.rate <= 1000000:
+            minimum = 100000
+        else:
+            minimum = 1000000
+        return max(self.samps_per_chan, minimum)
+
+    # ---------------------------------------------------------------------
+    # State transitions
+    # ---------------------------------------------------------------------
+    def start(self, implicit=False):
+        if not self.channels:
+            return Errors.CAN_NOT_PERFORM_OP_WHEN_NO_CHANS_IN_TASK.value
+        with self.lock:
+            if self.running:
+                return 0
+            if not self.committed and self._library.commit_latency:
+                time.sleep(self._library.commit_latency)
+            self.running = True
+            self._implicitly_started = implicit
+            self._error = 0
+            self._read_pos = 0
+            self._gen_pos = 0
+            self._frozen_count = 0
+            if self.is_buffered:
+                if self.is_output and self._output is not None:
+                    # Samples written before the start already sized the
+                    # output buffer.
+                    self._capacity = self._output.shape[1]
+                else:
+                    self._capacity = self._default_capacity()
+                if not self.is_output:
+                    self._buffer = numpy.zeros(
+                        (len(self.channels), self._capacity),
+                        dtype=numpy.float64)
+            self._start_time = time.perf_counter()
+            self._start_events()
+        return 0
+
+    def stop(self):
+        with self.lock:
+            if not self.running:
+                return 0
+            self._frozen_count = self._clock_count()
+            self.running = False
+            self._implicitly_started = False
+            if not self.committed:
+                self._write_pos = 0
+                self._output = None
+            self._cond.notify_all()
+            thread = self._event_thread
+            self._event_thread = None
+        self._stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return 0
+
+    def control(self, action):
+        if action == TaskControl.TASK_START.value:
+            return self.start()
+        if action in (TaskControl.TASK_STOP.value,
+                      TaskControl.TASK_ABORT.value):
+            return self.stop()
+        if action == TaskControl.TASK_COMMIT.value:
+            if not self.committed and self._library.commit_latency:
+                time.sleep(self._library.commit_latency)
+            self.committed = True
+        elif action == TaskControl.TASK_UNRESERVE.value:
+            self.committed = False
+        return 0
+
+    def is_done(self):
+        with self.lock:
+            if self._error:
+                return True
+            if not self.running:
+                return True
+            total = self.total
+            if total is None:
+                return False
+            if self.is_output:
+                return self._transferred() >= total
+            return self._clock_count() >= total
+
+    def wait_until_done(self, timeout):
+        deadline = None if timeout < 0 else time.perf_counter() + timeout
+        while not self.is_done():
+            remaining = self._remaining(deadline)
+            if remaining == 0.0:
+                return Errors.WAIT_UNTIL_DONE_DOES_NOT_INDICATE_DONE.value
+            time.sleep(min(remaining, 0.001))
+        return self._error
+
+    # ---------------------------------------------------------------------
+    # Sample clock
+    # ---------------------------------------------------------------------
+    def _clock_count(self, requested=0):
+        """
+        Returns the number of samples per channel the simulated device has
+        clocked since the task started.
+        """
+        if not self.running:
+            return self._frozen_count
+        if not self.is_buffered:
+            return self._write_pos if self.is_output else self._read_pos
+        time_scale = self._library.time_scale
+        if time_scale is None:
+            # Free-running: the device stays one buffer ahead of the reader
+            # and never overruns it.
+            if self.is_output:
+                count = self._write_pos
+            else:
+                count = self._read_pos + max(self._capacity, requested)
+        else:
+            count = int((time.perf_counter() - self._start_time) *
+                        self.rate * time_scale)
+        total = self.total
+        if total is not None:
+            count = min(count, total)
+        return count
+
+    def _seconds_until(self, count):
+        time_scale = self._library.time_scale
+        if time_scale is None or not self.running:
+            return 0.001
+        target = self._start_time + count / (self.rate * time_scale)
+        return max(target - time.perf_counter(), 0.0)
+
+    @staticmethod
+    def _remaining(deadline):
+        if deadline is None:
+            return 0.05
+        return max(deadline - time.perf_counter(), 0.0)
+
+    # ---------------------------------------------------------------------
+    # Acquisition
+    # ---------------------------------------------------------------------
+    def _waveform(self, first, count, channels=None):
+        """
+        Returns the deterministic samples [first, first + count) of the
+        given channels as a 2D float64 array.
+        """
+        if channels is None:
+            channels = self.channels
+        index = numpy.arange(first, first + count, dtype=numpy.float64)
+        rate = self.rate or _ON_DEMAND_RATE
+        block = numpy.empty((len(channels), count), dtype=numpy.float64)
+        for row, channel in enumerate(channels):
+            k = channel.index
+            if channel.kind == 'AI':
+                frequency = self._library.base_frequency * (k + 1)
+                amplitude = 0.45 * (channel.max_val - channel.min_val)
+                numpy.sin(index * (2 * math.pi * frequency / rate),
+                          out=block[row])
+                block[row] *= amplitude
+                block[row] += channel.offset
+            elif channel.kind == 'DI':
+                block[row] = numpy.mod(index * (k + 1), 256)
+            elif channel.function == 'ArtDAQ_CreateCICountEdgesChan':
+                block[row] = index
+            else:
+                block[row] = self._pulse_frequency(index, k)
+        return block
+
+    @staticmethod
+    def _pulse_frequency(index, k):
+        return 1000.0 * (k + 1) * (
+            1.0 + 0.01 * numpy.sin(index * (2 * math.pi / 100.0)))
+
+    def _produce(self, upto):
+        """
+        Clocks samples into the circular buffer up to sample number upto.
+        """
+        capacity = self._capacity
+        first = max(self._gen_pos, upto - capacity)
+        if upto <= first:
+            return
+        count = upto - first
+        position = first % capacity
+        head = min(count, capacity - position)
+        self._buffer[:, position:position + head] = self._waveform(
+            first, head)
+        if count > head:
+            self._buffer[:, :count - head] = self._waveform(
+                first + head, count - head)
+        self._gen_pos = upto
+
+    def _buffered_block(self, first, count):
+        capacity = self._capacity
+        if count > capacity or first < self._gen_pos - capacity:
+            return self._waveform(first, count)
+        position = first % capacity
+        head = min(count, capacity - position)
+        if head == count:
+            return self._buffer[:, position:position + count].copy()
+        return numpy.concatenate(
+            (self._buffer[:, position:], self._buffer[:, :count - head]),
+            axis=1)
+
+    def _channels_to_read(self):
+        selection = self.attribute('ReadChannelsToRead')
+        if not selection:
+            return None
+        return [self.channels.index(c) for c in self.find_channels(selection)]
+
+    def read(self, requested, timeout):
+        """
+        Takes samples out of the circular buffer, waiting for the sample
+        clock if necessary.
+
+        Returns:
+            Tuple[int, int, numpy.ndarray, List[_SimulatedChannel]]: The
+            status code, the sample number of the first sample read, the
+            samples read with one row per channel and the channels read.
+        """
+        with self.lock:
+            if not self.channels:
+                return (Errors.CAN_NOT_PERFORM_OP_WHEN_NO_CHANS_IN_TASK.value,
+                        0, None, None)
+            if not self.running:
+                self.start(implicit=True)
+            if self._error:
+                return self._error, 0, None, None
+            rows = self._channels_to_read()
+            channels = self.channels if rows is None else [
+                self.channels[r] for r in rows]
+            if not self.is_buffered:
+                requested = max(requested, 1)
+                first = self._read_pos
+                self._read_pos += requested
+                block = self._waveform(first, requested, channels)
+                if self._implicitly_started:
+                    self.stop()
+                return 0, first, block, channels
+
+        deadline = None if timeout < 0 else time.perf_counter() + timeout
+        free_running = self._library.time_scale is None
+        while True:
+            with self.lock:
+                if self._error:
+                    return self._error, 0, None, None
+                acquired = self._clock_count(max(requested, 0))
+                self._produce(acquired)
+                unread = acquired - self._read_pos
+                if unread > self._capacity and not free_running:
+                    if (self.attribute('ReadOverWrite') ==
+                            OverwriteMode.OVERWRITE_UNREAD_SAMPLES.value):
+                        self._read_pos = acquired - self._capacity
+                        unread = self._capacity
+                    else:
+                        self._error = (
+                            Errors.SAMPLES_NO_LONGER_AVAILABLE.value)
+                        return self._error, 0, None, None
+
+                total = self.total
+                wanted = requested
+                if wanted < 0:
+                    wanted = unread if total is None else (
+                        total - self._read_pos)
+                if total is not None and self._read_pos + wanted > total:
+                    return (Errors.SAMPLES_WILL_NEVER_BE_AVAILABLE.value,
+                            0, None, None)
+
+                status = 0
+                if unread < wanted:
+                    remaining = self._remaining(deadline)
+                    if remaining == 0.0 or not self.running:
+                        status = Errors.SAMPLES_NOT_YET_AVALIABLE.value
+                        wanted = unread
+                    else:
+                        delay = min(
+                            self._seconds_until(
+                                self._read_pos + wanted), remaining)
+                        self._cond.wait(max(delay, 0.0001))
+                        continue
+
+                first = self._read_pos
+                block = self._buffered_block(first, wanted)
+                self._read_pos += wanted
+                if rows is not None:
+                    block = block[rows]
+                finished = (total is not None and self._read_pos >= total and
+                            self._implicitly_started)
+                self._cond.notify_all()
+                break
+
+        if finished:
+            self.stop()
+        return status, first, block, channels
+
+    # ---------------------------------------------------------------------
+    # Generation
+    # ---------------------------------------------------------------------
+    def _transferred(self):
+        count = self._clock_count()
+        if (self.attribute('WriteRegenMode') ==
+                RegenerationMode.DONT_ALLOW_REGENERATION.value and
+                count > self._write_pos):
+            if self.total is None or self._write_pos < self.total:
+                self._error = (
+                    Errors.GEN_STOPPED_TO_PREVENT_REGEN_OF_OLD_SAMPLES.value)
+            count = self._write_pos
+        return count
+
+    def write(self, block, auto_start, timeout):
+        """
+        Copies samples into the output buffer, waiting for space if the
+        buffer is full.
+
+        Returns:
+            Tuple[int, int]: The status code and the number of samples per
+            channel written.
+        """
+        with self.lock:
+            if not self.channels:
+                return (Errors.CAN_NOT_PERFORM_OP_WHEN_NO_CHANS_IN_TASK.value,
+                        0)
+            if self._error:
+                return self._error, 0
+            count = block.shape[1]
+            if not self.is_buffered:
+                self._output = block[:, -1:].copy()
+                self._write_pos += count
+                if not self.running and auto_start:
+                    self.start(implicit=True)
+                return 0, count
+            if self._output is None:
+                self._capacity = self.samps_per_chan or count
+                self._output = numpy.zeros(
+                    (block.shape[0], self._capacity), dtype=block.dtype)
+
+        deadline = None if timeout < 0 else time.perf_counter() + timeout
+        written = 0
+        while written < count:
+            with self.lock:
+                if self._error:
+                    return self._error, written
+                space = min(self._capacity - (
+                    self._write_pos - self._transferred()), self._capacity)
+                if space <= 0:
+                    if not self.running:
+                        return Errors.NO_MORE_SPACE.value, written
+                    remaining = self._remaining(deadline)
+                    if remaining == 0.0:
+                        return (Errors.SAMPLES_CAN_NOT_YET_BE_WRITTEN.value,
+                                written)
+                    self._cond.wait(min(
+                        self._seconds_until(
+                            self._write_pos - self._capacity + 1),
+                        remaining) or 0.0001)
+                    continue
+                chunk = min(space, count - written)
+                position = self._write_pos % self._capacity
+                head = min(chunk, self._capacity - position)
+                self._output[:, position:position + head] = (
+                    block[:, written:written + head])
+                if chunk > head:
+                    self._output[:, :chunk - head] = (
+                        block[:, written + head:written + chunk])
+                self._write_pos += chunk
+                written += chunk
+                self._cond.notify_all()
+
+        with self.lock:
+            if not self.running and auto_start:
+                self.start(implicit=True)
+        return 0, written
+
+    @property
+    def output_buffer(self):
+        """
+        numpy.ndarray: The contents of the simulated output buffer, one
+        row per channel (two rows per channel for counter outputs).
+        """
+        return self._output
+
+    # ---------------------------------------------------------------------
+    # Events
+    # ---------------------------------------------------------------------
+    def _start_events(self):
+        if not (self.every_n_events or self.done_event) or (
+                not self.is_buffered):
+            return
+        self._stop_event = threading.Event()
+        self._event_thread = threading.Thread(
+            target=self._event_loop, args=(self._stop_event,),
+            name='ArtDAQ simulated events {0}'.format(self.handle))
+        self._event_thread.daemon = True
+        self._event_thread.start()
+
+    def _event_loop(self, stop_event):
+        next_event = dict(
+            (event_type, n) for event_type, (n, _) in
+            self.every_n_events.items())
+        while not stop_event.is_set():
+            due = []
+            done = False
+            with self.lock:
+                if not self.running:
+                    return
+                for event_type, (n, callback) in self.every_n_events.items():
+                    if event_type == (
+                            EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value):
+                        count = self._clock_count()
+                    else:
+                        count = self._transferred()
+                    while next_event[event_type] <= count:
+                        due.append((callback, event_type, n))
+                        next_event[event_type] += n
+                done = self.total is not None and self.is_done()
+                status = self._error
+                if not due and not done:
+                    delay = min(
+                        [self._seconds_until(c) for c in next_event.values()]
+                        or [0.05])
+                    self._cond.wait(min(max(delay, 0.0005), 0.05))
+                    continue
+
+            for callback, event_type, n in due:
+                if stop_event.is_set():
+                    return
+                callback(self.handle, event_type, n, None)
+
+            if done:
+                with self.lock:
+                    self._frozen_count = self._clock_count()
+                    self.running = False
+                    self._event_thread = None
+                if self.done_event is not None:
+                    self.done_event(self.handle, status, None)
+                return
+
+
+class SimulatedLibrary(object):
+    """
+    Pure-Python implementation of the Art_DAQ driver entry points.
+
+    Tasks created through this library are backed by simulated devices
+    that clock deterministic waveforms into a circular buffer at the
+    configured sample rate. Analog input channels produce sine waves
+    spanning 90% of the channel range, digital input channels produce
+    counting patterns and counter input channels produce edge counts or
+    slowly modulated pulse trains.
+
+    Select it with ``lib_importer.use_simulated_library()`` or by setting
+    the ``ARTDAQ_SIMULATE`` environment variable before the library is
+    first loaded.
+    """
+
+    def __init__(self, time_scale=1.0, base_frequency=10.0,
+                 commit_latency=0.0):
+        """
+        Args:
+            time_scale (Optional[float]): Specifies how fast the simulated
+                sample clocks run relative to the wall clock. Pass None to
+                let the devices run free, in which case every read is
+                satisfied immediately and the buffer never overflows.
+            base_frequency (Optional[float]): Specifies the frequency in
+                Hz of the sine wave on the first analog input channel of
+                a task. Channel k produces (k + 1) times this frequency.
+            commit_latency (Optional[float]): Specifies the time in
+                seconds it takes to commit a task, which is paid on every
+                start of a task that was not committed beforehand.
+        """
+        self.time_scale = time_scale
+        self.base_frequency = base_frequency
+        self.commit_latency = commit_latency
+
+        self._tasks = {}
+        self._task_names = {}
+        self._next_handle = 1
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._functions = {}
+        self._entry_points = self._build_entry_points()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        function = self._functions.get(name)
+        if function is None:
+            function = self._functions.setdefault(
+                name, SimulatedFunction(name, self._resolve(name)))
+        return function
+
+    def __getitem__(self, name):
+        try:
+            return SimulatedFunction(name, self._resolve(name))
+        except AttributeError:
+            raise KeyError(name)
+
+    def task(self, handle):
+        """
+        Returns the simulated state of the task with the given handle.
+
+        Args:
+            handle: Specifies the task handle, either as returned by
+                ArtDAQ_CreateTask or as the ``_handle`` of a Task.
+        """
+        return self._tasks[_handle_value(handle)]
+
+    # ---------------------------------------------------------------------
+    # Entry point resolution
+    # ---------------------------------------------------------------------
+    def _build_entry_points(self):
+        entry_points = {
+            'ArtDAQ_CreateTask': self._create_task,
+            'ArtDAQ_ClearTask': self._clear_task,
+            'ArtDAQ_StartTask': self._task_call('start'),
+            'ArtDAQ_StopTask': self._task_call('stop'),
+            'ArtDAQ_TaskControl': self._task_control,
+            'ArtDAQ_IsTaskDone': self._is_task_done,
+            'ArtDAQ_WaitUntilTaskDone': self._wait_until_task_done,
+            'ArtDAQ_GetTaskAttribute': self._get_task_attribute,
+            'ArtDAQ_CfgSampClkTiming': self._cfg_samp_clk_timing,
+            'ArtDAQ_CfgImplicitTiming': self._cfg_implicit_timing,
+            'ArtDAQ_RegisterEveryNSamplesEvent': (
+                self._register_every_n_samples_event),
+            'ArtDAQ_RegisterDoneEvent': self._register_done_event,
+            'ArtDAQ_RegisterSignalEvent': self._register_signal_event,
+            'ArtDAQ_GetErrorString': self._get_error_string,
+            'ArtDAQ_GetExtendedErrorInfo': self._get_extended_error_info,
+            'ArtDAQ_GetAICalOffsetAndGain': self._get_cal_offset_and_gain,
+            'ArtDAQ_GetAOCalOffsetAndGain': self._get_cal_offset_and_gain,
+
+            'ArtDAQ_ReadAnalogF64': self._reader(numpy.float64),
+            'ArtDAQ_ReadBinaryI16': self._reader(numpy.int16, raw=True),
+            'ArtDAQ_ReadBinaryU16': self._reader(numpy.uint16, raw=True),
+            'ArtDAQ_ReadBinaryI32': self._reader(numpy.int32, raw=True),
+            'ArtDAQ_ReadBinaryU32': self._reader(numpy.uint32, raw=True),
+            'ArtDAQ_ReadDigitalU8': self._reader(numpy.uint8),
+            'ArtDAQ_ReadDigitalU16': self._reader(numpy.uint16),
+            'ArtDAQ_ReadDigitalU32': self._reader(numpy.uint32),
+            'ArtDAQ_ReadDigitalLines': self._read_digital_lines,
+            'ArtDAQ_ReadCounterF64': self._reader(
+                numpy.float64, fill_mode=False),
+            'ArtDAQ_ReadCounterU32': self._reader(
+                numpy.uint32, fill_mode=False),
+            'ArtDAQ_ReadCtrFreq': self._pulse_reader('freq'),
+            'ArtDAQ_ReadCtrTime': self._pulse_reader('time'),
+            'ArtDAQ_ReadCtrTicks': self._pulse_reader('ticks'),
+            'ArtDAQ_ReadAnalogScalarF64': self._scalar_reader(float),
+            'ArtDAQ_ReadDigitalScalarU32': self._scalar_reader(int),
+            'ArtDAQ_ReadCounterScalarF64': self._scalar_reader(float),
+            'ArtDAQ_ReadCounterScalarU32': self._scalar_reader(int),
+            'ArtDAQ_ReadCtrFreqScalar': self._pulse_scalar_reader('freq'),
+            'ArtDAQ_ReadCtrTimeScalar': self._pulse_scalar_reader('time'),
+            'ArtDAQ_ReadCtrTicksScalar': self._pulse_scalar_reader('ticks'),
+
+            'ArtDAQ_WriteAnalogF64': self._writer(),
+            'ArtDAQ_WriteBinaryI16': self._writer(),
+            'ArtDAQ_WriteBinaryU16': self._writer(),
+            'ArtDAQ_WriteDigitalU8': self._writer(),
+            'ArtDAQ_WriteDigitalU16': self._writer(),
+            'ArtDAQ_WriteDigitalU32': self._writer(),
+            'ArtDAQ_WriteDigitalLines': self._writer(),
+            'ArtDAQ_WriteRaw': self._write_raw,
+            'ArtDAQ_WriteCtrFreq': self._pulse_writer,
+            'ArtDAQ_WriteCtrTime': self._pulse_writer,
+            'ArtDAQ_WriteCtrTicks': self._pulse_writer,
+            'ArtDAQ_WriteAnalogScalarF64': self._scalar_writer(1),
+            'ArtDAQ_WriteDigitalScalarU32': self._scalar_writer(1),
+            'ArtDAQ_WriteCtrFreqScalar': self._scalar_writer(2),
+            'ArtDAQ_WriteCtrTimeScalar': self._scalar_writer(2),
+            'ArtDAQ_WriteCtrTicksScalar': self._scalar_writer(2),
+        }
+        return entry_points
+
+    def _resolve(self, name):
+        implementation = self._entry_points.get(name)
+        if implementation is not None:
+            return implementation
+        if not name.startswith('ArtDAQ_'):
+            raise AttributeError(name)
+        function = name[len('ArtDAQ_'):]
+        if function.startswith('Create') and 'Chan' in function:
+            return self._channel_creator(name)
+        for prefix in ('Get', 'Set', 'Reset'):
+            if function.startswith(prefix):
+                return self._attribute_accessor(
+                    prefix, function[len(prefix):])
+        if function.startswith(
+                ('Cfg', 'Disable', 'Export', 'Perform', 'SelfCal')):
+            return self._recorder(function)
+        raise AttributeError(name)
+
+    def _fail(self, code, message=''):
+        self._local.last_error = message or _describe(code)
+        return code
+
+    def _lookup(self, handle):
+        task = self._tasks.get(_handle_value(handle))
+        if task is None:
+            self._fail(Errors.INVALID_TASK.value,
+                       'Task specified is invalid or does not exist.')
+        return task
+
+    # ---------------------------------------------------------------------
+    # Task management
+    # ---------------------------------------------------------------------
+    def _create_task(self, name, handle_ref):
+        name = _to_text(name)
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            if not name:
+                name = '_unnamedTask<{0:X}>'.format(handle - 1)
+            if name in self._task_names:
+                return self._fail(Errors.DUPLICATE_TASK.value)
+            self._tasks[handle] = _SimulatedTask(self, handle, name)
+            self._task_names[name] = handle
+        _set_out(handle_ref, handle)
+        return 0
+
+    def _clear_task(self, handle):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        task.stop()
+        with self._lock:
+            del self._tasks[task.handle]
+            del self._task_names[task.name]
+        return 0
+
+    def _task_call(self, method):
+        def call(handle):
+            task = self._lookup(handle)
+            if task is None:
+                return Errors.INVALID_TASK.value
+            return self._status(getattr(task, method)())
+        return call
+
+    def _status(self, code):
+        if code < 0:
+            self._fail(code)
+        return code
+
+    def _task_control(self, handle, action):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        return self._status(task.control(int(action)))
+
+    def _is_task_done(self, handle, done_ref):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        _set_out(done_ref, task.is_done())
+        return self._status(task._error)
+
+    def _wait_until_task_done(self, handle, timeout):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        return self._status(task.wait_until_done(timeout))
+
+    def _get_task_attribute(self, handle, attribute, buffer, buffer_size):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        if attribute == _TASK_CHANNELS:
+            value = flatten_channel_string([c.name for c in task.channels])
+        elif attribute == _TASK_NAME:
+            value = task.name
+        else:
+            return self._fail(Errors.INVALID_ATTRIBUTE_VALUE.value)
+        return self._status(_copy_string(value, buffer, buffer_size))
+
+    def _cfg_samp_clk_timing(self, handle, source, rate, active_edge,
+                             sample_mode, samps_per_chan):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        if rate <= 0:
+            return self._fail(Errors.INVALID_ATTRIBUTE_VALUE.value)
+        with task.lock:
+            task.rate = float(rate)
+            task.sample_mode = int(sample_mode)
+            task.samps_per_chan = int(samps_per_chan)
+            task.attributes[('SampClkSrc', '')] = _to_text(source)
+        return 0
+
+    def _cfg_implicit_timing(self, handle, sample_mode, samps_per_chan):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        with task.lock:
+            task.rate = _ON_DEMAND_RATE
+            task.sample_mode = int(sample_mode)
+            task.samps_per_chan = int(samps_per_chan)
+        return 0
+
+    def _channel_creator(self, function_name):
+        kind = function_name[len('ArtDAQ_Create'):][:2]
+        min_index = _MIN_VAL_ARG_INDEX.get(function_name, 3)
+
+        def create(handle, physical_channel, name_to_assign, *args):
+            task = self._lookup(handle)
+            if task is None:
+                return Errors.INVALID_TASK.value
+            physical_channels = unflatten_channel_string(
+                _to_text(physical_channel))
+            if not physical_channels:
+                return self._fail(Errors.INVALID_PHYS_CHANNEL_STRING.value)
+            names = unflatten_channel_string(_to_text(name_to_assign))
+            if len(names) == 1 and len(physical_channels) > 1:
+                names = unflatten_channel_string(
+                    '{0}0:{1}'.format(names[0], len(physical_channels) - 1))
+            elif len(names) != len(physical_channels):
+                names = physical_channels
+
+            min_val, max_val = _DEFAULT_MIN_VAL, _DEFAULT_MAX_VAL
+            if kind in ('AI', 'AO') and len(args) > min_index - 2:
+                min_val = float(_deref(args[min_index - 3]))
+                max_val = float(_deref(args[min_index - 2]))
+
+            with task.lock:
+                if task.running:
+                    return self._fail(
+                        Errors.ATTRIBUTE_NOT_SUPPORTED_IN_TASK_CONTEXT.value)
+                for name, physical in zip(names, physical_channels):
+                    task.channels.append(_SimulatedChannel(
+                        name, physical, kind, function_name,
+                        len(task.channels), min_val, max_val))
+            return 0
+        return create
+
+    def _recorder(self, function):
+        def record(handle, *args):
+            task = self._lookup(handle)
+            if task is None:
+                return Errors.INVALID_TASK.value
+            task.attributes[(function, '')] = tuple(
+                _to_text(a) if isinstance(a, (six.string_types,
+                                              six.binary_type)) else a
+                for a in args)
+            return 0
+        return record
+
+    def _attribute_accessor(self, prefix, attribute):
+        channel_attribute = _CHANNEL_RANGE_ATTRIBUTES.get(attribute)
+
+        def access(handle, *args):
+            task = self._lookup(handle)
+            if task is None:
+                return Errors.INVALID_TASK.value
+
+            string_buffer = (
+                len(args) >= 2 and isinstance(args[-2], ctypes.Array) and
+                isinstance(args[-1], six.integer_types))
+            value_args = 2 if string_buffer else 1
+            if prefix == 'Reset':
+                value_args = 0
+            channel = _to_text(args[0]) if len(args) > value_args else ''
+
+            with task.lock:
+                if channel_attribute is not None and channel:
+                    channels = task.find_channels(channel)
+                    if not channels:
+                        return self._fail(
+                            Errors.INVALID_PHYS_CHANNEL_STRING.value)
+                    if prefix == 'Get':
+                        _set_out(args[-1], getattr(
+                            channels[0], channel_attribute))
+                    elif prefix == 'Set':
+                        for c in channels:
+                            setattr(c, channel_attribute,
+                                    float(_deref(args[-1])))
+                    else:
+                        for c in channels:
+                            setattr(c, channel_attribute, (
+                                _DEFAULT_MAX_VAL if channel_attribute ==
+                                'max_val' else _DEFAULT_MIN_VAL))
+                    return 0
+
+                # The driver applies channel properties to each channel
+                # of a list or range.
+                names = unflatten_channel_string(channel) if channel else ['']
+                if prefix == 'Get':
+                    value = task.attribute(attribute, names[0])
+                    if string_buffer:
+                        return self._status(_copy_string(
+                            six.text_type(value or ''), args[-2], args[-1]))
+                    _set_out(args[-1], value)
+                elif prefix == 'Set':
+                    value = _deref(args[-1])
+                    value = getattr(value, 'value', value)
+                    if isinstance(value, six.binary_type):
+                        value = value.decode('ascii')
+                    for name in names:
+                        task.attributes[(attribute, name)] = value
+                else:
+                    for name in names:
+                        task.attributes.pop((attribute, name), None)
+            return 0
+        return access
+
+    # ---------------------------------------------------------------------
+    # Events
+    # ---------------------------------------------------------------------
+    def _register_every_n_samples_event(self, handle, event_type, n_samples,
+                                        options, callback, callback_data):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        with task.lock:
+            if callback is None:
+                task.every_n_events.pop(int(event_type), None)
+            else:
+                task.every_n_events[int(event_type)] = (
+                    int(n_samples), callback)
+        return 0
+
+    def _register_done_event(self, handle, options, callback, callback_data):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        task.done_event = callback
+        return 0
+
+    def _register_signal_event(self, handle, signal_id, options, callback,
+                               callback_data):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        if callback is None:
+            task.signal_events.pop(int(signal_id), None)
+        else:
+            task.signal_events[int(signal_id)] = callback
+        return 0
+
+    # ---------------------------------------------------------------------
+    # Errors and calibration
+    # ---------------------------------------------------------------------
+    def _get_error_string(self, error_code, buffer, buffer_size):
+        text = _describe(error_code)
+        if buffer_size and len(text) + 1 > buffer_size:
+            text = text[:buffer_size - 1]
+        return _copy_string(text, buffer, buffer_size)
+
+    def _get_extended_error_info(self, buffer, buffer_size):
+        text = getattr(self._local, 'last_error', '')
+        if buffer_size and len(text) + 1 > buffer_size:
+            text = text[:buffer_size - 1]
+        return _copy_string(text, buffer, buffer_size)
+
+    def _get_cal_offset_and_gain(self, device_name, channel, min_val,
+                                 max_val, sample_clock, offset_ref,
+                                 code_width_ref):
+        min_val = float(_deref(min_val))
+        max_val = float(_deref(max_val))
+        _set_out(offset_ref, (max_val + min_val) / 2.0)
+        _set_out(code_width_ref, (max_val - min_val) / 65536.0)
+        return 0
+
+    # ---------------------------------------------------------------------
+    # Reading
+    # ---------------------------------------------------------------------
+    def _read(self, handle, num_samps_per_chan, timeout):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value, None, None, 0
+        status, first, block, channels = task.read(
+            int(num_samps_per_chan), timeout)
+        if block is None:
+            return self._status(status), None, None, 0
+        return status, channels, block, first
+
+    @staticmethod
+    def _to_raw(channels, block, dtype):
+        raw = numpy.empty(block.shape, dtype=numpy.float64)
+        for row, channel in enumerate(channels):
+            numpy.divide(block[row] - channel.offset, channel.code_width,
+                         out=raw[row])
+        info = numpy.iinfo(dtype)
+        if info.min == 0:
+            raw += 2 ** (info.bits - 1)
+        return numpy.clip(numpy.rint(raw), info.min, info.max)
+
+    def _fill(self, array, array_size, block, fill_mode, stride):
+        rows, count = block.shape
+        if array_size < rows * stride or array.size < rows * stride:
+            return self._fail(Errors.READ_BUFFER_TOO_SMALL.value)
+        flat = array.reshape(-1)
+        if fill_mode == FillMode.GROUP_BY_SCAN_NUMBER.value:
+            flat[:rows * count].reshape(count, rows)[:] = block.T
+        else:
+            flat[:rows * stride].reshape(rows, stride)[:, :count] = block
+        return 0
+
+    def _reader(self, dtype, raw=False, fill_mode=True):
+        def read(handle, num_samps_per_chan, timeout, *args):
+            if fill_mode:
+                mode, array, array_size, read_ref, _ = args
+            else:
+                array, array_size, read_ref, _ = args
+                mode = FillMode.GROUP_BY_CHANNEL.value
+            status, channels, block, _ = self._read(
+                handle, num_samps_per_chan, timeout)
+            if block is None:
+                return status
+            if raw:
+                block = self._to_raw(channels, block, dtype)
+            stride = max(int(num_samps_per_chan), block.shape[1])
+            fill_status = self._fill(array, array_size, block, mode, stride)
+            if fill_status:
+                return fill_status
+            _set_out(read_ref, block.shape[1])
+            return self._status(status)
+        return read
+
+    def _read_digital_lines(self, handle, num_samps_per_chan, timeout,
+                            fill_mode, array, array_size, read_ref,
+                            bytes_per_samp_ref, reserved):
+        status, channels, block, _ = self._read(
+            handle, num_samps_per_chan, timeout)
+        if block is None:
+            return status
+        block = numpy.mod(block, 2) != 0
+        stride = max(int(num_samps_per_chan), block.shape[1])
+        fill_status = self._fill(array, array_size, block, fill_mode, stride)
+        if fill_status:
+            return fill_status
+        _set_out(read_ref, block.shape[1])
+        _set_out(bytes_per_samp_ref, 1)
+        return self._status(status)
+
+    @staticmethod
+    def _pulse_pair(channels, first, count, kind):
+        first_values = []
+        second_values = []
+        index = numpy.arange(first, first + count, dtype=numpy.float64)
+        for channel in channels:
+            frequency = _SimulatedTask._pulse_frequency(index, channel.index)
+            if kind == 'freq':
+                first_values.append(frequency)
+                second_values.append(numpy.full(count, 0.5))
+            elif kind == 'time':
+                first_values.append(0.5 / frequency)
+                second_values.append(0.5 / frequency)
+            else:
+                ticks = numpy.rint(50e6 / frequency)
+                first_values.append(ticks)
+                second_values.append(ticks)
+        return numpy.array(first_values), numpy.array(second_values)
+
+    def _pulse_reader(self, kind):
+        def read(handle, num_samps_per_chan, timeout, first_array,
+                 second_array, array_size, read_ref, reserved):
+            status, channels, block, first = self._read(
+                handle, num_samps_per_chan, timeout)
+            if block is None:
+                return status
+            count = block.shape[1]
+            stride = max(int(num_samps_per_chan), count)
+            for array, values in zip(
+                    (first_array, second_array),
+                    self._pulse_pair(channels, first, count, kind)):
+                fill_status = self._fill(
+                    array, array_size, values,
+                    FillMode.GROUP_BY_CHANNEL.value, stride)
+                if fill_status:
+                    return fill_status
+            _set_out(read_ref, count)
+            return self._status(status)
+        return read
+
+    def _scalar_reader(self, convert):
+        def read(handle, timeout, value_ref, reserved):
+            status, channels, block, _ = self._read(handle, 1, timeout)
+            if block is None:
+                return status
+            _set_out(value_ref, convert(block[0, 0]))
+            return self._status(status)
+        return read
+
+    def _pulse_scalar_reader(self, kind):
+        def read(handle, timeout, first_ref, second_ref, reserved):
+            status, channels, block, first = self._read(handle, 1, timeout)
+            if block is None:
+                return status
+            first_values, second_values = self._pulse_pair(
+                channels, first, 1, kind)
+            _set_out(first_ref, float(first_values[0, 0]))
+            _set_out(second_ref, float(second_values[0, 0]))
+            return self._status(status)
+        return read
+
+    # ---------------------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------------------
+    def _write(self, handle, block, auto_start, timeout, written_ref):
+        task = self._lookup(handle)
+        if task is None:
+            return Errors.INVALID_TASK.value
+        status, written = task.write(block, bool(auto_start), timeout)
+        _set_out(written_ref, written)
+        return self._status(status)
+
+    def _writer(self):
+        def write(handle, num_samps_per_chan, auto_start, timeout,
+                  data_layout, array, written_ref, reserved):
+            count = int(num_samps_per_chan)
+            if data_layout == FillMode.GROUP_BY_SCAN_NUMBER.value:
+                block = array.reshape(-1)[:array.size // count * count]
+                block = block.reshape(count, -1).T
+            else:
+                block = array.reshape(-1, count) if count else (
+                    array.reshape(-1, 1)[:, :0])
+            return self._write(handle, block, auto_start, timeout,
+                               written_ref)
+        return write
+
+    def _write_raw(self, handle, num_samps, auto_start, timeout, array,
+                   written_ref, reserved):
+        count = int(num_samps)
+        block = array.reshape(-1)[:array.size // count * count]
+        return self._write(handle, block.reshape(count, -1).T, auto_start,
+                           timeout, written_ref)
+
+    def _pulse_writer(self, handle, num_samps_per_chan, auto_start, timeout,
+                      first_array, second_array, written_ref, reserved):
+        count = int(num_samps_per_chan)
+        block = numpy.concatenate((
+            numpy.asarray(first_array, dtype=numpy.float64).reshape(
+                -1, count),
+            numpy.asarray(second_array, dtype=numpy.float64).reshape(
+                -1, count)))
+        return self._write(handle, block, auto_start, timeout, written_ref)
+
+    def _scalar_writer(self, num_values):
+        def write(handle, auto_start, timeout, *args):
+            values = [float(_deref(v)) for v in args[:num_values]]
+            block = numpy.array(values, dtype=numpy.float64).reshape(-1, 1)
+            return self._write(handle, block, auto_start, timeout, None)
+        return write
@@ -12,7 +12,7 @@ from artdaq.constants import (Coupling, TerminalConfiguration, VoltageUnits, Cur
                               CurrentShuntResistorLocation, ThermocoupleUnits, ThermocoupleType, CJCSource,
                               ResistanceUnits,
                               RtdType, ResistanceConfiguration, ExcitationSource, StrainUnits, StrainGageBridgeType,
-                              BridgeUnits, BridgeConfiguration)
+                              BridgeUnits, BridgeConfiguration, ChannelType)
 from artdaq.errors import check_for_error
 from artdaq.utils import unflatten_channel_string
 
@@ -21,8 +21,8 @@ class AIChannelCollection(ChannelCollection):
     """
     Contains the collection of analog input channels for a DAQ Task.
     """
-    def __init__(self, task_handle):
-        super(AIChannelCollection, self).__init__(task_handle)
+    def __init__(self, task_handle, metadata=None):
+        super(AIChannelCollection, self).__init__(task_handle, metadata)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -49,6 +49,8 @@ class AIChannelCollection(ChannelCollection):
         else:
             name = physical_channel
 
+        self._metadata.add_channels(
+            name, ChannelType.ANALOG_INPUT, physical_channel)
         return AIChannel(self._handle, name)
 
     def add_ai_voltage_chan(
@@ -18,8 +18,8 @@ class AOChannelCollection(ChannelCollection):
     """
     Contains the collection of analog output channels for a DAQ Task.
     """
-    def __init__(self, task_handle):
-        super(AOChannelCollection, self).__init__(task_handle)
+    def __init__(self, task_handle, metadata=None):
+        super(AOChannelCollection, self).__init__(task_handle, metadata)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -46,6 +46,8 @@ class AOChannelCollection(ChannelCollection):
         else:
             name = physical_channel
 
+        self._metadata.add_channels(
+            name, ChannelType.ANALOG_OUTPUT, physical_channel)
         return AOChannel(self._handle, name)
 
     def add_ao_current_chan(
@@ -0,0 +1,138 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import threading
+
+import numpy
+
+__all__ = ['AsyncBlockIterator', 'get_executor', 'run_async',
+           'set_max_workers']
+
+_DEFAULT_MAX_WORKERS = 8
+
+_executor = None
+_max_workers = _DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns the bounded thread pool on which the asynchronous methods of
+    tasks, readers and writers run the blocking Art_DAQ calls, creating
+    it on first use.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor:
+
+        Indicates the shared executor.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor(
+                    max_workers=_max_workers,
+                    thread_name_prefix='artdaq-async')
+    return _executor
+
+
+def set_max_workers(max_workers):
+    """
+    Specifies the maximum number of blocking Art_DAQ calls that the
+    asynchronous methods run concurrently. The default is 8.
+
+    The executor in use, if any, finishes its pending calls and is
+    replaced by a new one of the specified size.
+
+    Args:
+        max_workers (int): Specifies the maximum number of threads of
+            the executor.
+    """
+    global _executor, _max_workers
+
+    with _executor_lock:
+        previous_executor = _executor
+        _max_workers = max_workers
+        _executor = None
+
+    if previous_executor is not None:
+        previous_executor.shutdown(wait=False)
+
+
+def run_async(function, *args, **kwargs):
+    """
+    Runs a blocking function on the shared executor.
+
+    Must be called from a coroutine or callback running on an asyncio
+    event loop.
+
+    Args:
+        function: Specifies the function to run.
+        args: Specifies the positional arguments to pass to function.
+        kwargs: Specifies the keyword arguments to pass to function.
+    Returns:
+        asyncio.Future:
+
+        Indicates the future that resolves to the value returned by
+        function, or raises the exception it raised.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(
+        get_executor(), functools.partial(function, *args, **kwargs))
+
+
+class AsyncBlockIterator(object):
+    """
+    Asynchronous iterator that reads consecutive blocks of samples on
+    the shared executor.
+
+    Example:
+        >>> async for block in task.read_blocks_async(1000):
+        ...     process(block)
+    """
+
+    def __init__(self, read_block, number_of_blocks=None):
+        """
+        Args:
+            read_block: Specifies the blocking function that reads and
+                returns the next block of samples.
+            number_of_blocks (Optional[int]): Specifies the number of
+                blocks to read before the iteration ends. By default,
+                reads until a block holds no samples.
+        """
+        self._read_block = read_block
+        self._number_of_blocks = number_of_blocks
+        self._blocks_read = 0
+        self._finished = False
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        import asyncio
+
+        if (self._finished or
+                (self._number_of_blocks is not None and
+                 self._blocks_read >= self._number_of_blocks)):
+            future = asyncio.get_running_loop().create_future()
+            future.set_exception(StopAsyncIteration())
+            return future
+
+        self._blocks_read += 1
+        return asyncio.ensure_future(run_async(self._next_block))
+
+    def _next_block(self):
+        block = self._read_block()
+        samples = block[0] if isinstance(block, tuple) else block
+        if numpy.size(samples) == 0:
+            self._finished = True
+            raise StopAsyncIteration()
+        return block
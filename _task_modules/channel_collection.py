@@ -3,13 +3,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import time
 from collections.abc import Sequence
 
 import six
 from artdaq._task_modules.channels.channel import Channel
+from artdaq._task_modules.task_metadata import TaskMetadataCache
+from artdaq.error_codes import Errors
 from artdaq.errors import DaqError
+from artdaq.types import ChannelConfigurationResult
 from artdaq.utils import unflatten_channel_string, flatten_channel_string
 
+_NOT_SET = object()
+
 
 class ChannelCollection(Sequence):
     """
@@ -17,16 +24,24 @@ class ChannelCollection(Sequence):
     
     This class defines methods that implements a container object.
     """
-    def __init__(self, task_handle):
+    def __init__(self, task_handle, metadata=None):
         self._handle = task_handle
+        if metadata is None:
+            metadata = TaskMetadataCache(task_handle)
+        self._metadata = metadata
+        self._configuration = {}
 
     def __contains__(self, item):
-        channel_names = self.channel_names
+        channel_index = self._metadata.channel_index
         if isinstance(item, six.string_types):
+            if item in channel_index:
+                return True
             items = unflatten_channel_string(item)
         elif isinstance(item, Channel):
             items = item.channel_names
-        return all([item in channel_names for item in items])
+        else:
+            return False
+        return all(name in channel_index for name in items)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -63,7 +78,14 @@ class ChannelCollection(Sequence):
         else:
             raise DaqError(
                 'Invalid index type "{0}" used to access channels.'
-                .format(type(index)), DaqError.UNKNOWN.value)
+                .format(type(index)), Errors.UNKNOWN.value)
+
+        if not channel_names:
+            raise DaqError(
+                'You cannot specify an empty index when indexing channels.\n'
+                'Index used: {0}'.format(index), Errors.UNKNOWN.value)
+
+        return Channel._factory(self._handle, channel_names)
 
     def __hash__(self):
         return hash(self._handle.value)
@@ -79,12 +101,130 @@ class ChannelCollection(Sequence):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        channel_names = self.channel_names
-        channel_names.reverse()
-
-        for channel_name in channel_names:
+        for channel_name in reversed(self.channel_names):
             yield Channel._factory(self._handle, channel_name)
 
+    @property
+    def channel_names(self):
+        """
+        Tuple[str]: Specifies the names of all virtual channels in the
+            task. The names are cached until channels are added.
+        """
+        return self._metadata.channel_names
+
+    def index(self, value, start=0, stop=None):
+        """
+        Returns the position of a virtual channel in the collection.
+
+        Args:
+            value (Union[str, artdaq._task_modules.channels.channel.Channel]):
+                Specifies the name of the virtual channel, or a channel
+                object that represents a single virtual channel.
+            start (Optional[int]): Specifies the first position to search.
+            stop (Optional[int]): Specifies the position after the last
+                position to search.
+        Returns:
+            int:
+
+            Indicates the position of the virtual channel.
+        """
+        if isinstance(value, Channel):
+            value = value.name
+        start, stop, _ = slice(start, stop).indices(len(self))
+        position = self._metadata.channel_index.get(value)
+        if position is None or not start <= position < stop:
+            raise ValueError('{0} is not in the collection'.format(value))
+        return position
+
+    def configure_channels(self, settings, skip_unchanged=True):
+        """
+        Sets properties of many virtual channels with as few driver
+        calls as possible.
+
+        Channels that get the same value for a property are set with a
+        single call, using a flattened channel string. The values set
+        through this method are remembered, and values equal to the
+        remembered ones are skipped. Values set directly through the
+        channel properties are not remembered; call
+        "clear_configuration_cache" after setting any, or pass
+        skip_unchanged=False.
+
+        Args:
+            settings (Mapping[str, Mapping[str, object]]): Specifies the
+                properties to set, keyed by channel name. Each key can
+                also be a list or range of channel names, such as
+                "Dev1/ai0:15". Each value maps property names of the
+                channel class, such as "ai_min", to the value to set.
+                Properties are set in the order they first appear.
+            skip_unchanged (Optional[bool]): Specifies whether to skip
+                values equal to those last set through this method.
+        Returns:
+            artdaq.types.ChannelConfigurationResult:
+
+            Indicates the number of driver calls made, the number of
+            channel values set and skipped, and the time taken in
+            seconds.
+        """
+        start_time = time.time()
+
+        # Maps each property to the value to set on each channel. Later
+        # settings of the same channel override earlier ones.
+        values = collections.OrderedDict()
+        for channel_string, channel_settings in six.iteritems(settings):
+            channel_class = type(Channel._factory(
+                self._handle, channel_string))
+            channel_names = unflatten_channel_string(channel_string)
+            for property_name, value in six.iteritems(channel_settings):
+                descriptor = getattr(channel_class, property_name, None)
+                if (not isinstance(descriptor, property) or
+                        descriptor.fset is None):
+                    raise DaqError(
+                        'Property "{0}" of {1} cannot be set.\n'
+                        'Channel: {2}'.format(
+                            property_name, channel_class.__name__,
+                            channel_string), Errors.UNKNOWN.value)
+
+                channel_values = values.setdefault(
+                    property_name, collections.OrderedDict())
+                for channel_name in channel_names:
+                    channel_values[channel_name] = value
+
+        calls = 0
+        values_set = 0
+        values_skipped = 0
+        for property_name, channel_values in six.iteritems(values):
+            # Groups the channels that get the same value.
+            groups = collections.OrderedDict()
+            for channel_name, value in six.iteritems(channel_values):
+                if skip_unchanged and self._configuration.get(
+                        channel_name, {}).get(
+                            property_name, _NOT_SET) == value:
+                    values_skipped += 1
+                else:
+                    groups.setdefault(value, []).append(channel_name)
+
+            for value, channel_names in six.iteritems(groups):
+                channel = Channel._factory(
+                    self._handle, flatten_channel_string(channel_names))
+                # The property setters pass values to the driver as is.
+                setattr(channel, property_name, getattr(value, 'value', value))
+                calls += 1
+                values_set += len(channel_names)
+
+                for channel_name in channel_names:
+                    self._configuration.setdefault(
+                        channel_name, {})[property_name] = value
+
+        return ChannelConfigurationResult(
+            calls, values_set, values_skipped, time.time() - start_time)
+
+    def clear_configuration_cache(self):
+        """
+        Forgets the channel property values set through
+        "configure_channels", so that the next call sets every value.
+        """
+        self._configuration.clear()
+
     @property
     def all(self):
         """
@@ -3,8 +3,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+from artdaq._task_modules.channels.channel import Channel
+from artdaq._task_modules.channels.ai_channel import AIChannel
+from artdaq._task_modules.channels.ao_channel import AOChannel
+from artdaq._task_modules.channels.cio_channel import CIOChannel
+from artdaq._task_modules.channels.dio_channel import DIOChannel
 
 __author__ = 'Art Technology'
-__all__ = ['channel']
+__all__ = ['Channel', 'AIChannel', 'AOChannel', 'CIOChannel', 'DIOChannel']
 
 #from artdaq._task_modules.channels.do_channel import DOChannel
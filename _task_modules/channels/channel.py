@@ -15,7 +15,7 @@ class Channel(object):
     """
     Represents virtual channel or a list of virtual channels.
     """
-    __slots__ = ['_handle', '_name', '__weakref__']
+    __slots__ = ['_handle', '_name', '_name_set', '__weakref__']
 
     def __init__(self, task_handle, virtual_or_physical_name):
         """
@@ -27,6 +27,7 @@ class Channel(object):
         """
         self._handle = task_handle
         self._name = virtual_or_physical_name
+        self._name_set = None
 
     def __add__(self, other):
         if not isinstance(other, self.__class__):
@@ -42,23 +43,30 @@ class Channel(object):
         return Channel._factory(self._handle, name)
 
     def __contains__(self, item):
-        channel_names = self.channel_names
+        name_set = self._channel_name_set
 
         if isinstance(item, str):
+            if item in name_set:
+                return True
             items = unflatten_channel_string(item)
         elif isinstance(item, Channel):
-            items = item.channel_names
+            items = item._channel_name_set
+        else:
+            return False
 
-        return all([item in channel_names for item in items])
+        return all(name in name_set for name in items)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return (self._handle == other._handle and
-                    set(self.channel_names) == set(other.channel_names))
+            if self._handle != other._handle:
+                return False
+            if self._name and self._name == other._name:
+                return True
+            return self._channel_name_set == other._channel_name_set
         return False
 
     def __hash__(self):
-        return hash((self._handle.value, frozenset(self.channel_names)))
+        return hash((self._handle.value, self._channel_name_set))
 
     def __iadd__(self, other):
         return self.__add__(other)
@@ -74,10 +82,7 @@ class Channel(object):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        channel_names = self.channel_names
-        channel_names.reverse()
-
-        for channel_name in channel_names:
+        for channel_name in reversed(self.channel_names):
             yield Channel._factory(self._handle, channel_name)
 
     def __repr__(self):
@@ -126,13 +131,28 @@ class Channel(object):
     @property
     def channel_names(self):
         """
-        List[str]: Specifies the unflattened list of the virtual channels.
+        :class:`artdaq.utils.ChannelNames`: Specifies the unflattened,
+            immutable sequence of the virtual channels.
         """
         if self._name:
             return unflatten_channel_string(self._name)
         else:
             return unflatten_channel_string(self._all_channels_name)
 
+    @property
+    def _channel_name_set(self):
+        """
+        FrozenSet[str]: Specifies the names of the virtual channels as a
+            set. The set is cached unless this object represents all the
+            channels in the task, which can change.
+        """
+        name_set = self._name_set
+        if name_set is None:
+            name_set = frozenset(self.channel_names)
+            if self._name:
+                self._name_set = name_set
+        return name_set
+
     @property
     def _all_channels_name(self):
         """
@@ -9,7 +9,7 @@ from artdaq._lib import lib_importer, ctypes_byte_str, c_bool32
 from artdaq._task_modules.channel_collection import ChannelCollection
 from artdaq._task_modules.channels.cio_channel import CIOChannel
 from artdaq.constants import (
-    AngleUnits, CountDirection, CounterFrequencyMethod,
+    AngleUnits, ChannelType, CountDirection, CounterFrequencyMethod,
     Edge, EncoderType, EncoderZIndexPhase, LengthUnits, UsageTypeCI,
     FrequencyUnits, Level, TimeUnits, UsageTypeCO)
 from artdaq.errors import check_for_error
@@ -20,8 +20,8 @@ class CIOChannelCollection(ChannelCollection):
     """
     Contains the collection of counter input channels for a DAQ Task.
     """
-    def __init__(self, task_handle):
-        super(CIOChannelCollection, self).__init__(task_handle)
+    def __init__(self, task_handle, metadata=None):
+        super(CIOChannelCollection, self).__init__(task_handle, metadata)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -49,6 +49,8 @@ class CIOChannelCollection(ChannelCollection):
             name = counter
 
        # Channel.chan_type = ChannelType.COUNTER_INPUT || ChannelType.COUNTER_OUTPUT
+        self._metadata.add_channels(
+            name, ChannelType.COUNTER, counter)
         return CIOChannel(self._handle, name)
 
     def add_ci_freq_chan(
@@ -10,7 +10,7 @@ from artdaq._task_modules.channel_collection import ChannelCollection
 from artdaq._task_modules.channels.channel import Channel
 from artdaq._task_modules.channels.dio_channel import DIOChannel
 from artdaq.constants import (
-    LineGrouping)
+    ChannelType, LineGrouping)
 from artdaq.errors import check_for_error
 from artdaq.utils import unflatten_channel_string
 
@@ -19,8 +19,8 @@ class DOChannelCollection(ChannelCollection):
     """
     Contains the collection of digital output channels for a DAQ Task.
     """
-    def __init__(self, task_handle):
-        super(DOChannelCollection, self).__init__(task_handle)
+    def __init__(self, task_handle, metadata=None):
+        super(DOChannelCollection, self).__init__(task_handle, metadata)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -57,6 +57,8 @@ class DOChannelCollection(ChannelCollection):
             else:
                 name = lines
 
+        self._metadata.add_channels(
+            name, ChannelType.DIGITAL_OUTPUT, lines)
         return DIOChannel(self._handle, name)
 
     def add_do_chan(
@@ -5,10 +5,13 @@ from __future__ import unicode_literals
 
 import ctypes
 
-from artdaq._lib import lib_importer, c_bool32
+from artdaq._lib import lib_importer, ctypes_byte_str, c_bool32
 from artdaq._task_modules.channels.channel import Channel
-from artdaq.constants import OverwriteMode
-from artdaq.errors import check_for_error, is_string_buffer_too_small
+from artdaq.constants import (
+    ChannelType, LoggingMode, LoggingOperation, OverwriteMode)
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError, check_for_error
+from artdaq.stream_logger import StreamLogger
 
 
 class InStream(object):
@@ -23,6 +26,7 @@ class InStream(object):
         self._task = task
         self._handle = task._handle
         self._timeout = 10.0
+        self._logger = None
 
         super(InStream, self).__init__()
 
@@ -107,32 +111,145 @@ class InStream(object):
             Specifies a subset of channels in the task from which to
             read.
         """
-        cfunc = lib_importer.windll.ArtDAQ_GetTaskAttribute
+        return Channel._factory(
+            self._handle, self._task._metadata.flattened_read_channel_names)
+
+    @channels_to_read.setter
+    def channels_to_read(self, val):
+        val = val.name
+        cfunc = lib_importer.windll.ArtDAQ_SetReadChannelsToRead
+        if cfunc.argtypes is None:
+            with cfunc.arglock:
+                if cfunc.argtypes is None:
+                    cfunc.argtypes = [
+                        lib_importer.task_handle, ctypes_byte_str]
+
+        error_code = cfunc(
+            self._handle, val)
+        check_for_error(error_code)
+
+        self._task._metadata.set_channels_to_read(val)
+
+    @channels_to_read.deleter
+    def channels_to_read(self):
+        cfunc = lib_importer.windll.ArtDAQ_ResetReadChannelsToRead
         if cfunc.argtypes is None:
             with cfunc.arglock:
                 if cfunc.argtypes is None:
                     cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_char_p,
-                        ctypes.c_int]
-
-        temp_size = 1024
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
-
-            size_or_code = cfunc(
-                self._handle, 0x1273, val, temp_size)
-
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
-
-        check_for_error(size_or_code)
-        return Channel._factory(self._handle, val.value.decode('ascii'))
+                        lib_importer.task_handle]
+
+        error_code = cfunc(
+            self._handle)
+        check_for_error(error_code)
+
+        self._task._metadata.set_channels_to_read(None)
+
+    def configure_logging(
+            self, file_path, samples_per_channel,
+            logging_mode=LoggingMode.LOG_AND_READ,
+            operation=LoggingOperation.OPEN_OR_CREATE, sample_rate=0.0,
+            samples_per_block=1000):
+        """
+        Configures streaming the samples of an analog input task to a
+        preallocated, memory-mapped stream log file, which
+        artdaq.stream_logger.StreamLogReader maps back as NumPy arrays.
+
+        In LOG mode, starting the task starts a thread that reads
+        unscaled samples directly into the file, together with the
+        coefficients to scale them, and the task cannot be read. In
+        LOG_AND_READ mode, the samples read with Task.read, Task.read_into
+        and the analog stream readers are also copied to the file; the
+        samples that AnalogUnscaledReader reads are scaled first.
+
+        Configure logging before starting the task.
+
+        Args:
+            file_path (str): Specifies the path to the file.
+            samples_per_channel (int): Specifies the number of samples
+                per channel to preallocate room for. Logging stops with
+                an error when the file is full.
+            logging_mode (Optional[artdaq.constants.LoggingMode]):
+                Specifies whether to enable logging and whether the task
+                can be read while logging. Specify LoggingMode.OFF to
+                disable logging and close the file.
+            operation (Optional[artdaq.constants.LoggingOperation]):
+                Specifies how to open the file.
+            sample_rate (Optional[float]): Specifies the sample rate of
+                the task, which is recorded in the file.
+            samples_per_block (Optional[int]): Specifies the number of
+                samples per channel the logging thread reads in each
+                call to the driver in LOG mode.
+        """
+        if self._logger is not None:
+            logger, self._logger = self._logger, None
+            logger.close()
+
+        if logging_mode == LoggingMode.OFF:
+            return
+
+        if self._task.task_type != ChannelType.ANALOG_INPUT:
+            raise DaqError(
+                'Logging can only be configured for tasks with analog input '
+                'channels.',
+                Errors.UNKNOWN.value, task_name=self._task.name)
+
+        self._logger = StreamLogger(
+            self, file_path, samples_per_channel, logging_mode=logging_mode,
+            operation=operation, sample_rate=sample_rate,
+            samples_per_block=samples_per_block)
+
+    @property
+    def logging_mode(self):
+        """
+        :class:`artdaq.constants.LoggingMode`: Indicates whether logging
+            is enabled and whether the task can be read while logging.
+        """
+        if self._logger is None:
+            return LoggingMode.OFF
+        return self._logger.logging_mode
+
+    @property
+    def logging_file_path(self):
+        """
+        str: Indicates the path to the stream log file, or None if
+            logging is disabled.
+        """
+        if self._logger is None:
+            return None
+        return self._logger.file_path
+
+    def _start_logging(self):
+        if self._logger is not None:
+            self._logger.start()
+
+    def _stop_logging(self):
+        if self._logger is not None:
+            self._logger.stop()
+
+    def _close_logging(self):
+        if self._logger is not None:
+            logger, self._logger = self._logger, None
+            logger.close()
+
+    def _verify_readable(self):
+        if (self._logger is not None and
+                self._logger.logging_mode == LoggingMode.LOG):
+            raise DaqError(
+                'Read cannot be performed, because the task streams its '
+                'samples to a file in LOG mode. Configure logging in '
+                'LOG_AND_READ mode to read the samples while logging.',
+                Errors.UNKNOWN.value, task_name=self._task.name)
+
+    def _log_samples(self, data):
+        if (self._logger is not None and
+                self._logger.logging_mode == LoggingMode.LOG_AND_READ):
+            self._logger.log(data)
+
+    def _log_unscaled_samples(self, data):
+        if (self._logger is not None and
+                self._logger.logging_mode == LoggingMode.LOG_AND_READ):
+            self._logger.log_unscaled(data)
 
     def di_num_booleans_per_chan(self):
         """
@@ -0,0 +1,265 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import ctypes
+import threading
+
+from artdaq._lib import lib_importer
+from artdaq.errors import check_for_error, is_string_buffer_too_small
+from artdaq.utils import flatten_channel_string, unflatten_channel_string
+
+
+def _get_task_channel_names(task_handle):
+    """
+    Queries the flattened names of all virtual channels in a task.
+
+    Args:
+        task_handle (TaskHandle): Specifies the handle of the task.
+    Returns:
+        str: Indicates the flattened list of channel names.
+    """
+    cfunc = lib_importer.windll.ArtDAQ_GetTaskAttribute
+    if cfunc.argtypes is None:
+        with cfunc.arglock:
+            if cfunc.argtypes is None:
+                cfunc.argtypes = [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_char_p,
+                    ctypes.c_int]
+
+    temp_size = 1024
+    while True:
+        val = ctypes.create_string_buffer(temp_size)
+
+        size_or_code = cfunc(
+            task_handle, 0x1273, val, temp_size)
+
+        if is_string_buffer_too_small(size_or_code):
+            # Buffer size must have changed between calls; check again.
+            temp_size = 0
+        elif size_or_code > 0 and temp_size == 0:
+            # Buffer size obtained, use to retrieve data.
+            temp_size = size_or_code
+        else:
+            break
+
+    check_for_error(size_or_code)
+
+    return val.value.decode('ascii')
+
+
+def _build_channel_index(channel_names):
+    """
+    Maps each channel name to its position in a list of channel names.
+
+    Args:
+        channel_names (Sequence[str]): Specifies the channel names.
+    Returns:
+        Dict[str, int]: Indicates the position of each channel name.
+    """
+    return dict((name, index) for index, name in enumerate(channel_names))
+
+
+class TaskMetadataCache(object):
+    """
+    Caches the channel metadata of a DAQ task.
+
+    Querying the channel list of a task goes through the driver and
+    parses the returned channel string, which is expensive relative to
+    small reads and writes. This cache stores the channel names, the
+    channel count, a name-to-position index of the channels, the channel
+    types of the task and the subset of channels to read. It is
+    refreshed lazily after the channel
+    collections add channels or the channels to read change.
+    """
+
+    def __init__(self, task_handle):
+        """
+        Args:
+            task_handle (TaskHandle): Specifies the handle of the task
+                whose metadata to cache.
+        """
+        self._handle = task_handle
+        self._lock = threading.Lock()
+        self._version = 0
+
+        self._channel_names = None
+        self._flattened_channel_names = None
+        self._channel_index = None
+        self._channel_types = {}
+        self._physical_channels = {}
+        self._read_channel_names = None
+        self._flattened_read_channel_names = None
+
+    @property
+    def version(self):
+        """
+        int: Indicates the number of times the cached metadata has been
+            invalidated. Changes whenever the channels of the task or
+            the channels to read change.
+        """
+        return self._version
+
+    @property
+    def channel_names(self):
+        """
+        Tuple[str]: Indicates the names of all virtual channels in the
+            task.
+        """
+        channel_names = self._channel_names
+        if channel_names is None:
+            channel_names, _ = self._refresh()
+        return channel_names
+
+    @property
+    def flattened_channel_names(self):
+        """
+        str: Indicates the names of all virtual channels in the task as
+            a flattened channel string.
+        """
+        flattened = self._flattened_channel_names
+        if flattened is None:
+            _, flattened = self._refresh()
+        return flattened
+
+    @property
+    def channel_index(self):
+        """
+        Dict[str, int]: Indicates the position of each virtual channel in
+            the task, keyed by channel name. The dictionary is built once
+            per channel list and must not be modified.
+        """
+        channel_index = self._channel_index
+        if channel_index is None:
+            self._refresh()
+            channel_index = self._channel_index
+            if channel_index is None:
+                # A concurrent change discarded the list just queried.
+                channel_index = _build_channel_index(self.channel_names)
+        return channel_index
+
+    @property
+    def number_of_channels(self):
+        """
+        int: Indicates the number of virtual channels in the task.
+        """
+        return len(self.channel_names)
+
+    @property
+    def channel_types(self):
+        """
+        Tuple[artdaq.constants.ChannelType]: Indicates the type of each
+            virtual channel in the task, in the same order as
+            "channel_names". The type is None for channels that were
+            not added through a channel collection of the task.
+        """
+        return tuple(self._channel_types.get(name)
+                     for name in self.channel_names)
+
+    @property
+    def read_channel_names(self):
+        """
+        Tuple[str]: Indicates the names of the virtual channels to read
+            from, which are all channels in the task unless a subset was
+            set through "set_channels_to_read".
+        """
+        read_channel_names = self._read_channel_names
+        if read_channel_names is None:
+            return self.channel_names
+        return read_channel_names
+
+    @property
+    def flattened_read_channel_names(self):
+        """
+        str: Indicates the names of the virtual channels to read from as
+            a flattened channel string.
+        """
+        if self._read_channel_names is None:
+            return self.flattened_channel_names
+        return self._flattened_read_channel_names
+
+    @property
+    def number_of_read_channels(self):
+        """
+        int: Indicates the number of virtual channels to read from.
+        """
+        return len(self.read_channel_names)
+
+    def get_physical_channel(self, channel_name):
+        """
+        Returns the physical channel of a virtual channel.
+
+        Args:
+            channel_name (str): Specifies the name of the virtual
+                channel.
+        Returns:
+            Optional[str]: Indicates the name of the physical channel, or
+            None if the virtual channel was not added through a channel
+            collection of the task.
+        """
+        return self._physical_channels.get(channel_name)
+
+    def add_channels(self, channel_names, channel_type,
+                     physical_channels=None):
+        """
+        Records virtual channels that a channel collection added to the
+        task and invalidates the cached channel list.
+
+        Args:
+            channel_names (str): Specifies the flattened names of the
+                virtual channels added.
+            channel_type (artdaq.constants.ChannelType): Specifies the
+                type of the virtual channels added.
+            physical_channels (Optional[str]): Specifies the flattened
+                names of the physical channels used to create the
+                virtual channels, in the same order.
+        """
+        names = unflatten_channel_string(channel_names)
+        if physical_channels:
+            physical_names = unflatten_channel_string(physical_channels)
+        else:
+            physical_names = []
+
+        with self._lock:
+            for name in names:
+                self._channel_types[name] = channel_type
+            if len(physical_names) == len(names):
+                self._physical_channels.update(zip(names, physical_names))
+            self._channel_names = None
+            self._flattened_channel_names = None
+            self._channel_index = None
+            self._version += 1
+
+    def set_channels_to_read(self, channel_names):
+        """
+        Records the subset of virtual channels to read from.
+
+        Args:
+            channel_names (Optional[str]): Specifies the flattened names
+                of the virtual channels to read from. None or an empty
+                string selects all channels in the task.
+        """
+        with self._lock:
+            if channel_names:
+                names = tuple(unflatten_channel_string(channel_names))
+                self._read_channel_names = names
+                self._flattened_read_channel_names = flatten_channel_string(
+                    names)
+            else:
+                self._read_channel_names = None
+                self._flattened_read_channel_names = None
+            self._version += 1
+
+    def _refresh(self):
+        version = self._version
+        flattened = _get_task_channel_names(self._handle)
+        channel_names = tuple(unflatten_channel_string(flattened))
+        channel_index = _build_channel_index(channel_names)
+        with self._lock:
+            # Do not cache a result that a concurrent change made stale.
+            if self._version == version:
+                self._flattened_channel_names = flattened
+                self._channel_names = channel_names
+                self._channel_index = channel_index
+        return channel_names, flattened
@@ -17,6 +17,50 @@ class Timing(object):
     def __init__(self, task_handle):
         self._handle = task_handle
 
+        # The driver does not report the timing of a task, so the last
+        # configuration applied through this object is remembered.
+        self._samp_clk_src = None
+        self._samp_clk_rate = None
+        self._samp_quant_samp_mode = None
+        self._samp_quant_samp_per_chan = None
+
+    @property
+    def samp_clk_src(self):
+        """
+        str: Indicates the source terminal of the Sample Clock last
+            configured with "cfg_samp_clk_timing", or None if the Sample
+            Clock was not configured.
+        """
+        return self._samp_clk_src
+
+    @property
+    def samp_clk_rate(self):
+        """
+        float: Indicates the rate of the Sample Clock in samples per
+            channel per second last configured with
+            "cfg_samp_clk_timing", or None if the Sample Clock was not
+            configured.
+        """
+        return self._samp_clk_rate
+
+    @property
+    def samp_quant_samp_mode(self):
+        """
+        :class:`artdaq.constants.AcquisitionType`: Indicates the sample
+            mode last configured with "cfg_samp_clk_timing" or
+            "cfg_implicit_timing", or None if timing was not configured.
+        """
+        return self._samp_quant_samp_mode
+
+    @property
+    def samp_quant_samp_per_chan(self):
+        """
+        int: Indicates the number of samples per channel last configured
+            with "cfg_samp_clk_timing" or "cfg_implicit_timing", or None
+            if timing was not configured.
+        """
+        return self._samp_quant_samp_per_chan
+
     def ai_conv_src(self, val, active_edge=Edge.RISING):
         cfunc = lib_importer.windll.ArtDAQ_SetAIConvClk
         if cfunc.argtypes is None:
@@ -122,6 +166,9 @@ class Timing(object):
             self._handle, sample_mode.value, samps_per_chan)
         check_for_error(error_code)
 
+        self._samp_quant_samp_mode = sample_mode
+        self._samp_quant_samp_per_chan = samps_per_chan
+
     def cfg_samp_clk_timing(
             self, source="", rate=1000, active_edge=Edge.RISING,
             sample_mode=AcquisitionType.FINITE, samps_per_chan=1000):
@@ -162,4 +209,9 @@ class Timing(object):
 
         error_code = cfunc(
             self._handle, source, rate, active_edge.value, sample_mode.value,samps_per_chan)
-        check_for_error(error_code)
\ No newline at end of file
+        check_for_error(error_code)
+
+        self._samp_clk_src = source
+        self._samp_clk_rate = rate
+        self._samp_quant_samp_mode = sample_mode
+        self._samp_quant_samp_per_chan = samps_per_chan
@@ -5,28 +5,19 @@ from __future__ import unicode_literals
 
 import ctypes
 
-import numpy
 from artdaq._lib import lib_importer, wrapped_ndpointer, c_bool32
 from artdaq.constants import FillMode
 from artdaq.errors import check_for_error
 
+_functions = lib_importer.function_table
+
 
 def _write_analog_f_64(
         task_handle, write_array, num_samps_per_chan, auto_start, timeout,
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteAnalogF64
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteAnalogF64(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -36,15 +27,7 @@ def _write_analog_f_64(
 
 
 def _write_analog_scalar_f_64(task_handle, value, auto_start, timeout):
-    cfunc = lib_importer.windll.ArtDAQ_WriteAnalogScalarF64
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, c_bool32, ctypes.c_double,
-                    ctypes.c_double, ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteAnalogScalarF64(
         task_handle, auto_start, timeout, value, None)
     check_for_error(error_code)
 
@@ -54,17 +37,7 @@ def _write_binary_i_16(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteBinaryI16
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteBinaryI16(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -78,17 +51,7 @@ def _write_binary_u_16(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteBinaryU16
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.uint16, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteBinaryU16(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -102,17 +65,7 @@ def _write_digital_u_8(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteDigitalU8
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.uint8, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteDigitalU8(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -126,17 +79,7 @@ def _write_digital_u_16(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteDigitalU16
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.uint16, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteDigitalU16(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -150,17 +93,7 @@ def _write_digital_u_32(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteDigitalU32
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteDigitalU32(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -170,15 +103,7 @@ def _write_digital_u_32(
 
 
 def _write_digital_scalar_u_32(task_handle, value, auto_start, timeout):
-    cfunc = lib_importer.windll.WriteDigitalScalarU32
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, c_bool32, ctypes.c_double,
-                    ctypes.c_uint, ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteDigitalScalarU32(
         task_handle, auto_start, timeout, value, None)
     check_for_error(error_code)
 
@@ -188,17 +113,7 @@ def _write_digital_lines(
         data_layout=FillMode.GROUP_BY_CHANNEL):
     samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteDigitalLines
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double, ctypes.c_int,
-                    wrapped_ndpointer(dtype=numpy.uint8, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteDigitalLines(
         task_handle, num_samps_per_chan, auto_start, timeout,
         data_layout.value, write_array,
         ctypes.byref(samps_per_chan_written), None)
@@ -211,18 +126,7 @@ def _write_ctr_freq(
         task_handle, freq, duty_cycle, num_samps_per_chan, auto_start, timeout):
     num_samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrFreq
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double,
-                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrFreq(
         task_handle, num_samps_per_chan, auto_start, timeout,
         freq, duty_cycle,
         ctypes.byref(num_samps_per_chan_written), None)
@@ -232,15 +136,7 @@ def _write_ctr_freq(
 
 
 def _write_ctr_freq_scalar(task_handle, freq, duty_cycle, auto_start, timeout):
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrFreqScalar
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, c_bool32, ctypes.c_double,
-                    ctypes.c_double, ctypes.c_double, ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrFreqScalar(
         task_handle, auto_start, timeout, freq, duty_cycle, None)
     check_for_error(error_code)
 
@@ -250,18 +146,7 @@ def _write_ctr_time(
         timeout):
     num_samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrTime
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double,
-                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                    wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrTime(
         task_handle, num_samps_per_chan, auto_start, timeout, high_time, low_time,
         ctypes.byref(num_samps_per_chan_written), None)
     check_for_error(error_code)
@@ -271,16 +156,7 @@ def _write_ctr_time(
 
 def _write_ctr_time_scalar(
         task_handle, high_time, low_time, auto_start, timeout):
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrTimeScalar
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, c_bool32, ctypes.c_double,
-                    ctypes.c_double, ctypes.c_double,
-                    ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrTimeScalar(
         task_handle, auto_start, timeout, high_time,
         low_time, None)
     check_for_error(error_code)
@@ -291,18 +167,7 @@ def _write_ctr_ticks(
         timeout):
     num_samps_per_chan_written = ctypes.c_int()
 
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrTicks
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, ctypes.c_int, c_bool32,
-                    ctypes.c_double,
-                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C', 'W')),
-                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C', 'W')),
-                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrTicks(
         task_handle, num_samps_per_chan, auto_start, timeout,
         high_tick, low_tick,
         ctypes.byref(num_samps_per_chan_written), None)
@@ -313,15 +178,7 @@ def _write_ctr_ticks(
 
 def _write_ctr_ticks_scalar(
         task_handle, high_ticks, low_ticks, auto_start, timeout):
-    cfunc = lib_importer.windll.ArtDAQ_WriteCtrTicksScalar
-    if cfunc.argtypes is None:
-        with cfunc.arglock:
-            if cfunc.argtypes is None:
-                cfunc.argtypes = [
-                    lib_importer.task_handle, c_bool32, ctypes.c_double,
-                    ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(c_bool32)]
-
-    error_code = cfunc(
+    error_code = _functions.ArtDAQ_WriteCtrTicksScalar(
         task_handle, auto_start, timeout, high_ticks, low_ticks, None)
     check_for_error(error_code)
 
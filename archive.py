@@ -0,0 +1,711 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+import io
+import json
+import struct
+import threading
+import time
+import zlib
+
+import numpy
+from six.moves import queue
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+__all__ = ['ArchiveWriter', 'ArchiveReader', 'Codec', 'RawCodec',
+           'ZlibCodec', 'LzmaCodec', 'DeltaBitShuffleCodec',
+           'register_codec']
+
+_MAGIC = b'ARTDAQAR'
+_FORMAT_VERSION = 1
+
+# Magic and format version.
+_HEADER = struct.Struct('<8sI')
+
+# Offset and length of the index, and magic. The last footer in the file
+# locates the index that describes every chunk written before it.
+_FOOTER = struct.Struct('<QQ8s')
+
+
+class Codec(object):
+    """
+    Defines base class for the codecs that compress the chunks of an
+    archive.
+
+    A codec encodes one chunk of samples of one channel at a time. Codecs
+    are looked up by name when an archive is read, so register custom
+    codecs with "register_codec" before reading archives that use them.
+    """
+
+    #: str: Specifies the name the codec is recorded under in archives.
+    name = None
+
+    def encode(self, samples):
+        """
+        Encodes one chunk of samples.
+
+        Args:
+            samples (numpy.ndarray): Specifies a C-contiguous 1D array of
+                samples.
+        Returns:
+            bytes:
+
+            Indicates the encoded samples.
+        """
+        raise NotImplementedError()
+
+    def decode(self, buffer, dtype, number_of_samples):
+        """
+        Decodes one chunk of samples.
+
+        Args:
+            buffer (bytes): Specifies the encoded samples.
+            dtype (numpy.dtype): Specifies the data type of the samples.
+            number_of_samples (int): Specifies the number of samples.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a 1D array of the samples.
+        """
+        raise NotImplementedError()
+
+
+class RawCodec(Codec):
+    """
+    Stores samples without compression.
+    """
+
+    name = 'none'
+
+    def encode(self, samples):
+        return samples.tobytes()
+
+    def decode(self, buffer, dtype, number_of_samples):
+        return numpy.frombuffer(buffer, dtype=dtype, count=number_of_samples)
+
+
+class ZlibCodec(Codec):
+    """
+    Compresses samples with zlib.
+    """
+
+    name = 'zlib'
+
+    def __init__(self, level=6):
+        """
+        Args:
+            level (Optional[int]): Specifies the compression level, from
+                1 (fastest) to 9 (smallest).
+        """
+        self._level = level
+
+    def encode(self, samples):
+        return zlib.compress(samples.tobytes(), self._level)
+
+    def decode(self, buffer, dtype, number_of_samples):
+        return numpy.frombuffer(
+            zlib.decompress(buffer), dtype=dtype, count=number_of_samples)
+
+
+class LzmaCodec(Codec):
+    """
+    Compresses samples with LZMA, which compresses better than zlib but
+    is several times slower. Requires the lzma module of Python 3.
+    """
+
+    name = 'lzma'
+
+    def __init__(self, preset=6):
+        """
+        Args:
+            preset (Optional[int]): Specifies the compression preset,
+                from 0 (fastest) to 9 (smallest).
+        """
+        self._preset = preset
+
+    def encode(self, samples):
+        import lzma
+
+        return lzma.compress(samples.tobytes(), preset=self._preset)
+
+    def decode(self, buffer, dtype, number_of_samples):
+        import lzma
+
+        return numpy.frombuffer(
+            lzma.decompress(buffer), dtype=dtype, count=number_of_samples)
+
+
+class DeltaBitShuffleCodec(Codec):
+    """
+    Compresses integer samples, such as those read by
+    AnalogUnscaledReader, by storing the difference between consecutive
+    samples, regrouping the bits of the differences so that bits of the
+    same significance are stored together, and compressing the result
+    with zlib.
+
+    Slowly varying signals have small differences, whose high-order bits
+    are all equal, so after regrouping they form long runs that zlib
+    compresses well.
+    """
+
+    name = 'delta_bitshuffle'
+
+    def __init__(self, level=6):
+        """
+        Args:
+            level (Optional[int]): Specifies the zlib compression level,
+                from 1 (fastest) to 9 (smallest).
+        """
+        self._level = level
+
+    def encode(self, samples):
+        if samples.dtype.kind not in 'iu':
+            raise DaqError(
+                'The delta_bitshuffle codec can only encode integer '
+                'samples.\n\nData type: {0}'.format(samples.dtype),
+                Errors.UNKNOWN.value)
+
+        # Differences wrap around in the data type of the samples, which
+        # the cumulative sum in "decode" undoes exactly.
+        deltas = numpy.empty_like(samples)
+        deltas[:1] = samples[:1]
+        numpy.subtract(samples[1:], samples[:-1], out=deltas[1:])
+
+        bits = numpy.unpackbits(
+            deltas.view(numpy.uint8).reshape(len(deltas), -1), axis=1)
+        return zlib.compress(
+            numpy.packbits(bits.T, axis=1).tobytes(), self._level)
+
+    def decode(self, buffer, dtype, number_of_samples):
+        dtype = numpy.dtype(dtype)
+        packed = numpy.frombuffer(zlib.decompress(buffer), dtype=numpy.uint8)
+        bits = numpy.unpackbits(
+            packed.reshape(dtype.itemsize * 8, -1), axis=1)
+        deltas = numpy.ascontiguousarray(
+            numpy.packbits(bits[:, :number_of_samples].T, axis=1))
+        return numpy.cumsum(deltas.view(dtype).ravel(), dtype=dtype)
+
+
+_codecs = {}
+
+
+def register_codec(codec_type):
+    """
+    Registers a codec under its name, so archives that use it can be
+    read.
+
+    Args:
+        codec_type (type): Specifies a subclass of Codec that can be
+            created without arguments.
+    """
+    _codecs[codec_type.name] = codec_type
+
+
+for _codec_type in (RawCodec, ZlibCodec, LzmaCodec, DeltaBitShuffleCodec):
+    register_codec(_codec_type)
+
+
+def _get_codec(codec):
+    if isinstance(codec, Codec):
+        return codec
+
+    try:
+        return _codecs[codec]()
+    except KeyError:
+        raise DaqError(
+            'The codec is not registered.\n\n'
+            'Codec: {0}\n'
+            'Registered codecs: {1}'.format(codec, sorted(_codecs)),
+            Errors.UNKNOWN.value)
+
+
+class ArchiveWriter(object):
+    """
+    Writes samples to a compressed archive on a worker thread.
+
+    The samples of each channel are stored as a separate column, split
+    into chunks of a fixed number of samples that are compressed
+    independently, so that a range of samples can be read back by
+    decompressing only the chunks that hold it. An index of the chunks
+    is written at the end of the file by "flush" and "close".
+
+    "append" only copies the samples and queues them, so the read loop
+    is not delayed by compression or disk writes unless the worker
+    thread falls more than "max_queued_blocks" blocks behind.
+
+    Example:
+        >>> with ArchiveWriter.from_task(task, 'run.arch') as archive:
+        ...     while running:
+        ...         reader.read_many_sample(data, 1000)
+        ...         archive.append(data)
+    """
+
+    def __init__(self, file_path, channel_names, dtype=numpy.float64,
+                 codec='zlib', chunk_size=65536, sample_rate=0.0,
+                 start_time=None, metadata=None, max_queued_blocks=64):
+        """
+        Args:
+            file_path (str): Specifies the path to the file, which is
+                created or replaced.
+            channel_names (List[str]): Specifies the names of the
+                channels whose samples the archive holds.
+            dtype (Optional[numpy.dtype]): Specifies the data type of
+                the samples.
+            codec (Optional[Union[str, Codec]]): Specifies the codec, or
+                the name of a registered codec, that compresses the
+                chunks.
+            chunk_size (Optional[int]): Specifies the number of samples
+                per channel in each chunk.
+            sample_rate (Optional[float]): Specifies the sample rate in
+                samples per channel per second, which "read_time_range"
+                uses to locate samples.
+            start_time (Optional[float]): Specifies the time the first
+                sample was acquired, in seconds since the epoch. By
+                default, the time the archive is created.
+            metadata (Optional[dict]): Specifies additional information
+                to record in the archive. Must be serializable to JSON.
+            max_queued_blocks (Optional[int]): Specifies the number of
+                blocks "append" queues before waiting for the worker
+                thread.
+        """
+        self._file_path = file_path
+        self._channel_names = list(channel_names)
+        self._dtype = numpy.dtype(dtype)
+        self._codec = _get_codec(codec)
+        self._chunk_size = chunk_size
+        self._info = {
+            'channel_names': self._channel_names,
+            'dtype': self._dtype.str,
+            'codec': self._codec.name,
+            'chunk_size': chunk_size,
+            'sample_rate': sample_rate,
+            'start_time': time.time() if start_time is None else start_time,
+            'metadata': metadata or {},
+        }
+
+        self._file = io.open(file_path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION))
+
+        # One list of [first sample, number of samples, offset, length]
+        # per channel.
+        self._chunks = [[] for _ in self._channel_names]
+        self._pending = []
+        self._pending_samples = 0
+        self._samples_written = 0
+        self._samples_appended = 0
+
+        self._queue = queue.Queue(max_queued_blocks)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name='ArchiveWriter')
+        self._thread.daemon = True
+        self._thread.start()
+
+    @classmethod
+    def from_task(cls, task, file_path, dtype=numpy.float64, **kwargs):
+        """
+        Creates an archive for the samples read from a task, recording
+        the names of the channels to read and the timing of the task.
+
+        If dtype is an integer type and the task has analog input
+        channels, the offset and code width of each channel are also
+        recorded, so that "read" can scale the samples.
+
+        Args:
+            task (artdaq.task.Task): Specifies the task whose samples to
+                archive.
+            file_path (str): Specifies the path to the file.
+            dtype (Optional[numpy.dtype]): Specifies the data type of
+                the samples.
+            kwargs: Specifies the other arguments of ArchiveWriter.
+        Returns:
+            ArchiveWriter:
+
+            Indicates the new archive.
+        """
+        from artdaq.constants import ChannelType
+        from artdaq.scaling import AIRawScaler
+
+        timing = task.timing
+        metadata = dict(kwargs.pop('metadata', None) or {})
+        metadata.setdefault('task_name', task.name)
+        metadata.setdefault('task_channel_names', task.channel_names)
+        if timing.samp_quant_samp_mode is not None:
+            metadata.setdefault(
+                'sample_mode', timing.samp_quant_samp_mode.name)
+            metadata.setdefault(
+                'samples_per_channel', timing.samp_quant_samp_per_chan)
+        if timing.samp_clk_src is not None:
+            metadata.setdefault('sample_clock_source', timing.samp_clk_src)
+
+        if (numpy.dtype(dtype).kind in 'iu' and
+                task.task_type == ChannelType.ANALOG_INPUT):
+            scaler = AIRawScaler(task, timing.samp_clk_rate or 0.0)
+            metadata.setdefault('offsets', scaler.offsets.ravel().tolist())
+            metadata.setdefault(
+                'code_widths', scaler.code_widths.ravel().tolist())
+
+        kwargs.setdefault('sample_rate', timing.samp_clk_rate or 0.0)
+
+        return cls(file_path, task._metadata.read_channel_names, dtype,
+                   metadata=metadata, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def file_path(self):
+        """
+        str: Indicates the path to the file.
+        """
+        return self._file_path
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the channels whose samples the
+            archive holds.
+        """
+        return self._channel_names
+
+    @property
+    def samples_per_channel(self):
+        """
+        int: Indicates the number of samples per channel appended.
+        """
+        return self._samples_appended
+
+    def append(self, data):
+        """
+        Copies samples and queues them to be written.
+
+        Args:
+            data (numpy.ndarray): Specifies the samples, as a 2D array
+                with one row per channel or, if the archive holds one
+                channel, a 1D array of samples.
+        """
+        self._verify_open()
+        self._raise_error()
+
+        data = numpy.array(data, dtype=self._dtype, ndmin=2)
+        if data.shape[0] != len(self._channel_names):
+            raise DaqError(
+                'Samples cannot be archived, because the number of rows '
+                'does not match the number of channels in the archive.\n\n'
+                'Number of rows: {0}\n'
+                'Number of channels: {1}'.format(
+                    data.shape[0], len(self._channel_names)),
+                Errors.UNKNOWN.value)
+
+        self._samples_appended += data.shape[1]
+        self._queue.put(data)
+
+    def flush(self):
+        """
+        Waits for the worker thread to write the samples queued so far,
+        including a partial last chunk, and writes the index, so that
+        the archive can be read even if the writer never closes.
+        """
+        self._verify_open()
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_error()
+
+    def close(self):
+        """
+        Writes the samples queued so far and the index, and closes the
+        file.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._file.close()
+        self._raise_error()
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _verify_open(self):
+        if self._thread is None:
+            raise DaqError(
+                'The archive writer was closed.', Errors.UNKNOWN.value)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if self._error is not None:
+                    pass
+                elif isinstance(item, numpy.ndarray):
+                    self._pending.append(item)
+                    self._pending_samples += item.shape[1]
+                    if self._pending_samples >= self._chunk_size:
+                        self._write_chunks(final=False)
+                else:
+                    self._write_chunks(final=True)
+                    self._write_index()
+            except Exception as e:
+                self._error = e
+            finally:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+            if item is None:
+                return
+
+    def _write_chunks(self, final):
+        if not self._pending:
+            return
+
+        pending = numpy.concatenate(self._pending, axis=1)
+        if final:
+            end = pending.shape[1]
+        else:
+            end = pending.shape[1] // self._chunk_size * self._chunk_size
+
+        for start in range(0, end, self._chunk_size):
+            chunk = pending[:, start:start + self._chunk_size]
+            for channel_index, samples in enumerate(chunk):
+                encoded = self._codec.encode(numpy.ascontiguousarray(samples))
+                self._chunks[channel_index].append(
+                    [self._samples_written, chunk.shape[1],
+                     self._file.tell(), len(encoded)])
+                self._file.write(encoded)
+            self._samples_written += chunk.shape[1]
+
+        remainder = pending[:, end:]
+        self._pending = [remainder] if remainder.shape[1] else []
+        self._pending_samples = remainder.shape[1]
+
+    def _write_index(self):
+        info = dict(self._info)
+        info['samples_per_channel'] = self._samples_written
+        info['chunks'] = self._chunks
+
+        encoded = json.dumps(info).encode('utf-8')
+        offset = self._file.tell()
+        self._file.write(encoded)
+        self._file.write(_FOOTER.pack(offset, len(encoded), _MAGIC))
+        self._file.flush()
+
+
+class ArchiveReader(object):
+    """
+    Reads ranges of samples from an archive written by ArchiveWriter,
+    decompressing only the chunks that hold them.
+    """
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Specifies the path to the file.
+        """
+        self._file_path = file_path
+        self._file = io.open(file_path, 'rb')
+
+        header = self._file.read(_HEADER.size)
+        footer = b''
+        if len(header) == _HEADER.size:
+            self._file.seek(-_FOOTER.size, io.SEEK_END)
+            footer = self._file.read(_FOOTER.size)
+
+        if (len(footer) != _FOOTER.size or
+                _HEADER.unpack(header) != (_MAGIC, _FORMAT_VERSION) or
+                _FOOTER.unpack(footer)[2] != _MAGIC):
+            self._file.close()
+            raise DaqError(
+                'The file is not an archive, was not flushed or closed, or '
+                'was written by an unsupported version of ArtDAQ.\n\n'
+                'File: {0}'.format(file_path),
+                Errors.UNKNOWN.value)
+
+        offset, length, _ = _FOOTER.unpack(footer)
+        self._file.seek(offset)
+        self._info = json.loads(self._file.read(length).decode('utf-8'))
+
+        self._dtype = numpy.dtype(self._info['dtype'])
+        self._codec = _get_codec(self._info['codec'])
+        self._first_samples = [
+            [chunk[0] for chunk in chunks] for chunks in self._info['chunks']]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the channels whose samples the
+            archive holds.
+        """
+        return self._info['channel_names']
+
+    @property
+    def dtype(self):
+        """
+        numpy.dtype: Indicates the data type of the samples.
+        """
+        return self._dtype
+
+    @property
+    def sample_rate(self):
+        """
+        float: Indicates the sample rate in samples per channel per
+            second.
+        """
+        return self._info['sample_rate']
+
+    @property
+    def start_time(self):
+        """
+        float: Indicates the time the first sample was acquired, in
+            seconds since the epoch.
+        """
+        return self._info['start_time']
+
+    @property
+    def samples_per_channel(self):
+        """
+        int: Indicates the number of samples per channel in the archive.
+        """
+        return self._info['samples_per_channel']
+
+    @property
+    def metadata(self):
+        """
+        dict: Indicates the additional information recorded in the
+            archive.
+        """
+        return self._info['metadata']
+
+    def read(self, start=0, stop=None, channels=None, scaled=False):
+        """
+        Reads a range of samples.
+
+        Args:
+            start (Optional[int]): Specifies the index of the first
+                sample per channel to read.
+            stop (Optional[int]): Specifies the index after the last
+                sample per channel to read. By default, reads to the end
+                of the archive.
+            channels (Optional[List[str]]): Specifies the names of the
+                channels to read. By default, reads all channels.
+            scaled (Optional[bool]): Specifies whether to scale integer
+                samples with the offsets and code widths recorded by
+                ArchiveWriter.from_task.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a 2D array of the samples, with one row per
+            channel.
+        """
+        start, stop, _ = slice(start, stop).indices(self.samples_per_channel)
+        stop = max(start, stop)
+
+        if channels is None:
+            channel_indices = list(range(len(self.channel_names)))
+        else:
+            channel_indices = [self._channel_index(name) for name in channels]
+
+        data = numpy.empty((len(channel_indices), stop - start),
+                           dtype=self._dtype)
+        for row, channel_index in enumerate(channel_indices):
+            self._read_channel(channel_index, start, stop, data[row])
+
+        if not scaled:
+            return data
+
+        code_widths = self.metadata.get('code_widths')
+        if code_widths is None:
+            return data.astype(numpy.float64)
+
+        offsets = numpy.array(self.metadata['offsets'])[channel_indices]
+        code_widths = numpy.array(code_widths)[channel_indices]
+        scaled_data = numpy.multiply(data, code_widths[:, numpy.newaxis])
+        scaled_data += offsets[:, numpy.newaxis]
+        return scaled_data
+
+    def read_time_range(self, start_time, end_time, channels=None,
+                        scaled=False):
+        """
+        Reads the samples acquired in a range of time, located with the
+        sample rate recorded in the archive.
+
+        Args:
+            start_time (float): Specifies the start of the range, in
+                seconds since the first sample.
+            end_time (float): Specifies the end of the range, in seconds
+                since the first sample.
+            channels (Optional[List[str]]): Specifies the names of the
+                channels to read. By default, reads all channels.
+            scaled (Optional[bool]): Specifies whether to scale integer
+                samples. See the "read" method for more info.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a 2D array of the samples, with one row per
+            channel.
+        """
+        if not self.sample_rate:
+            raise DaqError(
+                'Samples cannot be located by time, because the archive '
+                'does not record the sample rate.\n\n'
+                'File: {0}'.format(self._file_path),
+                Errors.UNKNOWN.value)
+
+        start = max(0, int(numpy.ceil(start_time * self.sample_rate)))
+        stop = max(0, int(numpy.ceil(end_time * self.sample_rate)))
+        return self.read(start, stop, channels, scaled)
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        self._file.close()
+
+    def _channel_index(self, channel_name):
+        try:
+            return self.channel_names.index(channel_name)
+        except ValueError:
+            raise DaqError(
+                'The archive does not hold the channel.\n\n'
+                'File: {0}\n'
+                'Channel: {1}\n'
+                'Channels in archive: {2}'.format(
+                    self._file_path, channel_name, self.channel_names),
+                Errors.UNKNOWN.value)
+
+    def _read_channel(self, channel_index, start, stop, out):
+        chunks = self._info['chunks'][channel_index]
+        first = max(
+            0, bisect.bisect_right(self._first_samples[channel_index],
+                                   start) - 1)
+
+        for first_sample, number_of_samples, offset, length in (
+                chunks[first:]):
+            if first_sample >= stop:
+                break
+
+            self._file.seek(offset)
+            samples = self._codec.decode(
+                self._file.read(length), self._dtype, number_of_samples)
+
+            begin = max(start, first_sample)
+            end = min(stop, first_sample + number_of_samples)
+            out[begin - start:end - start] = (
+                samples[begin - first_sample:end - first_sample])
@@ -0,0 +1,385 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+from artdaq._block_processor import BlockProcessor
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+__all__ = ['CICDecimator', 'FIRDecimator', 'MultiStageDecimator',
+           'design_lowpass']
+
+
+def design_lowpass(numtaps, cutoff):
+    """
+    Designs a linear phase low-pass FIR filter with the window method,
+    using a Hamming window.
+
+    Args:
+        numtaps (int): Specifies the number of coefficients.
+        cutoff (float): Specifies the cutoff frequency in cycles per
+            sample, between 0 and 0.5.
+    Returns:
+        numpy.ndarray:
+
+        Indicates the coefficients, normalized to unity gain at DC.
+    """
+    if numtaps < 1 or not 0 < cutoff <= 0.5:
+        raise DaqError(
+            'The filter must have at least one coefficient and a cutoff '
+            'frequency between 0 and 0.5 cycles per sample.\n'
+            'Number of coefficients: {0}\nCutoff frequency: {1}'
+            .format(numtaps, cutoff), Errors.UNKNOWN.value)
+
+    n = numpy.arange(numtaps) - (numtaps - 1) / 2.0
+    taps = 2 * cutoff * numpy.sinc(2 * cutoff * n) * numpy.hamming(numtaps)
+    return taps / taps.sum()
+
+
+def _factorize(factor, max_stage_factor):
+    """
+    Splits a decimation factor into stage factors no larger than
+    max_stage_factor, largest first.
+    """
+    stage_factors = []
+    remaining = factor
+    while remaining > 1:
+        for stage_factor in range(min(remaining, max_stage_factor), 1, -1):
+            if remaining % stage_factor == 0:
+                break
+        else:
+            raise DaqError(
+                'The decimation factor cannot be split into stages no '
+                'larger than the maximum stage factor.\n'
+                'Decimation factor: {0}\nMaximum stage factor: {1}'
+                .format(factor, max_stage_factor), Errors.UNKNOWN.value)
+        stage_factors.append(stage_factor)
+        remaining //= stage_factor
+    return stage_factors
+
+
+class _DecimatorBase(BlockProcessor):
+    """
+    Defines the output queue that all decimators share.
+
+    Subclasses implement "_decimate", which filters and decimates a 2D
+    block of the selected channels, carrying the filter state across
+    calls, and "_reset_state".
+    """
+
+    def __init__(self, factor, channels=None):
+        if factor < 1:
+            raise DaqError(
+                'The decimation factor must be at least 1.\n'
+                'Decimation factor: {0}'.format(factor),
+                Errors.UNKNOWN.value)
+
+        super(_DecimatorBase, self).__init__(channels)
+        self._factor = factor
+        self._lock = threading.Lock()
+        self._pending = []
+        self._output_rows = 0
+
+    @property
+    def factor(self):
+        """
+        int: Indicates the overall decimation factor.
+        """
+        return self._factor
+
+    def process(self, data):
+        """
+        Filters and decimates a block of samples, continuing from the
+        previous block.
+
+        Args:
+            data (numpy.ndarray): Specifies the block, with one row per
+                channel the reader reads, or a 1D array for a single
+                channel.
+        Returns:
+            numpy.ndarray:
+
+            Indicates the decimated samples of the selected channels,
+            with one row per channel, or a 1D array if data is 1D.
+        """
+        output = self._decimate(self._select(data))
+        return output[0] if data.ndim == 1 else output
+
+    def reset(self):
+        """
+        Clears the filter state and the decimated samples not yet read,
+        for example before the task is restarted.
+        """
+        with self._lock:
+            self._pending = []
+        self._reset_state()
+
+    def read(self):
+        """
+        Returns the decimated samples of the blocks read since the last
+        call, when attached to a reader.
+
+        Returns:
+            numpy.ndarray:
+
+            Indicates the decimated samples, with one row per selected
+            channel.
+        """
+        self._raise_error()
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return numpy.zeros((self._output_rows, 0))
+        if len(pending) == 1:
+            return pending[0]
+        return numpy.concatenate(pending, axis=1)
+
+    def _on_block(self, data):
+        output = self._decimate(self._select(data))
+        with self._lock:
+            self._output_rows = output.shape[0]
+            if output.shape[1]:
+                self._pending.append(output)
+
+
+class FIRDecimator(_DecimatorBase):
+    """
+    Low-pass filters and decimates a stream of samples with an FIR
+    filter, block by block.
+
+    Only the output samples that are kept are computed, which is what a
+    polyphase implementation achieves: each is the dot product of the
+    filter with the last "numtaps" input samples, taken as a strided view
+    of the block and the samples kept from the previous block, so the
+    cost per input sample is numtaps / factor multiplications for every
+    channel at once. The output is the same as filtering the whole
+    stream and keeping every factor-th sample, regardless of how the
+    stream is split into blocks.
+    """
+
+    def __init__(self, factor, numtaps=None, taps=None, channels=None):
+        """
+        Args:
+            factor (int): Specifies the decimation factor.
+            numtaps (Optional[int]): Specifies the number of coefficients
+                of the anti-alias filter to design. The default is
+                20 * factor + 1.
+            taps (Optional[numpy.ndarray]): Specifies the coefficients of
+                the filter to use instead of designing one.
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels the reader reads, to decimate. None decimates every
+                channel.
+        """
+        super(FIRDecimator, self).__init__(factor, channels)
+        if taps is None:
+            if numtaps is None:
+                numtaps = 20 * factor + 1
+            taps = design_lowpass(numtaps, 0.5 / factor)
+        self._taps = numpy.asarray(taps, dtype=numpy.float64)
+        if self._taps.ndim != 1 or not len(self._taps):
+            raise DaqError(
+                'The filter coefficients must be a non-empty 1D array.',
+                Errors.UNKNOWN.value)
+        self._reversed_taps = numpy.ascontiguousarray(self._taps[::-1])
+        self._reset_state()
+
+    @property
+    def taps(self):
+        """
+        numpy.ndarray: Indicates the coefficients of the filter.
+        """
+        return self._taps
+
+    def _reset_state(self):
+        self._history = None
+        self._phase = 0
+
+    def _decimate(self, data):
+        number_of_taps = len(self._taps)
+        if self._history is None:
+            self._history = numpy.zeros(
+                (data.shape[0], number_of_taps - 1))
+        self._verify_number_of_channels(
+            self._history.shape[0], data.shape[0])
+
+        number_of_samples = data.shape[1]
+        extended = numpy.concatenate(
+            (self._history, numpy.asarray(data, dtype=numpy.float64)),
+            axis=1)
+
+        # Window i holds the input samples up to sample i of the block.
+        row_stride, sample_stride = extended.strides
+        windows = as_strided(
+            extended, shape=(data.shape[0], number_of_samples, number_of_taps),
+            strides=(row_stride, sample_stride, sample_stride),
+            writeable=False)
+        output = windows[:, self._phase::self._factor].dot(
+            self._reversed_taps)
+
+        self._phase = (self._phase - number_of_samples) % self._factor
+        self._history = extended[
+            :, extended.shape[1] - number_of_taps + 1:].copy()
+        return output
+
+
+class CICDecimator(_DecimatorBase):
+    """
+    Decimates a stream of samples with a cascaded integrator-comb (CIC)
+    filter, block by block.
+
+    A CIC filter of N stages is N moving sums of factor * differential
+    delay samples, which take a few additions per sample whatever the
+    decimation factor is, making it suited to large factors. Its pass
+    band droops, so it is usually followed by a short FIR stage with a
+    small factor, for example with MultiStageDecimator. The output is
+    scaled to unity gain at DC.
+    """
+
+    def __init__(self, factor, stages=3, differential_delay=1, channels=None):
+        """
+        Args:
+            factor (int): Specifies the decimation factor.
+            stages (Optional[int]): Specifies the number of integrator and
+                comb stages. More stages attenuate aliases more.
+            differential_delay (Optional[int]): Specifies the differential
+                delay of the combs, usually 1 or 2.
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels the reader reads, to decimate. None decimates every
+                channel.
+        """
+        super(CICDecimator, self).__init__(factor, channels)
+        if stages < 1 or differential_delay < 1:
+            raise DaqError(
+                'A CIC filter must have at least one stage and a '
+                'differential delay of at least 1.\nStages: {0}\n'
+                'Differential delay: {1}'.format(stages, differential_delay),
+                Errors.UNKNOWN.value)
+        self._stages = stages
+        self._differential_delay = differential_delay
+        self._length = factor * differential_delay
+        self._gain = float(self._length) ** stages
+        self._reset_state()
+
+    @property
+    def stages(self):
+        """
+        int: Indicates the number of integrator and comb stages.
+        """
+        return self._stages
+
+    @property
+    def differential_delay(self):
+        """
+        int: Indicates the differential delay of the combs.
+        """
+        return self._differential_delay
+
+    def _reset_state(self):
+        self._histories = None
+        self._phase = 0
+
+    def _decimate(self, data):
+        length = self._length
+        if self._histories is None:
+            self._histories = [numpy.zeros((data.shape[0], length - 1))
+                               for _ in range(self._stages)]
+        self._verify_number_of_channels(
+            self._histories[0].shape[0], data.shape[0])
+
+        number_of_samples = data.shape[1]
+        stage_output = numpy.asarray(data, dtype=numpy.float64)
+        for index, history in enumerate(self._histories):
+            extended = numpy.concatenate((history, stage_output), axis=1)
+            self._histories[index] = extended[
+                :, extended.shape[1] - length + 1:].copy()
+
+            # The integrator restarts at every block, which keeps the
+            # rounding error of the running sum bounded.
+            integrated = numpy.zeros(
+                (extended.shape[0], extended.shape[1] + 1))
+            numpy.cumsum(extended, axis=1, out=integrated[:, 1:])
+            stage_output = integrated[:, length:] - integrated[:, :-length]
+
+        output = stage_output[:, self._phase::self._factor] / self._gain
+        self._phase = (self._phase - number_of_samples) % self._factor
+        return output
+
+
+class MultiStageDecimator(_DecimatorBase):
+    """
+    Decimates a stream of samples with several decimators in cascade.
+
+    Decimating by a large factor in stages needs far fewer filter
+    coefficients than a single FIR filter with the same transition band,
+    because each later stage runs at the reduced rate of the stage
+    before it. Use "design" to split a factor into FIR stages.
+    """
+
+    def __init__(self, stages, channels=None):
+        """
+        Args:
+            stages (Sequence[Union[artdaq.decimation.FIRDecimator, artdaq.decimation.CICDecimator]]):
+                Specifies the decimators, in the order they are applied.
+                Their own channel selection is ignored.
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels the reader reads, to decimate. None decimates every
+                channel.
+        """
+        stages = tuple(stages)
+        if not stages:
+            raise DaqError(
+                'A multi-stage decimator needs at least one stage.',
+                Errors.UNKNOWN.value)
+        factor = 1
+        for stage in stages:
+            factor *= stage.factor
+        super(MultiStageDecimator, self).__init__(factor, channels)
+        self._stages = stages
+
+    @classmethod
+    def design(cls, factor, max_stage_factor=8, channels=None):
+        """
+        Creates a multi-stage decimator of FIR stages whose factors
+        multiply to factor, each no larger than max_stage_factor.
+
+        Args:
+            factor (int): Specifies the overall decimation factor.
+            max_stage_factor (Optional[int]): Specifies the largest
+                decimation factor of a stage.
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels the reader reads, to decimate. None decimates every
+                channel.
+        Returns:
+            artdaq.decimation.MultiStageDecimator:
+
+            Indicates the decimator.
+        """
+        stage_factors = _factorize(factor, max_stage_factor) or [1]
+        return cls([FIRDecimator(stage_factor)
+                    for stage_factor in stage_factors], channels=channels)
+
+    @property
+    def stages(self):
+        """
+        Tuple[Union[artdaq.decimation.FIRDecimator, artdaq.decimation.CICDecimator]]:
+            Indicates the decimators, in the order they are applied.
+        """
+        return self._stages
+
+    def _reset_state(self):
+        for stage in self._stages:
+            stage._reset_state()
+
+    def _decimate(self, data):
+        for stage in self._stages:
+            data = stage._decimate(data)
+        return data
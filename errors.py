@@ -4,11 +4,17 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import ctypes
+import threading
+import time
 import warnings
 
 from artdaq.error_codes import Errors, Warnings
 
-__all__ = ['DaqError', 'DaqWarning', 'DaqResourceWarning']
+__all__ = ['DaqError', 'DaqWarning', 'DaqResourceWarning',
+           'configure_warnings', 'get_warning_counts',
+           'reset_warning_counts']
+
+_ERROR_BUFFER_SIZE = 2048
 
 
 class Error(Exception):
@@ -72,9 +78,9 @@ class DaqWarning(Warning):
         self._error_code = error_code
 
         try:
-            self._error_type = DaqWarning(self._error_code)
+            self._error_type = Warnings(self._error_code)
         except ValueError:
-            self._error_type = DaqWarning.UNKNOWN
+            self._error_type = Warnings.UNKNOWN
 
     @property
     def error_code(self):
@@ -111,34 +117,172 @@ warnings.filterwarnings("always", category=DaqWarning)
 warnings.filterwarnings("always", category=DaqResourceWarning)
 
 
-def check_for_error(error_code):
-    from artdaq._lib import lib_importer
+class _WarningRegistry(object):
+    """
+    Counts the warnings returned by Art-DAQ functions and decides which
+    of them are reported through the warnings module.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._min_interval = 0.0
+        self._report = True
+        self._counts = {}
+        self._last_reported = {}
+        self._suppressed = {}
+
+    def configure(self, min_interval, report):
+        with self._lock:
+            self._min_interval = float(min_interval)
+            self._report = report
+            self._last_reported.clear()
+
+    def counts(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._last_reported.clear()
+            self._suppressed.clear()
+
+    def record(self, error_code):
+        """
+        Counts an occurrence of a warning.
+
+        Returns:
+            Optional[int]: Indicates the number of occurrences of the
+            warning suppressed since it was last reported, or None if
+            this occurrence is not to be reported.
+        """
+        with self._lock:
+            self._counts[error_code] = self._counts.get(error_code, 0) + 1
+
+            if not self._report:
+                return None
+
+            if self._min_interval > 0:
+                now = time.time()
+                last_reported = self._last_reported.get(error_code)
+                if (last_reported is not None and
+                        now - last_reported < self._min_interval):
+                    self._suppressed[error_code] = (
+                        self._suppressed.get(error_code, 0) + 1)
+                    return None
+                self._last_reported[error_code] = now
+
+            return self._suppressed.pop(error_code, 0)
+
+
+_warning_registry = _WarningRegistry()
+_error_strings = {}
+_local = threading.local()
+
+
+def configure_warnings(min_interval=0.0, report=True):
+    """
+    Specifies how warnings returned by Art-DAQ functions are reported.
+
+    Every warning is counted regardless of these settings. Use
+    "get_warning_counts" to retrieve the counts, for example to report
+    them once at the end of a continuous acquisition.
+
+    Args:
+        min_interval (Optional[float]): Specifies the minimum time in
+            seconds between two reports of the same warning. Occurrences
+            within this time are counted and summarized in the next
+            report. The default of 0 reports every occurrence.
+        report (Optional[bool]): Specifies whether to report warnings
+            through the warnings module at all. If False, warnings are
+            only counted.
+    """
+    _warning_registry.configure(min_interval, report)
+
+
+def get_warning_counts():
+    """
+    Returns the number of times each warning was returned by Art-DAQ
+    functions since the counts were last reset.
+
+    Returns:
+        Dict[int, int]: Indicates the number of occurrences, keyed by
+        warning code.
+    """
+    return _warning_registry.counts()
+
+
+def reset_warning_counts():
+    """
+    Resets the warning counts and the rate limiting of warning reports.
+    """
+    _warning_registry.reset()
 
+
+def _get_error_buffer():
+    """
+    Returns the string buffer of the calling thread used to retrieve
+    error messages.
+    """
+    error_buffer = getattr(_local, 'error_buffer', None)
+    if error_buffer is None:
+        error_buffer = ctypes.create_string_buffer(_ERROR_BUFFER_SIZE)
+        _local.error_buffer = error_buffer
+    return error_buffer
+
+
+def _get_error_string(error_code):
+    """
+    Returns the description of an error or warning code. Descriptions
+    do not change, so they are retrieved once per code and cached.
+    """
+    message = _error_strings.get(error_code)
+    if message is None:
+        from artdaq._lib import lib_importer
+
+        error_buffer = _get_error_buffer()
+
+        cfunc = lib_importer.windll.ArtDAQ_GetErrorString
+        if cfunc.argtypes is None:
+            with cfunc.arglock:
+                if cfunc.argtypes is None:
+                    cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                      ctypes.c_uint]
+        cfunc(error_code, error_buffer, _ERROR_BUFFER_SIZE)
+
+        message = error_buffer.value.decode("utf-8")
+        _error_strings[error_code] = message
+    return message
+
+
+def check_for_error(error_code):
     if error_code < 0:
-        error_buffer = ctypes.create_string_buffer(2048)
+        from artdaq._lib import lib_importer
+
+        # The extended error information describes the last error of the
+        # calling thread, so it cannot be cached.
+        error_buffer = _get_error_buffer()
 
         cfunc = lib_importer.windll.ArtDAQ_GetExtendedErrorInfo
         if cfunc.argtypes is None:
             with cfunc.arglock:
                 if cfunc.argtypes is None:
                     cfunc.argtypes = [ctypes.c_char_p, ctypes.c_uint]
-        cfunc(error_buffer, 2048)
+        cfunc(error_buffer, _ERROR_BUFFER_SIZE)
 
         raise DaqError(error_buffer.value.decode("utf-8"), error_code)
 
     elif error_code > 0:
-        error_buffer = ctypes.create_string_buffer(2048)
+        suppressed = _warning_registry.record(error_code)
+        if suppressed is None:
+            return
 
-        cfunc = lib_importer.windll.ArtDAQ_GetErrorString
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p,
-                                      ctypes.c_uint]
-        cfunc(error_code, error_buffer, 2048)
+        message = _get_error_string(error_code)
+        if suppressed:
+            message = '{0}\n\n{1} more occurrences were suppressed.'.format(
+                message, suppressed)
 
-        warnings.warn(DaqWarning(
-            error_buffer.value.decode("utf-8"), error_code))
+        warnings.warn(DaqWarning(message, error_code))
 
 
 def is_string_buffer_too_small(error_code):
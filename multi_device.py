@@ -0,0 +1,367 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import time
+
+import numpy
+from artdaq._task_modules.read_functions import _read_analog_f_64
+from artdaq.constants import AcquisitionType
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.task import Task
+from artdaq.types import (
+    AcquiredBlock, DeviceReaderStatistics, MultiDeviceStatistics)
+from artdaq.utils import flatten_channel_string, unflatten_channel_string
+
+__all__ = ['MultiDeviceAcquisition']
+
+
+class _Block(object):
+    """
+    Tracks the reads of one block by the device reader threads.
+    """
+    __slots__ = ['slot', 'remaining']
+
+    def __init__(self, slot, remaining):
+        self.slot = slot
+        self.remaining = remaining
+
+
+class MultiDeviceAcquisition(object):
+    """
+    Acquires the same analog input channels from several devices, one
+    task per device, and merges the samples into a single stream.
+
+    Each task is read by its own thread, which calls the driver without
+    holding the GIL, so the devices are read in parallel. Every thread
+    reads its block of "samples_per_read" samples per channel directly
+    into its rows of a preallocated (channels x samples) array from a
+    pool of "pool_size" arrays, and the block is delivered once every
+    device has filled it.
+
+    If every array of the pool is still waiting to be read when the
+    devices start a new block, the block is read into scratch buffers
+    and dropped, so that the device buffers do not overflow. Use
+    "statistics" to see how many blocks were dropped and how far each
+    device lags behind the fastest one.
+    """
+
+    def __init__(self, devices, channels, rate, samples_per_read,
+                 buffer_size=None, pool_size=4, timeout=10.0,
+                 channel_method='add_ai_voltage_chan', **channel_kwargs):
+        """
+        Args:
+            devices (Sequence[str]): Specifies the names of the devices,
+                such as ["Dev1", "Dev2"].
+            channels (str): Specifies the physical channels to use on
+                every device, without the device name, such as "ai0:7".
+            rate (float): Specifies the sample rate of every device in
+                samples per channel per second.
+            samples_per_read (int): Specifies the number of samples per
+                channel in each block.
+            buffer_size (Optional[int]): Specifies the number of samples
+                per channel of the buffer of each task. The default is
+                10 blocks.
+            pool_size (Optional[int]): Specifies the number of merged
+                arrays, which is the maximum number of blocks waiting to
+                be read.
+            timeout (Optional[float]): Specifies the time in seconds each
+                reader thread waits for a block.
+            channel_method (Optional[str]): Specifies the method of
+                artdaq._task_modules.ai_channel_collection.
+                AIChannelCollection that creates the channels.
+            channel_kwargs: Specifies further arguments to pass to
+                channel_method, such as "min_val" and "max_val".
+        """
+        if not devices:
+            raise DaqError(
+                'At least one device is required.', Errors.UNKNOWN.value)
+        if buffer_size is None:
+            buffer_size = 10 * samples_per_read
+
+        self._devices = tuple(devices)
+        self._rate = rate
+        self._samples_per_read = samples_per_read
+        self._pool_size = pool_size
+        self._timeout = timeout
+
+        self._tasks = []
+        try:
+            for device in self._devices:
+                physical_channels = flatten_channel_string([
+                    '{0}/{1}'.format(device, channel)
+                    for channel in unflatten_channel_string(channels)])
+                task = Task()
+                self._tasks.append(task)
+                getattr(task.ai_channels, channel_method)(
+                    physical_channels, **channel_kwargs)
+                task.timing.cfg_samp_clk_timing(
+                    rate=rate, sample_mode=AcquisitionType.CONTINUOUS,
+                    samps_per_chan=buffer_size)
+        except BaseException:
+            for task in self._tasks:
+                task.close()
+            raise
+
+        # Each device fills a contiguous range of rows of the merged
+        # arrays.
+        self._row_ranges = []
+        channel_names = []
+        row = 0
+        for task in self._tasks:
+            names = task._metadata.channel_names
+            self._row_ranges.append((row, row + len(names)))
+            channel_names.extend(names)
+            row += len(names)
+        self._channel_names = tuple(channel_names)
+
+        shape = (len(channel_names), samples_per_read)
+        self._pool = [numpy.zeros(shape, dtype=numpy.float64)
+                      for _ in range(pool_size)]
+        self._scratch = [
+            numpy.zeros((stop - start, samples_per_read),
+                        dtype=numpy.float64)
+            for start, stop in self._row_ranges]
+
+        self._lock = threading.Lock()
+        self._ready_condition = threading.Condition(self._lock)
+        self._threads = []
+        self._stopping = False
+        self._error = None
+        self._reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def devices(self):
+        """
+        Tuple[str]: Indicates the names of the devices.
+        """
+        return self._devices
+
+    @property
+    def tasks(self):
+        """
+        Tuple[artdaq.task.Task]: Indicates the task of each device.
+        """
+        return tuple(self._tasks)
+
+    @property
+    def channel_names(self):
+        """
+        Tuple[str]: Indicates the names of the channels, in the order of
+            the rows of the merged arrays.
+        """
+        return self._channel_names
+
+    @property
+    def statistics(self):
+        """
+        artdaq.types.MultiDeviceStatistics: Indicates the number of
+            blocks delivered and dropped, and for each device the number
+            of blocks read, how many blocks it lags behind the fastest
+            device now and at most, and its mean read time in seconds.
+        """
+        with self._lock:
+            leader = max(self._device_blocks)
+            devices = tuple(
+                DeviceReaderStatistics(
+                    device, blocks, leader - blocks, max_lag,
+                    read_time / blocks if blocks else 0.0)
+                for device, blocks, max_lag, read_time in zip(
+                    self._devices, self._device_blocks, self._max_lags,
+                    self._read_times))
+            return MultiDeviceStatistics(
+                self._blocks_delivered, self._blocks_dropped, devices)
+
+    def start(self):
+        """
+        Starts the tasks and the reader threads.
+        """
+        if self._threads:
+            return
+
+        self._reset()
+        started = []
+        try:
+            for task in self._tasks:
+                task.start()
+                started.append(task)
+        except BaseException:
+            for task in started:
+                task.stop()
+            raise
+
+        self._stopping = False
+        for index in range(len(self._tasks)):
+            thread = threading.Thread(
+                target=self._run, args=(index,),
+                name='MultiDeviceReader-{0}'.format(self._devices[index]))
+            thread.daemon = True
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self):
+        """
+        Stops the reader threads after the blocks they are reading
+        complete, then stops the tasks.
+
+        Raises the exception that stopped a reader thread, if any.
+        """
+        self._stopping = True
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        try:
+            for task in self._tasks:
+                task.stop()
+        finally:
+            with self._lock:
+                error, self._error = self._error, None
+                self._ready_condition.notify_all()
+            if error is not None:
+                raise error
+
+    def close(self):
+        """
+        Stops the acquisition and closes the tasks.
+        """
+        try:
+            self.stop()
+        finally:
+            for task in self._tasks:
+                task.close()
+            self._tasks = []
+
+    def read(self, out=None, timeout=None):
+        """
+        Returns the oldest block that every device has filled.
+
+        Args:
+            out (Optional[numpy.ndarray]): Specifies a float64 array of
+                shape (channels, samples_per_read) to copy the samples
+                into. If None, a new array is returned.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a block. None waits indefinitely.
+        Returns:
+            artdaq.types.AcquiredBlock:
+
+            Indicates the sequence number of the block, the samples, and
+            the time at which the last device finished reading it.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._lock:
+            while not self._ready:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                if not self._threads:
+                    raise DaqError(
+                        'The acquisition is not running.',
+                        Errors.UNKNOWN.value)
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise DaqError(
+                            'No block became available within the timeout.',
+                            Errors.UNKNOWN.value)
+                self._ready_condition.wait(remaining)
+
+            sequence_number, slot, completion_time = self._ready.pop(0)
+
+        try:
+            if out is None:
+                out = self._pool[slot].copy()
+            else:
+                numpy.copyto(out, self._pool[slot])
+        finally:
+            with self._lock:
+                self._slot_busy[slot] = False
+
+        return AcquiredBlock(sequence_number, out, completion_time)
+
+    def _reset(self):
+        self._blocks = {}
+        self._ready = []
+        self._slot_busy = [False] * self._pool_size
+        self._blocks_delivered = 0
+        self._blocks_dropped = 0
+        self._device_blocks = [0] * len(self._devices)
+        self._max_lags = [0] * len(self._devices)
+        self._read_times = [0.0] * len(self._devices)
+
+    def _claim(self, sequence_number):
+        """
+        Returns the block with the given sequence number, assigning it an
+        array of the pool, or none if the pool is exhausted, when the
+        first device reaches it.
+        """
+        with self._lock:
+            block = self._blocks.get(sequence_number)
+            if block is None:
+                slot = sequence_number % self._pool_size
+                if self._slot_busy[slot]:
+                    slot = None
+                else:
+                    self._slot_busy[slot] = True
+                block = self._blocks[sequence_number] = _Block(
+                    slot, len(self._tasks))
+            return block
+
+    def _complete(self, index, sequence_number, block, read_time):
+        with self._lock:
+            self._device_blocks[index] = sequence_number + 1
+            self._read_times[index] += read_time
+            leader = max(self._device_blocks)
+            for device_index, device_blocks in enumerate(self._device_blocks):
+                lag = leader - device_blocks
+                if lag > self._max_lags[device_index]:
+                    self._max_lags[device_index] = lag
+
+            block.remaining -= 1
+            if block.remaining:
+                return
+            del self._blocks[sequence_number]
+
+            if block.slot is None:
+                self._blocks_dropped += 1
+            else:
+                self._blocks_delivered += 1
+                self._ready.append(
+                    (sequence_number, block.slot, time.time()))
+                self._ready_condition.notify_all()
+
+    def _run(self, index):
+        handle = self._tasks[index]._handle
+        start, stop = self._row_ranges[index]
+        scratch = self._scratch[index]
+        samples_per_read = self._samples_per_read
+        sequence_number = 0
+        try:
+            while not self._stopping:
+                block = self._claim(sequence_number)
+                if block.slot is None:
+                    read_array = scratch
+                else:
+                    read_array = self._pool[block.slot][start:stop]
+
+                read_start = time.time()
+                _read_analog_f_64(
+                    handle, read_array, samples_per_read, self._timeout)
+                self._complete(index, sequence_number, block,
+                               time.time() - read_start)
+                sequence_number += 1
+        except Exception as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+                self._ready_condition.notify_all()
@@ -0,0 +1,472 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import os
+import threading
+import time
+import traceback
+
+import numpy
+from six.moves import queue
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.types import ProcessingResult, ProcessingStatistics
+
+__all__ = ['ProcessingPool', 'SharedSlot']
+
+
+def _worker_main(shm_name, shape, dtype, slots, functions, task_queue,
+                 result_queue):
+    """
+    Runs the analysis functions of a processing pool in a worker process.
+
+    Each task names a slot of the shared memory ring and the number of
+    samples per channel it holds. The functions receive a read-only view
+    of those samples, and their results are sent back with the slot so
+    that the parent can recycle it.
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = None
+    try:
+        ring = numpy.ndarray((slots,) + shape, dtype=dtype, buffer=shm.buf)
+        ring.flags.writeable = False
+
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            sequence_number, slot, samples = task
+            block = ring[slot][..., :samples]
+            results = {}
+            error = None
+            try:
+                for name, function in functions:
+                    results[name] = function(block)
+            except Exception:
+                error = traceback.format_exc()
+            # Drops the view before the slot is reused.
+            del block
+
+            result_queue.put((sequence_number, slot, results, error))
+    finally:
+        del ring
+        shm.close()
+
+
+class SharedSlot(object):
+    """
+    Represents a slot of the shared memory ring of a ProcessingPool that
+    the caller fills and publishes.
+    """
+
+    __slots__ = ['_pool', '_index', '_data', '_published']
+
+    def __init__(self, pool, index, data):
+        self._pool = pool
+        self._index = index
+        self._data = data
+        self._published = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if not self._published:
+            if type is None:
+                self.publish()
+            else:
+                self.discard()
+
+    @property
+    def data(self):
+        """
+        numpy.ndarray: Indicates the array in shared memory to fill with
+            the samples of the block.
+        """
+        return self._data
+
+    @property
+    def index(self):
+        """
+        int: Indicates the index of the slot in the ring.
+        """
+        return self._index
+
+    def publish(self, number_of_samples_per_channel=None):
+        """
+        Passes the samples in the slot to the worker processes.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples per channel in the slot, if fewer than
+                the slot holds.
+        Returns:
+            int:
+
+            Indicates the sequence number of the block.
+        """
+        if number_of_samples_per_channel is None:
+            number_of_samples_per_channel = self._data.shape[-1]
+        self._published = True
+        self._data = None
+        return self._pool._publish(
+            self._index, number_of_samples_per_channel)
+
+    def discard(self):
+        """
+        Returns the slot to the pool without processing it.
+        """
+        self._published = True
+        self._data = None
+        self._pool._release_slot(self._index)
+
+
+class ProcessingPool(object):
+    """
+    Runs analysis functions on blocks of samples in worker processes,
+    so that processing can use several cores while the acquisition runs
+    in the main process.
+
+    Blocks are passed through a ring of slots in shared memory instead of
+    being pickled. The reader fills a free slot, preferably by reading
+    directly into it, and publishes it. A worker process runs every
+    registered function on a read-only view of the slot and sends back
+    only the results, after which the slot is free again. When every
+    slot is in use, "acquire_slot" and "submit" wait, which slows the
+    reader down to the rate at which the workers keep up; size "slots"
+    so that this does not happen for longer than the device buffer can
+    absorb.
+
+    The analysis functions take the block as a NumPy array shaped like
+    the slots and return a small, picklable result. They must be
+    picklable themselves, for example module-level functions, and must
+    not keep references to the block.
+    """
+
+    def __init__(self, shape, dtype=numpy.float64, slots=8, processes=None,
+                 context=None):
+        """
+        Args:
+            shape (Tuple[int]): Specifies the shape of each block, such
+                as (channels, samples per channel). Blocks may hold fewer
+                samples in the last dimension.
+            dtype (Optional[numpy.dtype]): Specifies the data type of the
+                samples.
+            slots (Optional[int]): Specifies the number of slots in the
+                shared memory ring.
+            processes (Optional[int]): Specifies the number of worker
+                processes. The default is the number of CPUs.
+            context (Optional[multiprocessing.context.BaseContext]):
+                Specifies the multiprocessing context with which to
+                create the worker processes and queues.
+        """
+        self._shape = tuple(shape)
+        self._dtype = numpy.dtype(dtype)
+        self._slots = slots
+        self._processes = processes or os.cpu_count() or 1
+        self._context = context
+
+        self._functions = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._shm = None
+        self._ring = None
+        self._workers = []
+        self._task_queue = None
+        self._result_queue = None
+        self._collector_thread = None
+        self._free_slots = queue.Queue()
+        self._results = queue.Queue()
+        self._callbacks = []
+
+        self._next_sequence_number = 0
+        self._blocks_submitted = 0
+        self._blocks_completed = 0
+        self._blocks_failed = 0
+        self._backpressure_waits = 0
+        self._max_slots_in_use = 0
+        self._total_latency = 0.0
+        self._pending = {}
+        self._error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def statistics(self):
+        """
+        artdaq.types.ProcessingStatistics: Indicates the number of
+            blocks submitted, completed and failed, the number of times
+            a submission waited for a free slot, the number of slots in
+            use now and at most, and the mean time in seconds from
+            publishing a block to receiving its results.
+        """
+        with self._lock:
+            in_use = self._slots - self._free_slots.qsize()
+            return ProcessingStatistics(
+                self._blocks_submitted, self._blocks_completed,
+                self._blocks_failed, self._backpressure_waits,
+                in_use if self._shm is not None else 0,
+                self._max_slots_in_use,
+                self._total_latency / self._blocks_completed
+                if self._blocks_completed else 0.0)
+
+    def register(self, name, function):
+        """
+        Registers an analysis function to run on every block.
+
+        Functions must be registered before the pool starts.
+
+        Args:
+            name (str): Specifies the key of the result of the function
+                in each ProcessingResult.
+            function (Callable[[numpy.ndarray], object]): Specifies the
+                function.
+        """
+        if self._shm is not None:
+            raise DaqError(
+                'Analysis functions cannot be registered while the '
+                'processing pool is running.', Errors.UNKNOWN.value)
+        self._functions[name] = function
+
+    def add_result_callback(self, callback):
+        """
+        Registers a function that is called with each ProcessingResult,
+        from a thread of the pool, instead of queuing the result for
+        "get_result".
+
+        If the function raises an exception, the next call to
+        "acquire_slot", "submit" or "get_result" raises it.
+
+        Args:
+            callback (Callable[[artdaq.types.ProcessingResult], None]):
+                Specifies the function.
+        """
+        self._callbacks.append(callback)
+
+    def start(self):
+        """
+        Allocates the shared memory ring and starts the worker processes.
+        """
+        if self._shm is not None:
+            return
+        if not self._functions:
+            raise DaqError(
+                'Register at least one analysis function before starting '
+                'the processing pool.', Errors.UNKNOWN.value)
+
+        import multiprocessing
+        from multiprocessing import shared_memory
+
+        context = self._context or multiprocessing.get_context()
+        slot_bytes = int(numpy.prod(self._shape)) * self._dtype.itemsize
+
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(slot_bytes * self._slots, 1))
+        self._ring = numpy.ndarray(
+            (self._slots,) + self._shape, dtype=self._dtype,
+            buffer=self._shm.buf)
+
+        self._free_slots = queue.Queue()
+        for slot in range(self._slots):
+            self._free_slots.put(slot)
+        self._pending = {}
+        self._total_latency = 0.0
+        self._error = None
+
+        self._task_queue = context.Queue()
+        self._result_queue = context.Queue()
+        functions = list(self._functions.items())
+        try:
+            for index in range(self._processes):
+                worker = context.Process(
+                    target=_worker_main,
+                    args=(self._shm.name, self._shape, self._dtype.str,
+                          self._slots, functions, self._task_queue,
+                          self._result_queue),
+                    name='ProcessingWorker-{0}'.format(index))
+                worker.daemon = True
+                worker.start()
+                self._workers.append(worker)
+        except BaseException:
+            self._shutdown()
+            raise
+
+        self._collector_thread = threading.Thread(
+            target=self._collect, name='ProcessingCollector')
+        self._collector_thread.daemon = True
+        self._collector_thread.start()
+
+    def close(self):
+        """
+        Waits for the blocks submitted to be processed, stops the worker
+        processes and releases the shared memory.
+        """
+        if self._shm is None:
+            return
+        self._shutdown()
+
+    def acquire_slot(self, timeout=None):
+        """
+        Takes a free slot of the ring to fill, waiting for one if every
+        slot is in use.
+
+            >>> with pool.acquire_slot() as slot:
+            ...     reader.read_many_sample(slot.data, 1000)
+
+        Args:
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a free slot. None waits indefinitely.
+        Returns:
+            artdaq.processing.SharedSlot:
+
+            Indicates the slot. Publish or discard it when done; used as
+            a context manager, it is published unless an exception
+            occurs.
+        """
+        if self._shm is None:
+            raise DaqError(
+                'The processing pool is not running.', Errors.UNKNOWN.value)
+        self._raise_error()
+
+        try:
+            slot = self._free_slots.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self._backpressure_waits += 1
+            try:
+                slot = self._free_slots.get(timeout=timeout)
+            except queue.Empty:
+                raise DaqError(
+                    'No slot of the processing pool became free within the '
+                    'timeout.', Errors.UNKNOWN.value)
+
+        with self._lock:
+            in_use = self._slots - self._free_slots.qsize()
+            if in_use > self._max_slots_in_use:
+                self._max_slots_in_use = in_use
+
+        return SharedSlot(self, slot, self._ring[slot])
+
+    def submit(self, data, timeout=None):
+        """
+        Copies a block of samples into a free slot and publishes it.
+
+        Args:
+            data (numpy.ndarray): Specifies the samples, shaped like the
+                slots or with fewer samples in the last dimension.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a free slot. None waits indefinitely.
+        Returns:
+            int:
+
+            Indicates the sequence number of the block.
+        """
+        slot = self.acquire_slot(timeout)
+        try:
+            samples = data.shape[-1]
+            slot.data[..., :samples] = data
+        except BaseException:
+            slot.discard()
+            raise
+        return slot.publish(samples)
+
+    def get_result(self, timeout=None):
+        """
+        Returns the results of the next block processed, in the order
+        the blocks complete.
+
+        Args:
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a result. None waits indefinitely.
+        Returns:
+            artdaq.types.ProcessingResult:
+
+            Indicates the sequence number of the block, the result of
+            each analysis function by name, and the traceback of the
+            exception a function raised, if any.
+        """
+        self._raise_error()
+        try:
+            return self._results.get(timeout=timeout)
+        except queue.Empty:
+            raise DaqError(
+                'No processing result became available within the timeout.',
+                Errors.UNKNOWN.value)
+
+    def _publish(self, slot, number_of_samples_per_channel):
+        with self._lock:
+            sequence_number = self._next_sequence_number
+            self._next_sequence_number += 1
+            self._blocks_submitted += 1
+            self._pending[sequence_number] = time.time()
+        self._task_queue.put(
+            (sequence_number, slot, number_of_samples_per_channel))
+        return sequence_number
+
+    def _raise_error(self):
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _release_slot(self, slot):
+        self._free_slots.put(slot)
+
+    def _collect(self):
+        while True:
+            message = self._result_queue.get()
+            if message is None:
+                break
+
+            sequence_number, slot, results, error = message
+            # The worker no longer uses the slot.
+            self._release_slot(slot)
+
+            with self._lock:
+                published_time = self._pending.pop(sequence_number, None)
+                self._blocks_completed += 1
+                if error is not None:
+                    self._blocks_failed += 1
+                if published_time is not None:
+                    self._total_latency += time.time() - published_time
+
+            result = ProcessingResult(sequence_number, results, error)
+            if self._callbacks:
+                for callback in self._callbacks:
+                    try:
+                        callback(result)
+                    except Exception as e:
+                        # Keeps collecting, so that the slots are still
+                        # recycled, and reports the error to the caller.
+                        with self._lock:
+                            if self._error is None:
+                                self._error = e
+            else:
+                self._results.put(result)
+
+    def _shutdown(self):
+        for _ in self._workers:
+            self._task_queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+        if self._collector_thread is not None:
+            self._result_queue.put(None)
+            self._collector_thread.join()
+            self._collector_thread = None
+
+        self._ring = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
@@ -0,0 +1,234 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import ctypes
+import re
+import threading
+
+import numpy
+from artdaq._task_modules.channels.ai_channel import AIChannel
+from artdaq.constants import ChannelType
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+__all__ = ['AIRawScaler', 'RawSamples']
+
+
+def _split_physical_channel(physical_channel):
+    """
+    Splits a physical channel name into the device name and the index of
+    the channel on the device.
+
+    Args:
+        physical_channel (str): Specifies the physical channel name, such
+            as "Dev1/ai3".
+    Returns:
+        Optional[Tuple[str, int]]: Indicates the device name and the
+        channel index, or None if the name cannot be split.
+    """
+    match = re.match(r'^/?([^/]+)/\D*?(\d+)$', physical_channel.strip())
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+class AIRawScaler(object):
+    """
+    Converts unscaled analog input samples, as read by
+    AnalogUnscaledReader, to the units of the measurement.
+
+    The offset and code width of each channel to read are queried once
+    through Calibration.get_AI_cal_offset_and_gain, using the range of
+    the channel, and cached. They are queried again when the channels of
+    the task or the channels to read change, or when you call "refresh",
+    for example after changing the range of a channel. Each sample is
+    converted as ``raw * code_width + offset``.
+    """
+
+    def __init__(self, task, sample_clock_rate=0.0):
+        """
+        Args:
+            task (artdaq.task.Task): Specifies the task whose samples to
+                convert.
+            sample_clock_rate (Optional[float]): Specifies the sample
+                clock rate of the task, which some devices use to select
+                the calibration constants.
+        """
+        self._task = task
+        self._sample_clock_rate = sample_clock_rate
+        self._lock = threading.Lock()
+        self._version = None
+        self._offsets = None
+        self._code_widths = None
+
+    @property
+    def offsets(self):
+        """
+        numpy.ndarray: Indicates the offset of each channel to read, as a
+            2D array with one row per channel.
+        """
+        return self._get_coefficients()[0]
+
+    @property
+    def code_widths(self):
+        """
+        numpy.ndarray: Indicates the width of one code of each channel to
+            read in the units of the measurement, as a 2D array with one
+            row per channel.
+        """
+        return self._get_coefficients()[1]
+
+    def refresh(self):
+        """
+        Queries the offset and code width of each channel to read again.
+        """
+        with self._lock:
+            self._version = None
+
+    def scale(self, raw, out=None):
+        """
+        Converts unscaled samples to the units of the measurement.
+
+        Args:
+            raw (numpy.ndarray): Specifies the unscaled samples, shaped as
+                AnalogUnscaledReader reads them: a 2D array with one row
+                per channel, a 1D array of one sample per channel, or, if
+                there is one channel to read, a 1D array of samples.
+                Unsigned samples are taken to be offset binary.
+            out (Optional[numpy.ndarray]): Specifies a float64 array of
+                the same shape as raw to hold the converted samples.
+        Returns:
+            numpy.ndarray:
+
+            Indicates the converted samples.
+        """
+        raw = numpy.asarray(raw)
+        offsets, code_widths = self._get_coefficients()
+
+        if raw.ndim == 1:
+            if len(offsets) == 1:
+                offsets, code_widths = offsets[0], code_widths[0]
+            else:
+                offsets, code_widths = offsets[:, 0], code_widths[:, 0]
+
+        if out is None:
+            out = numpy.empty(raw.shape, dtype=numpy.float64)
+
+        if raw.dtype.kind == 'u':
+            numpy.subtract(raw, 2 ** (raw.dtype.itemsize * 8 - 1), out=out,
+                           casting='unsafe')
+            numpy.multiply(out, code_widths, out=out)
+        else:
+            numpy.multiply(raw, code_widths, out=out, casting='unsafe')
+        numpy.add(out, offsets, out=out)
+        return out
+
+    def _get_coefficients(self):
+        metadata = self._task._metadata
+        with self._lock:
+            if self._version != metadata.version:
+                version = metadata.version
+                self._offsets, self._code_widths = self._query_coefficients(
+                    metadata.read_channel_names)
+                self._version = version
+            return self._offsets, self._code_widths
+
+    def _query_coefficients(self, channel_names):
+        metadata = self._task._metadata
+        calibration = self._task.calibration
+
+        offsets = numpy.zeros((len(channel_names), 1), dtype=numpy.float64)
+        code_widths = numpy.zeros_like(offsets)
+
+        channel_types = dict(zip(metadata.channel_names,
+                                 metadata.channel_types))
+        for index, name in enumerate(channel_names):
+            physical_channel = metadata.get_physical_channel(name)
+            device = None
+            if (channel_types.get(name) == ChannelType.ANALOG_INPUT and
+                    physical_channel is not None):
+                device = _split_physical_channel(physical_channel)
+
+            if device is None:
+                raise DaqError(
+                    'Unscaled samples cannot be converted, because the '
+                    'channel is not an analog input channel added through '
+                    'the ai_channels collection of the task.\n\n'
+                    'Channel: {0}'.format(name),
+                    Errors.UNKNOWN.value, task_name=self._task.name)
+
+            channel = AIChannel(self._task._handle, name)
+            offset = ctypes.c_double()
+            code_width = ctypes.c_double()
+            calibration.get_AI_cal_offset_and_gain(
+                device[0], device[1], channel.ai_min, channel.ai_max,
+                self._sample_clock_rate, offset, code_width)
+
+            offsets[index] = offset.value
+            code_widths[index] = code_width.value
+
+        return offsets, code_widths
+
+
+class RawSamples(object):
+    """
+    Holds unscaled analog input samples and converts them to the units
+    of the measurement only when the converted samples are first needed.
+
+    Archival and transport code can keep using "raw", which is 4 times
+    smaller than the converted samples for 16-bit devices, while
+    consumers that need floating-point samples use "scaled" or pass the
+    object to any NumPy function.
+    """
+
+    __slots__ = ['_raw', '_scaler', '_scaled']
+
+    def __init__(self, raw, scaler):
+        """
+        Args:
+            raw (numpy.ndarray): Specifies the unscaled samples.
+            scaler (AIRawScaler): Specifies the scaler that converts the
+                samples.
+        """
+        self._raw = raw
+        self._scaler = scaler
+        self._scaled = None
+
+    def __array__(self, dtype=None, copy=None):
+        scaled = self.scaled
+        if dtype is not None:
+            return scaled.astype(dtype)
+        return scaled
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return 'RawSamples(shape={0}, dtype={1})'.format(
+            self._raw.shape, self._raw.dtype)
+
+    @property
+    def raw(self):
+        """
+        numpy.ndarray: Indicates the unscaled samples.
+        """
+        return self._raw
+
+    @property
+    def shape(self):
+        """
+        Tuple[int]: Indicates the shape of the samples.
+        """
+        return self._raw.shape
+
+    @property
+    def scaled(self):
+        """
+        numpy.ndarray: Indicates the samples in the units of the
+            measurement. They are converted on first access and cached.
+        """
+        if self._scaled is None:
+            self._scaled = self._scaler.scale(self._raw)
+        return self._scaled
@@ -0,0 +1,669 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy
+from artdaq._task_modules.read_functions import _read_binary_i_16
+from artdaq.constants import FillMode, LoggingMode, LoggingOperation
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.scaling import AIRawScaler
+
+__all__ = ['StreamLogWriter', 'StreamLogReader', 'StreamLogger']
+
+_MAGIC = b'ARTDAQLG'
+_FORMAT_VERSION = 1
+
+# Magic, format version, offset of the samples, capacity in samples per
+# channel and number of samples per channel written.
+_PREFIX = struct.Struct('<8sIIQQ')
+_SAMPLES_WRITTEN_OFFSET = 24
+
+# Samples start on a page boundary, so that the mapping of the samples
+# is page aligned.
+_ALIGNMENT = 4096
+
+
+def _read_header(file_path):
+    """
+    Reads the header of a stream log file.
+
+    Args:
+        file_path (str): Specifies the path to the file.
+    Returns:
+        Tuple[int, int, int, dict]:
+
+        Indicates the offset of the samples, the capacity and the number
+        of samples per channel written, and the metadata of the file.
+    """
+    with io.open(file_path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) == _PREFIX.size:
+            magic, version, data_offset, capacity, samples_written = (
+                _PREFIX.unpack(prefix))
+        else:
+            magic = version = None
+
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise DaqError(
+                'The file is not a stream log file, or was written by an '
+                'unsupported version of ArtDAQ.\n\n'
+                'File: {0}'.format(file_path),
+                Errors.UNKNOWN.value)
+
+        metadata = json.loads(
+            f.read(data_offset - _PREFIX.size).decode('utf-8'))
+
+    return data_offset, capacity, samples_written, metadata
+
+
+class StreamLogWriter(object):
+    """
+    Writes samples into a preallocated, memory-mapped stream log file.
+
+    The file starts with a small header that holds the channel names,
+    the sample rate, the data type, the scaling coefficients and the
+    start time, followed by room for a fixed number of samples per
+    channel, stored one scan after the other. Samples are written
+    through the mapping, so the operating system moves them to disk
+    without further copies.
+
+    Use "reserve" and "commit" to read samples from the driver directly
+    into the file, or "write" to copy samples already read.
+    """
+
+    def __init__(self, file_path, channel_names, dtype, samples_per_channel,
+                 sample_rate=0.0, offsets=None, code_widths=None,
+                 start_time=None,
+                 operation=LoggingOperation.CREATE_OR_REPLACE):
+        """
+        Args:
+            file_path (str): Specifies the path to the file.
+            channel_names (List[str]): Specifies the names of the
+                channels whose samples the file holds.
+            dtype (numpy.dtype): Specifies the data type of the samples.
+            samples_per_channel (int): Specifies the number of samples
+                per channel to preallocate room for.
+            sample_rate (Optional[float]): Specifies the sample rate in
+                samples per channel per second.
+            offsets (Optional[numpy.ndarray]): Specifies the offset of
+                each channel, if the samples are unscaled.
+            code_widths (Optional[numpy.ndarray]): Specifies the code
+                width of each channel, if the samples are unscaled.
+            start_time (Optional[float]): Specifies the time the
+                acquisition started, in seconds since the epoch. By
+                default, the current time.
+            operation (Optional[artdaq.constants.LoggingOperation]):
+                Specifies how to open the file. If the file is opened to
+                append samples, it must hold the same channels and data
+                type, and keeps its header and capacity.
+        """
+        self._file_path = file_path
+        dtype = numpy.dtype(dtype)
+        exists = os.path.exists(file_path)
+
+        if operation == LoggingOperation.CREATE and exists:
+            raise DaqError(
+                'The stream log file cannot be created, because it already '
+                'exists.\n\nFile: {0}'.format(file_path),
+                Errors.UNKNOWN.value)
+
+        if operation == LoggingOperation.OPEN and not exists:
+            raise DaqError(
+                'The stream log file cannot be opened, because it does not '
+                'exist.\n\nFile: {0}'.format(file_path),
+                Errors.FILE_NOT_FOUND.value)
+
+        if exists and operation in (LoggingOperation.OPEN,
+                                    LoggingOperation.OPEN_OR_CREATE):
+            data_offset, capacity, samples_written, metadata = (
+                _read_header(file_path))
+
+            if (metadata['channel_names'] != list(channel_names) or
+                    numpy.dtype(metadata['dtype']) != dtype):
+                raise DaqError(
+                    'Samples cannot be appended to the stream log file, '
+                    'because it holds different channels or a different '
+                    'data type.\n\n'
+                    'File: {0}\n'
+                    'Channels in file: {1}\n'
+                    'Channels to log: {2}\n'
+                    'Data type in file: {3}\n'
+                    'Data type to log: {4}'.format(
+                        file_path, metadata['channel_names'],
+                        list(channel_names), metadata['dtype'], dtype.str),
+                    Errors.UNKNOWN.value)
+
+            self._file = io.open(file_path, 'r+b')
+        else:
+            metadata = {
+                'channel_names': list(channel_names),
+                'sample_rate': sample_rate,
+                'dtype': dtype.str,
+                'offsets': (None if offsets is None else
+                            numpy.ravel(offsets).tolist()),
+                'code_widths': (None if code_widths is None else
+                                numpy.ravel(code_widths).tolist()),
+                'start_time': time.time() if start_time is None else start_time,
+            }
+            encoded = json.dumps(metadata).encode('utf-8')
+            data_offset = _PREFIX.size + len(encoded)
+            data_offset += -data_offset % _ALIGNMENT
+            capacity = samples_per_channel
+            samples_written = 0
+
+            self._file = io.open(file_path, 'w+b')
+            self._file.write(_PREFIX.pack(
+                _MAGIC, _FORMAT_VERSION, data_offset, capacity, 0))
+            self._file.write(encoded.ljust(data_offset - _PREFIX.size))
+            self._file.truncate(
+                data_offset +
+                capacity * len(metadata['channel_names']) * dtype.itemsize)
+            self._file.flush()
+
+        self._metadata = metadata
+        self._capacity = capacity
+        self._samples_written = samples_written
+        self._data = numpy.memmap(
+            self._file, dtype=dtype, mode='r+', offset=data_offset,
+            shape=(capacity, len(metadata['channel_names'])))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def file_path(self):
+        """
+        str: Indicates the path to the file.
+        """
+        return self._file_path
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the channels whose samples the
+            file holds.
+        """
+        return self._metadata['channel_names']
+
+    @property
+    def capacity(self):
+        """
+        int: Indicates the number of samples per channel the file has
+            room for.
+        """
+        return self._capacity
+
+    @property
+    def samples_written(self):
+        """
+        int: Indicates the number of samples per channel written.
+        """
+        return self._samples_written
+
+    def reserve(self, number_of_samples_per_channel):
+        """
+        Returns the region of the file that the next samples are written
+        to, so that they can be read into it directly.
+
+        Call "commit" with the number of samples per channel actually
+        stored in the region to make them part of the file.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to reserve room for.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a C-contiguous 2D view of the file, with one row
+            per scan, to fill in the order of
+            artdaq.constants.FillMode.GROUP_BY_SCAN_NUMBER.
+        """
+        end = self._samples_written + number_of_samples_per_channel
+        if end > self._capacity:
+            raise DaqError(
+                'Samples cannot be written, because the stream log file is '
+                'full.\n\n'
+                'File: {0}\n'
+                'Capacity in samples per channel: {1}\n'
+                'Samples per channel written: {2}\n'
+                'Samples per channel to write: {3}'.format(
+                    self._file_path, self._capacity, self._samples_written,
+                    number_of_samples_per_channel),
+                Errors.UNKNOWN.value)
+
+        return self._data[self._samples_written:end]
+
+    def commit(self, number_of_samples_per_channel):
+        """
+        Makes samples stored in the region returned by "reserve" part of
+        the file.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel stored.
+        """
+        self._samples_written += number_of_samples_per_channel
+
+    def write(self, data):
+        """
+        Copies samples into the file.
+
+        Args:
+            data (numpy.ndarray): Specifies the samples, as a 2D array
+                with one row per channel, a 1D array of one sample per
+                channel, or, if the file holds one channel, a 1D array
+                of samples.
+        """
+        data = numpy.asarray(data)
+        if data.ndim == 1:
+            if len(self.channel_names) == 1:
+                data = data[numpy.newaxis, :]
+            else:
+                data = data[:, numpy.newaxis]
+
+        if data.shape[0] != len(self.channel_names):
+            raise DaqError(
+                'The number of channels of the samples does not match the '
+                'number of channels in the file.\n'
+                'Channels in samples: {0}\nChannels in file: {1}'
+                .format(data.shape[0], len(self.channel_names)),
+                Errors.UNKNOWN.value)
+
+        number_of_samples_per_channel = data.shape[1]
+        self.reserve(number_of_samples_per_channel)[:] = data.T
+        self.commit(number_of_samples_per_channel)
+
+    def flush(self):
+        """
+        Writes the samples and the number of samples written to disk.
+        """
+        self._data.flush()
+        self._file.seek(_SAMPLES_WRITTEN_OFFSET)
+        self._file.write(struct.pack('<Q', self._samples_written))
+        self._file.flush()
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        if self._file.closed:
+            return
+
+        self.flush()
+        self._data._mmap.close()
+        self._file.close()
+
+
+class StreamLogReader(object):
+    """
+    Maps the samples of a stream log file back into memory as NumPy
+    arrays, without reading them.
+    """
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Specifies the path to the file.
+        """
+        data_offset, _, samples_written, metadata = _read_header(file_path)
+
+        self._file_path = file_path
+        self._metadata = metadata
+
+        dtype = numpy.dtype(metadata['dtype'])
+        shape = (samples_written, len(metadata['channel_names']))
+        if samples_written:
+            self._data = numpy.memmap(
+                file_path, dtype=dtype, mode='r', offset=data_offset,
+                shape=shape)
+        else:
+            self._data = numpy.zeros(shape, dtype=dtype)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def file_path(self):
+        """
+        str: Indicates the path to the file.
+        """
+        return self._file_path
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the channels whose samples the
+            file holds.
+        """
+        return self._metadata['channel_names']
+
+    @property
+    def sample_rate(self):
+        """
+        float: Indicates the sample rate in samples per channel per
+            second.
+        """
+        return self._metadata['sample_rate']
+
+    @property
+    def start_time(self):
+        """
+        float: Indicates the time the acquisition started, in seconds
+            since the epoch.
+        """
+        return self._metadata['start_time']
+
+    @property
+    def dtype(self):
+        """
+        numpy.dtype: Indicates the data type of the samples.
+        """
+        return self._data.dtype
+
+    @property
+    def offsets(self):
+        """
+        Optional[numpy.ndarray]: Indicates the offset of each channel, or
+            None if the samples are scaled.
+        """
+        offsets = self._metadata['offsets']
+        return None if offsets is None else numpy.array(offsets)
+
+    @property
+    def code_widths(self):
+        """
+        Optional[numpy.ndarray]: Indicates the code width of each
+            channel, or None if the samples are scaled.
+        """
+        code_widths = self._metadata['code_widths']
+        return None if code_widths is None else numpy.array(code_widths)
+
+    @property
+    def samples_per_channel(self):
+        """
+        int: Indicates the number of samples per channel in the file.
+        """
+        return self._data.shape[0]
+
+    @property
+    def data(self):
+        """
+        numpy.ndarray: Indicates a read-only 2D view of the samples, with
+            one row per scan and one column per channel.
+        """
+        return self._data
+
+    def channel(self, channel_name):
+        """
+        Returns a view of the samples of one channel.
+
+        Args:
+            channel_name (str): Specifies the name of the channel.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a read-only 1D view of the samples of the channel.
+        """
+        try:
+            index = self.channel_names.index(channel_name)
+        except ValueError:
+            raise DaqError(
+                'The stream log file does not hold the channel.\n\n'
+                'File: {0}\n'
+                'Channel: {1}\n'
+                'Channels in file: {2}'.format(
+                    self._file_path, channel_name, self.channel_names),
+                Errors.UNKNOWN.value)
+
+        return self._data[:, index]
+
+    def scaled(self, start=0, stop=None):
+        """
+        Returns samples in the units of the measurement.
+
+        Args:
+            start (Optional[int]): Specifies the first scan to return.
+            stop (Optional[int]): Specifies the scan after the last one
+                to return. By default, returns the scans to the end of
+                the file.
+        Returns:
+            numpy.ndarray:
+
+            Indicates a new float64 2D array of the samples, with one row
+            per scan and one column per channel.
+        """
+        data = self._data[start:stop]
+        code_widths = self.code_widths
+        if code_widths is None:
+            return numpy.array(data, dtype=numpy.float64)
+
+        scaled = numpy.multiply(data, code_widths)
+        scaled += self.offsets
+        return scaled
+
+    def close(self):
+        """
+        Unmaps the file. Views returned earlier must not be used after
+        this method runs.
+        """
+        if isinstance(self._data, numpy.memmap):
+            self._data._mmap.close()
+
+
+class StreamLogger(object):
+    """
+    Streams the samples of an analog input task to a stream log file.
+
+    In artdaq.constants.LoggingMode.LOG mode, a thread started with the
+    task reads unscaled samples directly into the file, together with
+    the coefficients to scale them, and the task cannot be read. In
+    artdaq.constants.LoggingMode.LOG_AND_READ mode, the samples the task
+    reads are copied to the file.
+
+    Use InStream.configure_logging instead of creating a logger.
+    """
+
+    def __init__(self, task_in_stream, file_path, samples_per_channel,
+                 logging_mode=LoggingMode.LOG_AND_READ,
+                 operation=LoggingOperation.OPEN_OR_CREATE,
+                 sample_rate=0.0, samples_per_block=1000):
+        """
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                the ArtDAQ task whose samples to log.
+            file_path (str): Specifies the path to the file.
+            samples_per_channel (int): Specifies the number of samples
+                per channel to preallocate room for.
+            logging_mode (Optional[artdaq.constants.LoggingMode]):
+                Specifies whether the task can be read while logging.
+            operation (Optional[artdaq.constants.LoggingOperation]):
+                Specifies how to open the file.
+            sample_rate (Optional[float]): Specifies the sample rate of
+                the task, recorded in the file.
+            samples_per_block (Optional[int]): Specifies the number of
+                samples per channel the logging thread reads in each
+                call to the driver in LOG mode.
+        """
+        self._in_stream = task_in_stream
+        self._task = task_in_stream._task
+        self._handle = task_in_stream._task._handle
+
+        self._file_path = file_path
+        self._samples_per_channel = samples_per_channel
+        self._logging_mode = logging_mode
+        self._operation = operation
+        self._sample_rate = sample_rate
+        self._samples_per_block = samples_per_block
+
+        self._writer = None
+        self._raw_scaler = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        self._error = None
+
+    @property
+    def file_path(self):
+        """
+        str: Indicates the path to the file.
+        """
+        return self._file_path
+
+    @property
+    def logging_mode(self):
+        """
+        :class:`artdaq.constants.LoggingMode`: Indicates whether the
+            task can be read while logging.
+        """
+        return self._logging_mode
+
+    @property
+    def samples_written(self):
+        """
+        int: Indicates the number of samples per channel written to the
+            file.
+        """
+        return 0 if self._writer is None else self._writer.samples_written
+
+    def start(self):
+        """
+        Opens the file, if it is not open, and in LOG mode starts the
+        logging thread.
+        """
+        self._open()
+
+        if (self._logging_mode == LoggingMode.LOG and
+                self._thread is None):
+            self._stopping = False
+            self._error = None
+            self._thread = threading.Thread(
+                target=self._run, name='StreamLogger')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the logging thread after the block it is reading completes
+        and flushes the file.
+
+        Raises the exception that stopped the logging thread, if any.
+        """
+        if self._thread is not None:
+            self._stopping = True
+            self._thread.join()
+            self._thread = None
+
+        if self._writer is not None:
+            self._writer.flush()
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Stops logging and closes the file.
+        """
+        try:
+            self.stop()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def log(self, data):
+        """
+        Copies samples read from the task to the file.
+
+        Args:
+            data (numpy.ndarray): Specifies the samples, shaped as
+                Task.read_into returns them.
+        Returns:
+            int:
+
+            Indicates the number of samples per channel written.
+        """
+        with self._lock:
+            self._open()
+            samples_written = self._writer.samples_written
+            self._writer.write(data)
+            samples_logged = self._writer.samples_written - samples_written
+
+        samples_read = data.shape[-1] if data.ndim == 2 else (
+            len(data) if len(self._writer.channel_names) == 1 else 1)
+        if samples_logged != samples_read:
+            raise DaqError(
+                'The number of samples logged does not match the number of '
+                'samples read.\nSamples read: {0}\nSamples logged: {1}'
+                .format(samples_read, samples_logged),
+                Errors.UNKNOWN.value, task_name=self._task.name)
+        return samples_logged
+
+    def log_unscaled(self, data):
+        """
+        Converts unscaled samples read from the task, as
+        AnalogUnscaledReader reads them, and copies them to the file.
+
+        Args:
+            data (numpy.ndarray): Specifies the unscaled samples.
+        Returns:
+            int:
+
+            Indicates the number of samples per channel written.
+        """
+        if self._raw_scaler is None:
+            self._raw_scaler = AIRawScaler(self._task, self._sample_rate)
+        return self.log(self._raw_scaler.scale(data))
+
+    def _open(self):
+        if self._writer is not None:
+            return
+
+        if self._logging_mode == LoggingMode.LOG:
+            scaler = AIRawScaler(self._task, self._sample_rate)
+            dtype = numpy.int16
+            offsets, code_widths = scaler.offsets, scaler.code_widths
+        else:
+            dtype = numpy.float64
+            offsets = code_widths = None
+
+        self._writer = StreamLogWriter(
+            self._file_path, self._task._metadata.read_channel_names, dtype,
+            self._samples_per_channel, sample_rate=self._sample_rate,
+            offsets=offsets, code_widths=code_widths,
+            operation=self._operation)
+
+    def _run(self):
+        timeout = self._in_stream.timeout
+        writer = self._writer
+        try:
+            while not self._stopping:
+                remaining = writer.capacity - writer.samples_written
+                if remaining == 0:
+                    # Raises the error that the file is full.
+                    writer.reserve(1)
+
+                number_of_samples_per_channel = min(
+                    self._samples_per_block, remaining)
+                samples_read = _read_binary_i_16(
+                    self._handle, writer.reserve(number_of_samples_per_channel),
+                    number_of_samples_per_channel, timeout,
+                    fill_mode=FillMode.GROUP_BY_SCAN_NUMBER)
+                writer.commit(samples_read)
+        except Exception as e:
+            self._error = e
@@ -3,8 +3,14 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import threading
+import time
+
 import numpy
+import six
 from artdaq import DaqError
+from artdaq._task_modules.async_executor import run_async
 from artdaq._task_modules.read_functions import (
     _read_analog_f_64, _read_analog_scalar_f_64, _read_binary_i_16,
     _read_binary_i_32, _read_binary_u_16, _read_binary_u_32,
@@ -13,8 +19,12 @@ from artdaq._task_modules.read_functions import (
     _read_counter_scalar_u_32, _read_ctr_freq_scalar, _read_ctr_ticks_scalar, _read_ctr_time_scalar,
     _read_ctr_freq, _read_ctr_ticks, _read_ctr_time, _read_counter_u_32)
 from artdaq.constants import READ_ALL_AVAILABLE
+from artdaq.error_codes import Errors
+from artdaq.types import (
+    AcquiredBlock, BlockPipelineStatistics, RingBufferBlock)
 
 __all__ = ['AnalogSingleChannelReader', 'AnalogMultiChannelReader',
+           'AnalogRingBufferReader', 'AnalogEveryNSamplesReader',
            'AnalogUnscaledReader', 'CounterReader',
            'DigitalSingleChannelReader', 'DigitalMultiChannelReader']
 
@@ -35,6 +45,7 @@ class ChannelReaderBase(object):
         self._handle = task_in_stream._task._handle
 
         self._verify_array_shape = True
+        self._block_processors = []
 
     @property
     def verify_array_shape(self):
@@ -52,6 +63,45 @@ class ChannelReaderBase(object):
     def verify_array_shape(self, val):
         self._verify_array_shape = val
 
+    def add_block_processor(self, processor):
+        """
+        Registers a function that receives every block of samples the
+        reader reads into an array, such as the "process" method of a
+        decimator or the "update" method of a statistics accumulator.
+
+        Blocks are passed by "read_many_sample" of the analog readers, by
+        the reader threads of AnalogRingBufferReader and
+        AnalogEveryNSamplesReader, by the methods of AnalogUnscaledReader
+        and by "read_many_sample_double" of CounterReader. Processors run
+        in the reading thread, after the read and in the order they were
+        added. They receive a 2D view of the samples read,
+        with one row per channel, which is valid only until the processor
+        returns.
+
+        Args:
+            processor (Callable[[numpy.ndarray], object]): Specifies the
+                function. Its return value is ignored.
+        """
+        self._block_processors.append(processor)
+
+    def remove_block_processor(self, processor):
+        """
+        Unregisters a function registered with "add_block_processor".
+
+        Args:
+            processor (Callable[[numpy.ndarray], object]): Specifies the
+                function.
+        """
+        self._block_processors.remove(processor)
+
+    def _process_block(self, data):
+        """
+        Passes a block of samples read, with one row per channel, to the
+        registered block processors.
+        """
+        for processor in self._block_processors:
+            processor(data)
+
     def _verify_array(self, data, number_of_samples_per_channel,
                       is_many_chan, is_many_samp):
         """
@@ -72,8 +122,7 @@ class ChannelReaderBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_read = self._in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
+        number_of_channels = self._task._metadata.number_of_read_channels
 
         array_shape = None
         if is_many_chan:
@@ -96,7 +145,7 @@ class ChannelReaderBase(object):
                 'Shape of NumPy Array provided: {0}\n'
                 'Shape of NumPy Array required: {1}'
                 .format(data.shape, array_shape),
-                 DaqError.UNKNOWN.value, task_name=self._task.name)
+                 Errors.UNKNOWN.value, task_name=self._task.name)
 
     def _verify_array_digital_lines(
             self, data, is_many_chan, is_many_line):
@@ -116,8 +165,7 @@ class ChannelReaderBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_read = self._in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
+        number_of_channels = self._task._metadata.number_of_read_channels
         number_of_lines = self._in_stream.di_num_booleans_per_chan
 
         array_shape = None
@@ -140,7 +188,7 @@ class ChannelReaderBase(object):
                 'Shape of NumPy Array provided: {0}\n'
                 'Shape of NumPy Array required: {1}'
                 .format(data.shape, array_shape),
-                DaqError.UNKNOWN.value, task_name=self._task.name)
+                Errors.UNKNOWN.value, task_name=self._task.name)
 
 
 class AnalogSingleChannelReader(ChannelReaderBase):
@@ -213,10 +261,41 @@ class AnalogSingleChannelReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, False, True)
+        self._in_stream._verify_readable()
 
-        return _read_analog_f_64(
+        samples_read = _read_analog_f_64(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_samples(data[:samples_read])
+        if self._block_processors:
+            self._process_block(data[numpy.newaxis, :samples_read])
+
+        return samples_read
+
+    def read_many_sample_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample" method, which runs
+        the read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "read_many_sample" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+
+        Example:
+            >>> samples_read = await reader.read_many_sample_async(data)
+        """
+        return run_async(
+            self.read_many_sample, data, number_of_samples_per_channel,
+            timeout)
 
     def read_one_sample(self, timeout=10):
         """
@@ -325,10 +404,41 @@ class AnalogMultiChannelReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, True, True)
+        self._in_stream._verify_readable()
 
-        return _read_analog_f_64(
+        samples_read = _read_analog_f_64(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_samples(data[:, :samples_read])
+        if self._block_processors:
+            self._process_block(data[:, :samples_read])
+
+        return samples_read
+
+    def read_many_sample_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample" method, which runs
+        the read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "read_many_sample" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+
+        Example:
+            >>> samples_read = await reader.read_many_sample_async(data)
+        """
+        return run_async(
+            self.read_many_sample, data, number_of_samples_per_channel,
+            timeout)
 
     def read_one_sample(self, data, timeout=10):
         """
@@ -367,6 +477,581 @@ class AnalogMultiChannelReader(ChannelReaderBase):
         _read_analog_f_64(self._handle, data, 1, timeout)
 
 
+class AnalogRingBufferReader(ChannelReaderBase):
+    """
+    Reads samples from one or more analog input channels in a continuous
+    ArtDAQ task on a dedicated thread, into a preallocated ring of
+    fixed-size blocks.
+
+    The reader thread drains the driver buffer one block at a time while
+    the consumer processes earlier blocks, so that processing does not
+    delay the reads that keep the driver buffer from overflowing. Blocks
+    are returned as views into the ring, without copying.
+
+    When all blocks in the ring hold samples the consumer has not read,
+    the reader thread either waits for the consumer, which increments
+    "backpressure_count", or, if "overwrite" is True, discards the
+    oldest unread block, which increments "overrun_count". Discarded
+    blocks show up as gaps in the sequence numbers of the blocks read.
+    """
+
+    def __init__(self, task_in_stream, samples_per_block,
+                 number_of_blocks=8, overwrite=False):
+        """
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an ArtDAQ task from which to read samples.
+            samples_per_block (int): Specifies the number of samples per
+                channel the reader thread reads in each call to the
+                driver.
+            number_of_blocks (Optional[int]): Specifies the number of
+                blocks in the ring. Must be at least 2.
+            overwrite (Optional[bool]): Specifies whether the reader
+                thread discards the oldest unread block instead of
+                waiting for the consumer when the ring is full.
+        """
+        super(AnalogRingBufferReader, self).__init__(task_in_stream)
+
+        if number_of_blocks < 2:
+            raise DaqError(
+                'The ring buffer must have at least 2 blocks.\n\n'
+                'Number of blocks requested: {0}'.format(number_of_blocks),
+                Errors.UNKNOWN.value, task_name=self._task.name)
+
+        self._samples_per_block = samples_per_block
+        self._number_of_blocks = number_of_blocks
+        self._overwrite = overwrite
+
+        number_of_channels = self._task._metadata.number_of_read_channels
+        self._ring = numpy.zeros(
+            (number_of_blocks, number_of_channels, samples_per_block),
+            dtype=numpy.float64)
+        self._samples_read = [0] * number_of_blocks
+
+        self._condition = threading.Condition()
+        self._free_slots = collections.deque(range(number_of_blocks))
+        self._unread = collections.deque()
+        self._held_slot = None
+        self._next_sequence_number = 0
+
+        self._overrun_count = 0
+        self._backpressure_count = 0
+        self._error = None
+
+        self._thread = None
+        self._running = False
+        self._stopping = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    @property
+    def samples_per_block(self):
+        """
+        int: Indicates the number of samples per channel in each block.
+        """
+        return self._samples_per_block
+
+    @property
+    def number_of_blocks(self):
+        """
+        int: Indicates the number of blocks in the ring.
+        """
+        return self._number_of_blocks
+
+    @property
+    def available_blocks(self):
+        """
+        int: Indicates the number of blocks read from the driver that the
+            consumer has not read yet.
+        """
+        return len(self._unread)
+
+    @property
+    def blocks_acquired(self):
+        """
+        int: Indicates the number of blocks the reader thread read from
+            the driver since the reader was created.
+        """
+        return self._next_sequence_number
+
+    @property
+    def overrun_count(self):
+        """
+        int: Indicates the number of unread blocks the reader thread
+            discarded because the ring was full. Always 0 unless
+            "overwrite" is True.
+        """
+        return self._overrun_count
+
+    @property
+    def backpressure_count(self):
+        """
+        int: Indicates the number of times the reader thread had to wait
+            for the consumer because the ring was full. Always 0 if
+            "overwrite" is True.
+        """
+        return self._backpressure_count
+
+    @property
+    def is_running(self):
+        """
+        bool: Indicates whether the reader thread is running.
+        """
+        return self._running
+
+    def start(self):
+        """
+        Starts the reader thread.
+
+        Start the task before or after calling this method. If the task
+        is not started and the "auto_start" property of the input stream
+        is True, the first read of the reader thread starts it.
+        """
+        if self._running:
+            return
+        self._in_stream._verify_readable()
+
+        self._running = True
+        self._stopping = False
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name='AnalogRingBufferReader')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops the reader thread after the block it is reading completes.
+
+        Stopping the reader does not stop the task, and the blocks
+        already in the ring remain available to "read_block".
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait for the reader thread to finish.
+                By default, waits until it finishes.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+        if (self._thread is not None and
+                self._thread is not threading.current_thread()):
+            self._thread.join(timeout)
+
+    def read_block(self, timeout=10.0):
+        """
+        Returns the oldest block the consumer has not read yet, waiting
+        for the reader thread to read one if necessary.
+
+        The samples of the block are a view into the ring. The view
+        remains valid until the next call to this method or to
+        "release_block", after which the reader thread may reuse it.
+
+        Args:
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for a block to become available. If you
+                set timeout to artdaq.constants.WAIT_INFINITELY, the
+                method waits indefinitely.
+        Returns:
+            artdaq.types.RingBufferBlock:
+
+            Indicates the sequence number of the block and a 2D NumPy
+            array of its samples, with one row per channel.
+        """
+        with self._condition:
+            self._release_held_slot()
+
+            if timeout is not None and timeout >= 0:
+                deadline = time.time() + timeout
+            else:
+                deadline = None
+
+            while not self._unread and self._running:
+                if deadline is None:
+                    self._condition.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+            if not self._unread:
+                if self._error is not None:
+                    raise self._error
+                raise DaqError(
+                    'No block of samples became available before the '
+                    'timeout elapsed.',
+                    Errors.ERROR_OPERATION_TIMED_OUT.value,
+                    task_name=self._task.name)
+
+            sequence_number, slot = self._unread.popleft()
+            self._held_slot = slot
+
+        data = self._ring[slot]
+        samples_read = self._samples_read[slot]
+        if samples_read != self._samples_per_block:
+            data = data[:, :samples_read]
+
+        return RingBufferBlock(sequence_number, data)
+
+    def read_block_async(self, timeout=10.0):
+        """
+        Asynchronous version of the "read_block" method, which waits on
+        a bounded thread pool instead of blocking the event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "read_block" method for more info.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the next
+            artdaq.types.RingBufferBlock.
+        """
+        return run_async(self.read_block, timeout)
+
+    def release_block(self):
+        """
+        Returns the block last returned by "read_block" to the ring, so
+        the reader thread may reuse it before the next call to
+        "read_block".
+        """
+        with self._condition:
+            self._release_held_slot()
+
+    def _release_held_slot(self):
+        if self._held_slot is not None:
+            self._free_slots.append(self._held_slot)
+            self._held_slot = None
+            self._condition.notify_all()
+
+    def _acquire_free_slot(self):
+        with self._condition:
+            if not self._free_slots:
+                if self._overwrite and self._unread:
+                    _, slot = self._unread.popleft()
+                    self._overrun_count += 1
+                    return slot
+
+                self._backpressure_count += 1
+                while not self._free_slots and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return None
+
+            return self._free_slots.popleft()
+
+    def _run(self):
+        timeout = self._in_stream.timeout
+        try:
+            while not self._stopping:
+                slot = self._acquire_free_slot()
+                if slot is None:
+                    break
+
+                try:
+                    samples_read = _read_analog_f_64(
+                        self._handle, self._ring[slot],
+                        self._samples_per_block, timeout)
+                    block = self._ring[slot][:, :samples_read]
+                    self._in_stream._log_samples(block)
+                    if self._block_processors:
+                        self._process_block(block)
+                except Exception:
+                    with self._condition:
+                        self._free_slots.appendleft(slot)
+                    raise
+
+                with self._condition:
+                    self._samples_read[slot] = samples_read
+                    self._unread.append((self._next_sequence_number, slot))
+                    self._next_sequence_number += 1
+                    self._condition.notify_all()
+        except Exception as e:
+            with self._condition:
+                self._error = e
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+
+
+class AnalogEveryNSamplesReader(ChannelReaderBase):
+    """
+    Delivers blocks of samples from one or more analog input channels in
+    a buffered ArtDAQ task to Python consumers, driven by the Every N
+    Samples Acquired Into Buffer event.
+
+    The driver callback only records a notification. A reader thread
+    then reads each block of "sample_interval" samples per channel into
+    a buffer taken from a preallocated pool, and a dispatch thread passes
+    the filled block to every registered consumer before returning the
+    buffer to the pool. Slow consumers therefore do not delay the reads
+    that drain the driver buffer.
+
+    If every buffer in the pool is still waiting to be dispatched when a
+    block becomes available, the block is read into a scratch buffer and
+    dropped, to keep the driver buffer from overflowing. Use
+    "statistics" to size "sample_interval" and "pool_size" for your
+    sample rate.
+    """
+
+    def __init__(self, task_in_stream, sample_interval, pool_size=8):
+        """
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an ArtDAQ task from which to read samples.
+            sample_interval (int): Specifies the number of samples per
+                channel in each block, which is also the number of
+                samples after which each event occurs.
+            pool_size (Optional[int]): Specifies the number of buffers
+                in the pool, which is the maximum number of blocks
+                waiting to be dispatched.
+        """
+        super(AnalogEveryNSamplesReader, self).__init__(task_in_stream)
+
+        self._sample_interval = sample_interval
+        self._pool_size = pool_size
+
+        number_of_channels = self._task._metadata.number_of_read_channels
+        shape = (number_of_channels, sample_interval)
+        self._pool = six.moves.queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(numpy.zeros(shape, dtype=numpy.float64))
+        self._scratch = numpy.zeros(shape, dtype=numpy.float64)
+
+        self._notifications = six.moves.queue.Queue()
+        self._filled = six.moves.queue.Queue()
+        self._consumers = []
+        self._lock = threading.Lock()
+
+        self._blocks_delivered = 0
+        self._blocks_dropped = 0
+        self._max_queue_depth = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._next_sequence_number = 0
+
+        self._reader_thread = None
+        self._dispatch_thread = None
+        self._error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    @property
+    def sample_interval(self):
+        """
+        int: Indicates the number of samples per channel in each block.
+        """
+        return self._sample_interval
+
+    @property
+    def pool_size(self):
+        """
+        int: Indicates the number of buffers in the pool.
+        """
+        return self._pool_size
+
+    @property
+    def queue_depth(self):
+        """
+        int: Indicates the number of blocks acquired into the driver
+            buffer or read into the pool that have not been dispatched
+            yet.
+        """
+        return self._notifications.qsize() + self._filled.qsize()
+
+    @property
+    def statistics(self):
+        """
+        :class:`artdaq.types.BlockPipelineStatistics`: Indicates the
+            number of blocks delivered and dropped, the current and
+            maximum queue depth, and the mean and maximum time in
+            seconds from the driver event to the start of the dispatch
+            of a block.
+        """
+        with self._lock:
+            if self._blocks_delivered:
+                mean_latency = self._total_latency / self._blocks_delivered
+            else:
+                mean_latency = 0.0
+
+            return BlockPipelineStatistics(
+                self._blocks_delivered, self._blocks_dropped,
+                self.queue_depth, self._max_queue_depth, mean_latency,
+                self._max_latency)
+
+    def add_consumer(self, consumer):
+        """
+        Registers a function to call with each block of samples.
+
+        Consumers are called on the dispatch thread, in the order they
+        were added. The samples of the block belong to a pooled buffer
+        that is reused once all consumers return; copy them to keep
+        them.
+
+        Args:
+            consumer (function): Specifies the function to call. It must
+                have the following prototype:
+
+                >>> def consumer(block):
+                >>>     pass
+
+                where block is an artdaq.types.AcquiredBlock.
+        """
+        with self._lock:
+            self._consumers = self._consumers + [consumer]
+
+    def remove_consumer(self, consumer):
+        """
+        Unregisters a function added with "add_consumer".
+
+        Args:
+            consumer (function): Specifies the function to unregister.
+        """
+        with self._lock:
+            self._consumers = [c for c in self._consumers if c != consumer]
+
+    def start(self):
+        """
+        Registers the Every N Samples Acquired Into Buffer event on the
+        task and starts the reader and dispatch threads.
+
+        Call this method before you start the task. Registering the
+        event replaces any Every N Samples Acquired Into Buffer callback
+        registered on the task before.
+        """
+        if self._reader_thread is not None:
+            return
+        self._in_stream._verify_readable()
+
+        self._error = None
+
+        self._reader_thread = threading.Thread(
+            target=self._read_blocks, name='AnalogEveryNSamplesReader')
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_blocks,
+            name='AnalogEveryNSamplesDispatcher')
+        for thread in (self._reader_thread, self._dispatch_thread):
+            thread.daemon = True
+            thread.start()
+
+        self._task.register_every_n_samples_acquired_into_buffer_event(
+            self._sample_interval, self._on_every_n_samples)
+
+    def stop(self):
+        """
+        Unregisters the event and stops the reader and dispatch threads
+        after the blocks already read are dispatched.
+
+        Stopping the reader does not stop the task. If reading or a
+        consumer raised an exception, this method raises it.
+        """
+        if self._reader_thread is None:
+            return
+
+        self._task.register_every_n_samples_acquired_into_buffer_event(
+            self._sample_interval, None)
+
+        self._notifications.put(None)
+        self._reader_thread.join()
+        self._dispatch_thread.join()
+        self._reader_thread = None
+        self._dispatch_thread = None
+
+        if self._error is not None:
+            raise self._error
+
+    def _on_every_n_samples(self, task_handle, every_n_samples_event_type,
+                            number_of_samples, callback_data):
+        self._notifications.put(time.time())
+        return 0
+
+    def _update_queue_depth(self):
+        queue_depth = self.queue_depth
+        if queue_depth > self._max_queue_depth:
+            self._max_queue_depth = queue_depth
+
+    def _read_blocks(self):
+        timeout = self._in_stream.timeout
+        try:
+            while True:
+                notification_time = self._notifications.get()
+                if notification_time is None:
+                    break
+
+                with self._lock:
+                    self._update_queue_depth()
+
+                try:
+                    data = self._pool.get_nowait()
+                except six.moves.queue.Empty:
+                    samples_read = _read_analog_f_64(
+                        self._handle, self._scratch, self._sample_interval,
+                        timeout)
+                    self._in_stream._log_samples(
+                        self._scratch[:, :samples_read])
+                    with self._lock:
+                        self._blocks_dropped += 1
+                        self._next_sequence_number += 1
+                    continue
+
+                try:
+                    samples_read = _read_analog_f_64(
+                        self._handle, data, self._sample_interval, timeout)
+                    self._in_stream._log_samples(data[:, :samples_read])
+                    if self._block_processors:
+                        self._process_block(data[:, :samples_read])
+                except Exception:
+                    self._pool.put(data)
+                    raise
+
+                self._filled.put(AcquiredBlock(
+                    self._next_sequence_number, data, notification_time))
+                self._next_sequence_number += 1
+        except Exception as e:
+            self._error = e
+        finally:
+            self._filled.put(None)
+
+    def _dispatch_blocks(self):
+        while True:
+            block = self._filled.get()
+            if block is None:
+                break
+
+            latency = time.time() - block.notification_time
+            with self._lock:
+                self._update_queue_depth()
+                consumers = self._consumers
+
+            try:
+                for consumer in consumers:
+                    consumer(block)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._pool.put(block.data)
+
+            with self._lock:
+                self._blocks_delivered += 1
+                self._total_latency += latency
+                if latency > self._max_latency:
+                    self._max_latency = latency
+
+
 class AnalogUnscaledReader(ChannelReaderBase):
     """
     Reads unscaled samples from one or more analog input channels in an
@@ -451,10 +1136,37 @@ class AnalogUnscaledReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, True, True)
+        self._in_stream._verify_readable()
 
-        return _read_binary_i_16(
+        samples_read = _read_binary_i_16(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_unscaled_samples(data[:, :samples_read])
+        if self._block_processors:
+            self._process_block(data[:, :samples_read])
+
+        return samples_read
+
+    def read_int16_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_int16" method, which runs the
+        read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_int16" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_int16, data, number_of_samples_per_channel, timeout)
 
     def read_int32(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
@@ -534,10 +1246,37 @@ class AnalogUnscaledReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, True, True)
+        self._in_stream._verify_readable()
 
-        return _read_binary_i_32(
+        samples_read = _read_binary_i_32(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_unscaled_samples(data[:, :samples_read])
+        if self._block_processors:
+            self._process_block(data[:, :samples_read])
+
+        return samples_read
+
+    def read_int32_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_int32" method, which runs the
+        read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_int32" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_int32, data, number_of_samples_per_channel, timeout)
 
     def read_uint16(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
@@ -617,10 +1356,37 @@ class AnalogUnscaledReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, True, True)
+        self._in_stream._verify_readable()
 
-        return _read_binary_u_16(
+        samples_read = _read_binary_u_16(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_unscaled_samples(data[:, :samples_read])
+        if self._block_processors:
+            self._process_block(data[:, :samples_read])
+
+        return samples_read
+
+    def read_uint16_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_uint16" method, which runs the
+        read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_uint16" method for more info
+        on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_uint16, data, number_of_samples_per_channel, timeout)
 
     def read_uint32(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
@@ -700,10 +1466,37 @@ class AnalogUnscaledReader(ChannelReaderBase):
                 number_of_samples_per_channel))
 
         self._verify_array(data, number_of_samples_per_channel, True, True)
+        self._in_stream._verify_readable()
 
-        return _read_binary_u_32(
+        samples_read = _read_binary_u_32(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        self._in_stream._log_unscaled_samples(data[:, :samples_read])
+        if self._block_processors:
+            self._process_block(data[:, :samples_read])
+
+        return samples_read
+
+    def read_uint32_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_uint32" method, which runs the
+        read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_uint32" method for more info
+        on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_uint32, data, number_of_samples_per_channel, timeout)
 
 
 class CounterReader(ChannelReaderBase):
@@ -777,9 +1570,35 @@ class CounterReader(ChannelReaderBase):
 
         self._verify_array(data, number_of_samples_per_channel, False, True)
 
-        return _read_counter_f_64(
+        samples_read = _read_counter_f_64(
             self._handle, data, number_of_samples_per_channel,
             timeout)
+        if self._block_processors:
+            self._process_block(data[numpy.newaxis, :samples_read])
+
+        return samples_read
+
+    def read_many_sample_double_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_double" method,
+        which runs the read on a bounded thread pool instead of blocking
+        the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_double" method for
+        more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_double, data,
+            number_of_samples_per_channel, timeout)
 
     def read_many_sample_pulse_frequency(
             self, frequencies, duty_cycles,
@@ -862,6 +1681,28 @@ class CounterReader(ChannelReaderBase):
             self._handle, frequencies, duty_cycles,
             number_of_samples_per_channel, timeout)
 
+    def read_many_sample_pulse_frequency_async(
+            self, frequencies, duty_cycles,
+            number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_pulse_frequency"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_pulse_frequency"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_frequency, frequencies, duty_cycles,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_pulse_ticks(
             self, high_ticks, low_ticks,
             number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
@@ -943,6 +1784,28 @@ class CounterReader(ChannelReaderBase):
             self._handle, high_ticks, low_ticks,
             number_of_samples_per_channel, timeout)
 
+    def read_many_sample_pulse_ticks_async(
+            self, high_ticks, low_ticks,
+            number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_pulse_ticks"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_pulse_ticks"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_ticks, high_ticks, low_ticks,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_pulse_time(
             self, high_times, low_times,
             number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
@@ -1024,6 +1887,177 @@ class CounterReader(ChannelReaderBase):
             self._handle, high_times, low_times,
             number_of_samples_per_channel, timeout)
 
+    def read_many_sample_pulse_time_async(
+            self, high_times, low_times,
+            number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_pulse_time"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_pulse_time" method
+        for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_time, high_times, low_times,
+            number_of_samples_per_channel, timeout)
+
+    def read_many_sample_pulse_frequency_array(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Reads one or more pulse samples in terms of frequency from a
+        single counter input channel in a task into a CtrFreqArray.
+
+        See the "read_many_sample_pulse_frequency" method for more info.
+
+        Args:
+            data (artdaq.types.CtrFreqArray): Specifies preallocated 1D
+                NumPy arrays of floating-point values to hold the
+                frequency and duty cycle portions of the pulse samples
+                requested.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available.
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+        """
+        return self.read_many_sample_pulse_frequency(
+            data.freq, data.duty_cycle, number_of_samples_per_channel,
+            timeout)
+
+    def read_many_sample_pulse_frequency_array_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the
+        "read_many_sample_pulse_frequency_array" method, which runs the
+        read on a bounded thread pool instead of blocking the event
+        loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the
+        "read_many_sample_pulse_frequency_array" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_frequency_array, data,
+            number_of_samples_per_channel, timeout)
+
+    def read_many_sample_pulse_ticks_array(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Reads one or more pulse samples in terms of ticks from a single
+        counter input channel in a task into a CtrTickArray.
+
+        See the "read_many_sample_pulse_ticks" method for more info.
+
+        Args:
+            data (artdaq.types.CtrTickArray): Specifies preallocated 1D
+                NumPy arrays of 32-bit unsigned integer values to hold
+                the high ticks and low ticks portions of the pulse
+                samples requested.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available.
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+        """
+        return self.read_many_sample_pulse_ticks(
+            data.high_tick, data.low_tick, number_of_samples_per_channel,
+            timeout)
+
+    def read_many_sample_pulse_ticks_array_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_pulse_ticks_array"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_pulse_ticks_array"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_ticks_array, data,
+            number_of_samples_per_channel, timeout)
+
+    def read_many_sample_pulse_time_array(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Reads one or more pulse samples in terms of time from a single
+        counter input channel in a task into a CtrTimeArray.
+
+        See the "read_many_sample_pulse_time" method for more info.
+
+        Args:
+            data (artdaq.types.CtrTimeArray): Specifies preallocated 1D
+                NumPy arrays of floating-point values to hold the high
+                time and low time portions of the pulse samples
+                requested.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available.
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+        """
+        return self.read_many_sample_pulse_time(
+            data.high_time, data.low_time, number_of_samples_per_channel,
+            timeout)
+
+    def read_many_sample_pulse_time_array_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_pulse_time_array"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_pulse_time_array"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_pulse_time_array, data,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_uint32(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -1094,6 +2128,28 @@ class CounterReader(ChannelReaderBase):
             self._handle, data, number_of_samples_per_channel,
             timeout)
 
+    def read_many_sample_uint32_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_uint32" method,
+        which runs the read on a bounded thread pool instead of blocking
+        the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_uint32" method for
+        more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_uint32, data,
+            number_of_samples_per_channel, timeout)
+
     def read_one_sample_double(self, timeout=10):
         """
         Reads a single floating-point sample from a single counter input
@@ -1281,6 +2337,28 @@ class DigitalSingleChannelReader(ChannelReaderBase):
         return _read_digital_u_8(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_byte_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_byte" method,
+        which runs the read on a bounded thread pool instead of blocking
+        the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_byte" method
+        for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_byte, data,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_port_uint16(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -1352,6 +2430,28 @@ class DigitalSingleChannelReader(ChannelReaderBase):
         return _read_digital_u_16(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_uint16_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_uint16"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_uint16"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_uint16, data,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_port_uint32(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -1423,6 +2523,28 @@ class DigitalSingleChannelReader(ChannelReaderBase):
         return _read_digital_u_32(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_uint32_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_uint32"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_uint32"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_uint32, data,
+            number_of_samples_per_channel, timeout)
+
     def read_one_sample_multi_line(self, data, timeout=10):
         """
         Reads a single boolean sample from a single digital input
@@ -1657,6 +2779,28 @@ class DigitalMultiChannelReader(ChannelReaderBase):
         return _read_digital_u_8(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_byte_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_byte" method,
+        which runs the read on a bounded thread pool instead of blocking
+        the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_byte" method
+        for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_byte, data,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_port_uint16(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -1741,6 +2885,28 @@ class DigitalMultiChannelReader(ChannelReaderBase):
         return _read_digital_u_16(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_uint16_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_uint16"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_uint16"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_uint16, data,
+            number_of_samples_per_channel, timeout)
+
     def read_many_sample_port_uint32(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -1825,6 +2991,28 @@ class DigitalMultiChannelReader(ChannelReaderBase):
         return _read_digital_u_32(
             self._handle, data, number_of_samples_per_channel, timeout)
 
+    def read_many_sample_port_uint32_async(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Asynchronous version of the "read_many_sample_port_uint32"
+        method, which runs the read on a bounded thread pool instead of
+        blocking the event loop.
+
+        Must be called from a coroutine or callback running on an
+        asyncio event loop. See the "read_many_sample_port_uint32"
+        method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            acquired by each channel.
+        """
+        return run_async(
+            self.read_many_sample_port_uint32, data,
+            number_of_samples_per_channel, timeout)
+
     def read_one_sample_multi_line(self, data, timeout=10):
         """
         Reads a single boolean sample from one or more digital input
@@ -0,0 +1,180 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import threading
+
+import numpy
+from artdaq._block_processor import BlockProcessor
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.types import ChannelStatistics
+
+__all__ = ['StreamStatistics']
+
+
+# Summarizes a number of samples of each channel by their count, mean,
+# sum of squared deviations from the mean, minimum and maximum.
+_Summary = collections.namedtuple(
+    '_Summary', ['count', 'mean', 'm2', 'minimum', 'maximum'])
+
+
+def _summarize(data):
+    count = data.shape[1]
+    mean = data.mean(axis=1)
+    deviations = data - mean[:, numpy.newaxis]
+    return _Summary(
+        count, mean, numpy.einsum('ij,ij->i', deviations, deviations),
+        data.min(axis=1), data.max(axis=1))
+
+
+def _merge(a, b):
+    """
+    Combines two summaries with the pairwise update of Chan et al., which
+    stays accurate when the mean is large compared with the spread.
+    """
+    if a is None:
+        return b
+    count = a.count + b.count
+    delta = b.mean - a.mean
+    return _Summary(
+        count, a.mean + delta * (b.count / count),
+        a.m2 + b.m2 + delta * delta * (a.count * b.count / count),
+        numpy.minimum(a.minimum, b.minimum),
+        numpy.maximum(a.maximum, b.maximum))
+
+
+class StreamStatistics(BlockProcessor):
+    """
+    Keeps the minimum, maximum, mean, RMS, standard deviation and
+    peak-to-peak value of each channel of a stream, updated block by
+    block, so that the samples do not have to be kept to compute them.
+
+    Each block is reduced to a per-channel summary with a few vectorized
+    passes, and summaries are merged with a numerically stable pairwise
+    update of the mean and the sum of squared deviations. With a window,
+    the statistics cover only the most recent blocks, whose summaries
+    are kept and merged when the statistics are read.
+
+    Attach the accumulator to a stream reader to update it with every
+    block the reader reads, or pass blocks to "update".
+    """
+
+    def __init__(self, channels=None, window=None, reset_on_read=False):
+        """
+        Args:
+            channels (Optional[Union[slice, Sequence[int], Sequence[str]]]):
+                Specifies the rows of the blocks, or the names of the
+                channels the reader reads, to keep statistics of. None
+                selects every channel.
+            window (Optional[int]): Specifies the number of most recent
+                blocks the statistics cover. None covers every block
+                since the last reset.
+            reset_on_read (Optional[bool]): Specifies whether "read"
+                starts new statistics after returning the current ones,
+                so that each read covers the blocks since the previous
+                read.
+        """
+        if window is not None and window < 1:
+            raise DaqError(
+                'The window must hold at least 1 block.\n'
+                'Window: {0}'.format(window), Errors.UNKNOWN.value)
+
+        super(StreamStatistics, self).__init__(channels)
+        self._window = window
+        self._reset_on_read = reset_on_read
+        self._lock = threading.Lock()
+        self._reset()
+
+    @property
+    def window(self):
+        """
+        Optional[int]: Indicates the number of most recent blocks the
+            statistics cover.
+        """
+        return self._window
+
+    @property
+    def reset_on_read(self):
+        """
+        bool: Indicates whether "read" starts new statistics.
+        """
+        return self._reset_on_read
+
+    def update(self, data):
+        """
+        Adds a block of samples to the statistics.
+
+        Args:
+            data (numpy.ndarray): Specifies the block, with one row per
+                channel the reader reads, or a 1D array for a single
+                channel.
+        """
+        data = self._select(data)
+        if not data.shape[1]:
+            return
+
+        summary = _summarize(numpy.asarray(data, dtype=numpy.float64))
+        with self._lock:
+            self._verify_number_of_channels(
+                self._number_of_channels, data.shape[0])
+            self._number_of_channels = data.shape[0]
+
+            if self._window is None:
+                self._total = _merge(self._total, summary)
+            else:
+                self._blocks.append(summary)
+
+    def read(self):
+        """
+        Returns the statistics of each channel.
+
+        Returns:
+            artdaq.types.ChannelStatistics:
+
+            Indicates the number of samples per channel the statistics
+            cover, and arrays with the minimum, maximum, mean, RMS,
+            standard deviation and peak-to-peak value of each channel.
+            The arrays hold NaN if no samples were added.
+        """
+        self._raise_error()
+        with self._lock:
+            if self._window is None:
+                summary = self._total
+            else:
+                summary = None
+                for block in self._blocks:
+                    summary = _merge(summary, block)
+            number_of_channels = self._number_of_channels
+            if self._reset_on_read:
+                self._reset()
+
+        if summary is None:
+            empty = numpy.full(number_of_channels, numpy.nan)
+            return ChannelStatistics(
+                0, empty, empty.copy(), empty.copy(), empty.copy(),
+                empty.copy(), empty.copy())
+
+        variance = summary.m2 / summary.count
+        return ChannelStatistics(
+            summary.count, summary.minimum, summary.maximum, summary.mean,
+            numpy.sqrt(variance + summary.mean * summary.mean),
+            numpy.sqrt(variance), summary.maximum - summary.minimum)
+
+    def reset(self):
+        """
+        Discards the statistics, for example before the task is
+        restarted.
+        """
+        with self._lock:
+            self._reset()
+
+    def _on_block(self, data):
+        self.update(data)
+
+    def _reset(self):
+        self._number_of_channels = 0
+        self._total = None
+        self._blocks = collections.deque(maxlen=self._window)
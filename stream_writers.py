@@ -3,8 +3,14 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import itertools
+import threading
+import time
+
 import numpy
+import six
 from artdaq import DaqError
+from artdaq._task_modules.async_executor import run_async
 from artdaq._task_modules.write_functions import (
     _write_analog_f_64, _write_analog_scalar_f_64, _write_binary_i_16, _write_binary_u_16,
     _write_ctr_freq, _write_ctr_ticks, _write_ctr_time, _write_ctr_freq_scalar,
@@ -12,9 +18,10 @@ from artdaq._task_modules.write_functions import (
     _write_digital_u_16, _write_digital_u_32, _write_digital_lines,
     _write_digital_scalar_u_32)
 from artdaq.error_codes import Errors
+from artdaq.types import StreamingWriterStatistics
 
 __all__ = ['AnalogSingleChannelWriter', 'AnalogMultiChannelWriter',
-           'AnalogUnscaledWriter', 'CounterWriter',
+           'AnalogStreamingWriter', 'AnalogUnscaledWriter', 'CounterWriter',
            'DigitalSingleChannelWriter', 'DigitalMultiChannelWriter']
 
 
@@ -105,8 +112,7 @@ class ChannelWriterBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_channels = self._task._metadata.number_of_channels
 
         expected_num_dimensions = None
         if is_many_chan:
@@ -144,8 +150,7 @@ class ChannelWriterBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_channels = self._task._metadata.number_of_channels
         number_of_lines = self._out_stream.do_num_booleans_per_chan
 
         expected_num_dimensions = None
@@ -234,6 +239,24 @@ class AnalogSingleChannelWriter(ChannelWriterBase):
         return _write_analog_f_64(
             self._handle, data, data.shape[0], auto_start, timeout)
 
+    def write_many_sample_async(self, data, timeout=10.0):
+        """
+        Asynchronous version of the "write_many_sample" method, which
+        runs the write on a bounded thread pool instead of blocking the
+        event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "write_many_sample" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            written to each channel.
+        """
+        return run_async(self.write_many_sample, data, timeout)
+
     def write_one_sample(self, data, timeout=10):
         """
         Writes a single floating-point sample to a single analog output
@@ -314,6 +337,24 @@ class AnalogMultiChannelWriter(ChannelWriterBase):
         return _write_analog_f_64(
             self._handle, data, data.shape[1], auto_start, timeout)
 
+    def write_many_sample_async(self, data, timeout=10.0):
+        """
+        Asynchronous version of the "write_many_sample" method, which
+        runs the write on a bounded thread pool instead of blocking the
+        event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "write_many_sample" method for more info on
+        the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            written to each channel.
+        """
+        return run_async(self.write_many_sample, data, timeout)
+
     def write_one_sample(self, data, timeout=10):
         """
         Writes a single floating-point sample to one or more analog
@@ -348,6 +389,270 @@ class AnalogMultiChannelWriter(ChannelWriterBase):
             self._handle, data, 1, auto_start, timeout)
 
 
+class AnalogStreamingWriter(ChannelWriterBase):
+    """
+    Streams blocks of samples produced by a Python source to one or more
+    analog output channels in a continuous ArtDAQ task, driven by the
+    Every N Samples Transferred From Buffer event.
+
+    A prefetch thread takes blocks from the source ahead of time into a
+    bounded queue. Each time the device transfers a block of samples
+    from the buffer, the driver callback records a notification, and a
+    writer thread writes the next prefetched block into the room that
+    transfer freed. Producing a block therefore overlaps with the
+    transfer of earlier blocks.
+
+    Use this writer with "regen_mode" of the output stream set to
+    artdaq.constants.RegenerationMode.DONT_ALLOW_REGENERATION, and
+    configure the buffer, with the "samps_per_chan" input of
+    "cfg_samp_clk_timing", to hold at least "prime_blocks" blocks.
+
+    If no prefetched block is ready when a notification arrives, the
+    writer thread waits for the source and increments
+    "underflow_count". When the source runs out of blocks, the device
+    runs out of samples and the task stops with an error, unless you
+    stop it first.
+    """
+
+    def __init__(self, task_out_stream, source, samples_per_block,
+                 prefetch_depth=4, prime_blocks=2):
+        """
+        Args:
+            task_out_stream: Specifies the output stream associated with
+                an ArtDAQ task which to write samples.
+            source: Specifies an iterable, such as a generator, that
+                yields the blocks to write, or a function that takes the
+                sequence number of a block and returns it, or None once
+                there are no more blocks. Each block is a NumPy array
+                with one row per channel, or a 1D array if the task has
+                one channel, of "samples_per_block" samples per channel.
+                Only the last block may be shorter.
+            samples_per_block (int): Specifies the number of samples per
+                channel in each block, which is also the number of
+                samples after which each event occurs.
+            prefetch_depth (Optional[int]): Specifies the maximum number
+                of blocks taken from the source ahead of time.
+            prime_blocks (Optional[int]): Specifies the number of blocks
+                written to the buffer by "start", before the task starts.
+        """
+        super(AnalogStreamingWriter, self).__init__(task_out_stream)
+
+        if callable(source):
+            self._blocks = (
+                source(sequence_number)
+                for sequence_number in itertools.count())
+        else:
+            self._blocks = iter(source)
+
+        self._samples_per_block = samples_per_block
+        self._prefetch_depth = prefetch_depth
+        self._prime_blocks = prime_blocks
+
+        self._prefetched = six.moves.queue.Queue(prefetch_depth)
+        self._notifications = six.moves.queue.Queue()
+        self._lock = threading.Lock()
+
+        self._blocks_written = 0
+        self._underflow_count = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._exhausted = False
+
+        self._prefetch_thread = None
+        self._writer_thread = None
+        self._stopping = False
+        self._error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    @property
+    def samples_per_block(self):
+        """
+        int: Indicates the number of samples per channel in each block.
+        """
+        return self._samples_per_block
+
+    @property
+    def is_exhausted(self):
+        """
+        bool: Indicates whether every block of the source has been
+            written.
+        """
+        return self._exhausted
+
+    @property
+    def statistics(self):
+        """
+        :class:`artdaq.types.StreamingWriterStatistics`: Indicates the
+            number of blocks written, the number of times no prefetched
+            block was ready when the device needed one, the number of
+            blocks prefetched, and the mean and maximum time in seconds
+            from the driver event to the end of the write of a block.
+        """
+        with self._lock:
+            written_after_event = max(
+                self._blocks_written - self._prime_blocks, 0)
+            if written_after_event:
+                mean_latency = self._total_latency / written_after_event
+            else:
+                mean_latency = 0.0
+
+            return StreamingWriterStatistics(
+                self._blocks_written, self._underflow_count,
+                self._prefetched.qsize(), mean_latency, self._max_latency)
+
+    def start(self):
+        """
+        Starts the prefetch thread, writes the first "prime_blocks"
+        blocks to the buffer, registers the Every N Samples Transferred
+        From Buffer event on the task and starts the writer thread.
+
+        Call this method before you start the task. Registering the
+        event replaces any Every N Samples Transferred From Buffer
+        callback registered on the task before.
+        """
+        if self._writer_thread is not None:
+            return
+
+        self._stopping = False
+        self._error = None
+
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_blocks, name='AnalogStreamingPrefetcher')
+        self._prefetch_thread.daemon = True
+        self._prefetch_thread.start()
+
+        for _ in range(self._prime_blocks):
+            if not self._write_next_block(None):
+                break
+        self._raise_error()
+
+        self._writer_thread = threading.Thread(
+            target=self._write_blocks, name='AnalogStreamingWriter')
+        self._writer_thread.daemon = True
+        self._writer_thread.start()
+
+        self._task.register_every_n_samples_transferred_from_buffer_event(
+            self._samples_per_block, self._on_every_n_samples)
+
+    def stop(self):
+        """
+        Unregisters the event and stops the prefetch and writer threads.
+
+        Stopping the writer does not stop the task. If the source or a
+        write raised an exception, this method raises it.
+        """
+        if self._writer_thread is None:
+            return
+
+        self._task.register_every_n_samples_transferred_from_buffer_event(
+            self._samples_per_block, None)
+
+        self._stopping = True
+        self._notifications.put(None)
+        self._writer_thread.join()
+        self._prefetch_thread.join()
+        self._writer_thread = None
+        self._prefetch_thread = None
+
+        self._raise_error()
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _on_every_n_samples(self, task_handle, every_n_samples_event_type,
+                            number_of_samples, callback_data):
+        self._notifications.put(time.time())
+        return 0
+
+    def _prefetch_blocks(self):
+        number_of_channels = self._task._metadata.number_of_channels
+        try:
+            for block in self._blocks:
+                if block is None:
+                    break
+
+                block = numpy.ascontiguousarray(block, dtype=numpy.float64)
+                if block.ndim == 1:
+                    block = block.reshape(1, -1)
+                if block.shape[0] != number_of_channels:
+                    self._task._raise_invalid_write_num_chans_error(
+                        number_of_channels, block.shape[0])
+
+                while not self._stopping:
+                    try:
+                        self._prefetched.put(block, timeout=0.05)
+                        break
+                    except six.moves.queue.Full:
+                        pass
+                else:
+                    return
+        except Exception as e:
+            self._error = e
+        finally:
+            # Waits for room for the end marker, unless the writer
+            # thread is gone.
+            while not self._stopping:
+                try:
+                    self._prefetched.put(None, timeout=0.05)
+                    break
+                except six.moves.queue.Full:
+                    pass
+
+    def _write_next_block(self, notification_time):
+        try:
+            block = self._prefetched.get_nowait()
+        except six.moves.queue.Empty:
+            if notification_time is not None:
+                with self._lock:
+                    self._underflow_count += 1
+
+            block = None
+            while not self._stopping:
+                try:
+                    block = self._prefetched.get(timeout=0.05)
+                    break
+                except six.moves.queue.Empty:
+                    pass
+            else:
+                return False
+
+        if block is None:
+            self._exhausted = True
+            return False
+
+        _write_analog_f_64(
+            self._handle, block, block.shape[1], False,
+            self._out_stream.timeout)
+
+        with self._lock:
+            self._blocks_written += 1
+            if notification_time is not None:
+                latency = time.time() - notification_time
+                self._total_latency += latency
+                if latency > self._max_latency:
+                    self._max_latency = latency
+        return True
+
+    def _write_blocks(self):
+        try:
+            while not self._exhausted:
+                notification_time = self._notifications.get()
+                if notification_time is None:
+                    break
+                self._write_next_block(notification_time)
+        except Exception as e:
+            self._error = e
+            self._stopping = True
+
+
 class AnalogUnscaledWriter(ChannelWriterBase):
     """
     Writes unscaled samples to one or more analog output channels in
@@ -603,6 +908,74 @@ class CounterWriter(ChannelWriterBase):
             self._handle, high_times, low_times, high_times.shape[0],
             auto_start, timeout)
 
+    def write_many_sample_pulse_frequency_array(self, data, timeout=10.0):
+        """
+        Writes one or more pulse samples in terms of frequency, held in
+        a CtrFreqArray, to a single counter output channel in a task.
+
+        See the "write_many_sample_pulse_frequency" method for more info.
+
+        Args:
+            data (artdaq.types.CtrFreqArray): Contains 1D NumPy arrays of
+                floating-point values that hold the frequency and duty
+                cycle portions of the pulse samples to write to the
+                task.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples.
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """
+        return self.write_many_sample_pulse_frequency(
+            data.freq, data.duty_cycle, timeout)
+
+    def write_many_sample_pulse_ticks_array(self, data, timeout=10.0):
+        """
+        Writes one or more pulse samples in terms of ticks, held in a
+        CtrTickArray, to a single counter output channel in a task.
+
+        See the "write_many_sample_pulse_ticks" method for more info.
+
+        Args:
+            data (artdaq.types.CtrTickArray): Contains 1D NumPy arrays of
+                32-bit unsigned integer values that hold the high ticks
+                and low ticks portions of the pulse samples to write to
+                the task.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples.
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """
+        return self.write_many_sample_pulse_ticks(
+            data.high_tick, data.low_tick, timeout)
+
+    def write_many_sample_pulse_time_array(self, data, timeout=10.0):
+        """
+        Writes one or more pulse samples in terms of time, held in a
+        CtrTimeArray, to a single counter output channel in a task.
+
+        See the "write_many_sample_pulse_time" method for more info.
+
+        Args:
+            data (artdaq.types.CtrTimeArray): Contains 1D NumPy arrays of
+                floating-point values that hold the high time and low
+                time portions of the pulse samples to write to the task.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples.
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """
+        return self.write_many_sample_pulse_time(
+            data.high_time, data.low_time, timeout)
+
     def write_one_sample_pulse_frequency(
             self, frequency, duty_cycle, timeout=10):
         """
@@ -0,0 +1,268 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from artdaq.constants import Edge, Signal
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.types import SynchronizedBlock
+
+__all__ = ['SyncCoordinator']
+
+
+class SyncCoordinator(object):
+    """
+    Runs several tasks as one synchronized acquisition.
+
+    One task is the master and the others are slaves. The coordinator
+    can route the sample clock timebase and the start trigger of the
+    master to the slaves, starts the slaves before the master so that
+    they are armed when the master starts, and reads every task
+    concurrently, one thread per task, so that an iteration takes as
+    long as the slowest read instead of the sum of all reads.
+
+    Each read returns a SynchronizedBlock that holds the same number of
+    samples per channel from every task, in the data type each task
+    reads, together with the index of the first sample and its time.
+    """
+
+    def __init__(self, master, slaves, timebase_terminal=None,
+                 trigger_terminal=None, trigger_edge=Edge.RISING):
+        """
+        Args:
+            master (artdaq.task.Task): Specifies the task whose start
+                starts the acquisition.
+            slaves (Sequence[artdaq.task.Task]): Specifies the tasks
+                that follow the master.
+            timebase_terminal (Optional[str]): Specifies the terminal
+                through which to share the sample clock timebase of the
+                master with the slaves. If None, the timebase is not
+                routed.
+            trigger_terminal (Optional[str]): Specifies the terminal
+                through which to share the start trigger of the master
+                with the slaves. If None, the trigger is not routed, and
+                the tasks are only started in order.
+            trigger_edge (Optional[artdaq.constants.Edge]): Specifies the
+                edge of the shared start trigger on which the slaves
+                start.
+        """
+        self._master = master
+        self._slaves = tuple(slaves)
+        self._tasks = (master,) + self._slaves
+        self._verify_tasks()
+        self._lock = threading.Lock()
+        # One thread per task keeps the reads of each task in order when
+        # the reads of the next block are issued ahead.
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1,
+                               thread_name_prefix='artdaq-sync')
+            for _ in self._tasks]
+        self._running = False
+        self._start_time = None
+        self._next_sample_index = 0
+        self._next_sequence_number = 0
+
+        if timebase_terminal:
+            master.timing.samp_clk_timebase_outputterm(timebase_terminal)
+            for slave in self._slaves:
+                slave.timing.samp_clk_timebase_src(timebase_terminal)
+
+        if trigger_terminal:
+            master.export_signals.export_signal(
+                Signal.START_TRIGGER, trigger_terminal)
+            for slave in self._slaves:
+                slave.triggers.start_trigger.cfg_dig_edge_start_trig(
+                    trigger_terminal, trigger_edge=trigger_edge)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def master(self):
+        """
+        artdaq.task.Task: Indicates the master task.
+        """
+        return self._master
+
+    @property
+    def slaves(self):
+        """
+        Tuple[artdaq.task.Task]: Indicates the slave tasks.
+        """
+        return self._slaves
+
+    @property
+    def tasks(self):
+        """
+        Tuple[artdaq.task.Task]: Indicates the master followed by the
+            slaves, in the order of the data of each SynchronizedBlock.
+        """
+        return self._tasks
+
+    def start(self):
+        """
+        Starts the slaves, then the master.
+
+        If a task fails to start, the tasks already started are stopped.
+        """
+        started = []
+        try:
+            for task in self._slaves + (self._master,):
+                task.start()
+                started.append(task)
+        except BaseException:
+            for task in reversed(started):
+                try:
+                    task.stop()
+                except DaqError:
+                    pass
+            raise
+
+        with self._lock:
+            self._running = True
+            self._start_time = time.time()
+            self._next_sample_index = 0
+            self._next_sequence_number = 0
+
+    def stop(self):
+        """
+        Stops the master, then the slaves. Every task is stopped even if
+        stopping one of them fails; the first error is raised afterwards.
+        """
+        with self._lock:
+            self._running = False
+
+        error = None
+        for task in self._tasks:
+            try:
+                task.stop()
+            except DaqError as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Stops the tasks if they are running and releases the read
+        threads. The tasks themselves are not closed.
+        """
+        try:
+            if self._running:
+                self.stop()
+        finally:
+            for executor in self._executors:
+                executor.shutdown(wait=True)
+
+    def read(self, number_of_samples_per_channel, timeout=10.0):
+        """
+        Reads the same number of samples per channel from every task
+        concurrently.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read from each task.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for the samples of each task.
+        Returns:
+            artdaq.types.SynchronizedBlock:
+
+            Indicates the samples of every task.
+        """
+        return self._collect(
+            self._submit(number_of_samples_per_channel, timeout))
+
+    def iter_blocks(self, number_of_samples_per_channel, number_of_blocks=None,
+                    timeout=10.0):
+        """
+        Reads consecutive blocks from every task.
+
+        The reads of the next block are issued before the current block
+        is returned, so processing a block overlaps with acquiring the
+        next one.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel in each block.
+            number_of_blocks (Optional[int]): Specifies the number of
+                blocks to read. By default, reads until the iteration is
+                abandoned or a read fails.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for the samples of each task.
+        Returns:
+            Iterator[artdaq.types.SynchronizedBlock]:
+
+            Indicates the blocks.
+        """
+        blocks_read = 0
+        pending = None
+        try:
+            while number_of_blocks is None or blocks_read < number_of_blocks:
+                if pending is None:
+                    pending = self._submit(
+                        number_of_samples_per_channel, timeout)
+                current = pending
+                blocks_read += 1
+                pending = None
+                if number_of_blocks is None or blocks_read < number_of_blocks:
+                    pending = self._submit(
+                        number_of_samples_per_channel, timeout)
+                yield self._collect(current)
+        finally:
+            if pending is not None:
+                # Waits for the reads issued ahead so that no read is left
+                # running on the tasks.
+                for future in pending[3]:
+                    future.exception()
+
+    def _submit(self, number_of_samples_per_channel, timeout):
+        with self._lock:
+            sequence_number = self._next_sequence_number
+            sample_index = self._next_sample_index
+            self._next_sequence_number += 1
+            self._next_sample_index += number_of_samples_per_channel
+
+        futures = [
+            executor.submit(
+                task.read_into, number_of_samples_per_channel, timeout)
+            for task, executor in zip(self._tasks, self._executors)]
+        return (sequence_number, sample_index, number_of_samples_per_channel,
+                futures)
+
+    def _collect(self, submitted):
+        sequence_number, sample_index, _, futures = submitted
+
+        data = []
+        error = None
+        for future in futures:
+            try:
+                data.append(future.result())
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+        return SynchronizedBlock(
+            sequence_number, sample_index,
+            self._get_sample_time(sample_index), tuple(data))
+
+    def _get_sample_time(self, sample_index):
+        rate = self._master.timing.samp_clk_rate
+        if self._start_time is None or not rate:
+            return None
+        return self._start_time + sample_index / rate
+
+    def _verify_tasks(self):
+        if len(set(id(task) for task in self._tasks)) != len(self._tasks):
+            raise DaqError(
+                'A task cannot take part in a synchronized acquisition '
+                'more than once.', Errors.UNKNOWN.value)
@@ -13,6 +13,8 @@ from artdaq._task_modules.ai_channel_collection import (
     AIChannelCollection)
 from artdaq._task_modules.ao_channel_collection import (
     AOChannelCollection)
+from artdaq._task_modules.async_executor import (
+    AsyncBlockIterator, run_async)
 from artdaq._task_modules.calibration import Calibration
 from artdaq._task_modules.channels.channel import Channel
 from artdaq._task_modules.channels.cio_channel import CIOChannel
@@ -28,6 +30,7 @@ from artdaq._task_modules.out_stream import OutStream
 from artdaq._task_modules.read_functions import (
     _read_analog_f_64, _read_digital_lines, _read_digital_u_32, _read_ctr_freq,
     _read_ctr_time, _read_ctr_ticks, _read_counter_u_32, _read_counter_f_64)
+from artdaq._task_modules.task_metadata import TaskMetadataCache
 from artdaq._task_modules.timing import Timing
 from artdaq._task_modules.triggers import Triggers
 from artdaq._task_modules.write_functions import (
@@ -35,12 +38,12 @@ from artdaq._task_modules.write_functions import (
     _write_ctr_freq, _write_ctr_time, _write_ctr_ticks)
 from artdaq.constants import (
     AcquisitionType, ChannelType, UsageTypeCI, EveryNSamplesEventType,
-    READ_ALL_AVAILABLE, UsageTypeCO, LineGrouping)
+    READ_ALL_AVAILABLE, UsageTypeCO, LineGrouping, TaskControl)
 from artdaq.error_codes import Errors
 from artdaq.errors import (
     check_for_error, is_string_buffer_too_small, DaqError, DaqResourceWarning)
-from artdaq.types import CtrFreq, CtrTick, CtrTime
-from artdaq.utils import unflatten_channel_string, flatten_channel_string
+from artdaq.types import (
+    CtrFreq, CtrTick, CtrTime, CtrFreqArray, CtrTickArray, CtrTimeArray)
 
 __all__ = ['Task']
 
@@ -59,6 +62,14 @@ AUTO_START_UNSET = UnsetAutoStartSentinel()
 del UnsetNumSamplesSentinel
 del UnsetAutoStartSentinel
 
+_PULSE_SAMPLE_TYPES = {
+    CtrFreqArray: CtrFreq,
+    CtrTimeArray: CtrTime,
+    CtrTickArray: CtrTick,
+}
+
+_PULSE_ARRAY_TYPES = tuple(_PULSE_SAMPLE_TYPES)
+
 
 class Task(object):
     """
@@ -107,6 +118,10 @@ class Task(object):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
+            # A closed task has no handle, and the driver may reuse the
+            # value of its handle, so it is only equal to itself.
+            if self._handle is None or other._handle is None:
+                return self is other
             return self._handle == other._handle
         return False
 
@@ -117,7 +132,7 @@ class Task(object):
 
 
     def __hash__(self):
-        return hash(self._handle)
+        return self._hash
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -168,73 +183,21 @@ class Task(object):
             channels in this task.
         """
         return Channel._factory(
-            self._handle, flatten_channel_string(self.channel_names))
+            self._handle, self._metadata.flattened_channel_names)
 
     @property
     def channel_names(self):
         """
         List[str]: Indicates the names of all virtual channels in the task.
         """
-        cfunc = lib_importer.windll.ArtDAQ_GetTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_char_p,
-                        ctypes.c_int]
-
-        temp_size = 256
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
-
-            size_or_code = cfunc(
-                self._handle, 0x1273, val, temp_size)
-
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
-
-        check_for_error(size_or_code)
-
-        return unflatten_channel_string(val.value.decode('ascii'))
+        return list(self._metadata.channel_names)
 
     @property
     def number_of_channels(self):
         """
         int: Indicates the number of virtual channels in the task.
         """
-        cfunc = lib_importer.windll.ArtDAQ_GetTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_char_p,
-                        ctypes.c_int]
-
-        temp_size = 256
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
-
-            size_or_code = cfunc(
-                self._handle, 0x1273, val, temp_size)
-
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
-
-        check_for_error(size_or_code)
-
-        return unflatten_channel_string(val.value.decode('ascii'))
+        return self._metadata.number_of_channels
 
     @property
     def task_type(self):
@@ -340,11 +303,22 @@ class Task(object):
         # double closes.
         self._saved_name = self.name
 
-        self._ai_channels = AIChannelCollection(task_handle)
-        self._ao_channels = AOChannelCollection(task_handle)
-        self._cio_channels = CIOChannelCollection(task_handle)
-        self._di_channels = DIChannelCollection(task_handle)
-        self._do_channels = DOChannelCollection(task_handle)
+        # The handle is set to None when the task is closed, so the hash
+        # is taken from its value now to stay stable for the lifetime of
+        # the task. Tasks that compare equal share a handle value.
+        self._hash = hash(task_handle.value)
+
+        # Channel names and counts are needed on every read and write, so
+        # they are cached and shared with the channel collections, which
+        # invalidate the cache whenever they add channels.
+        self._metadata = TaskMetadataCache(task_handle)
+
+        self._ai_channels = AIChannelCollection(task_handle, self._metadata)
+        self._ao_channels = AOChannelCollection(task_handle, self._metadata)
+        self._cio_channels = CIOChannelCollection(
+            task_handle, self._metadata)
+        self._di_channels = DIChannelCollection(task_handle, self._metadata)
+        self._do_channels = DOChannelCollection(task_handle, self._metadata)
         self._export_signals = ExportSignals(task_handle)
         self._in_stream = InStream(self)
         self._timing = Timing(task_handle)
@@ -411,12 +385,44 @@ class Task(object):
                     cfunc.argtypes = [
                         lib_importer.task_handle]
 
+        self._in_stream._close_logging()
+
         error_code = cfunc(self._handle)
         if(error_code == 0):
             self._handle = None
         check_for_error(error_code)
         return 0
 
+    def control(self, action):
+        """
+        Alters the state of a task according to the action you specify.
+
+        Verifying, reserving and committing a task ahead of time moves
+        that work out of "start", so that the task starts with the
+        lowest latency. Stopping a committed task returns it to the
+        committed state, so it can be started again without being
+        committed again.
+
+        Args:
+            action (artdaq.constants.TaskControl): Specifies how to alter
+                the task state.
+        """
+        cfunc = lib_importer.windll.ArtDAQ_TaskControl
+        if cfunc.argtypes is None:
+            with cfunc.arglock:
+                if cfunc.argtypes is None:
+                    cfunc.argtypes = [
+                        lib_importer.task_handle, ctypes.c_int]
+
+        if action in (TaskControl.TASK_STOP, TaskControl.TASK_ABORT):
+            self._in_stream._stop_logging()
+
+        error_code = cfunc(self._handle, action.value)
+        check_for_error(error_code)
+
+        if action == TaskControl.TASK_START:
+            self._in_stream._start_logging()
+
     def is_task_done(self):
         """
         Queries the status of the task and indicates if it completed
@@ -444,7 +450,7 @@ class Task(object):
         return is_task_done.value
 
     def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET,
-             timeout=10.0):
+             timeout=10.0, columnar=False):
         """
         Reads samples from the task or virtual channels you specify.
 
@@ -505,6 +511,12 @@ class Task(object):
                 indefinitely. If you set timeout to 0, the method tries
                 once to read the requested samples and returns an error
                 if it is unable to.
+            columnar (Optional[bool]): Specifies whether counter pulse
+                frequency, pulse time and pulse ticks measurements return
+                multiple samples as a single CtrFreqArray, CtrTimeArray
+                or CtrTickArray holding one NumPy array per field,
+                instead of a list with one CtrFreq, CtrTime or CtrTick
+                per sample. Has no effect on other measurements.
         Returns:
             dynamic:
 
@@ -524,8 +536,69 @@ class Task(object):
             >>> type(data[0])
             <type 'float'>
         """
-        channels_to_read = self.in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
+        data = self.read_into(number_of_samples_per_channel, timeout)
+
+        # Counter pulse measurements return namedtuples.
+        if isinstance(data, tuple):
+            sample_type = _PULSE_SAMPLE_TYPES.get(type(data))
+            if sample_type is None or columnar:
+                return data
+            return [sample_type(a, b) for a, b in zip(*data)]
+
+        return data.tolist()
+
+    def read_into(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET,
+                  timeout=10.0, out=None):
+        """
+        Reads samples from the task or virtual channels you specify into
+        NumPy arrays.
+
+        This method follows the same shape inference rules as the "read"
+        method, but returns the samples as NumPy arrays instead of Python
+        lists, which avoids converting every sample to a Python object.
+        If fewer samples than requested are read, the returned array is
+        a view of the first samples of the array read into.
+
+        If you do not set the number of samples per channel, this method
+        returns either a NumPy scalar (1 channel to read) or a 1D array
+        (N channels to read). If you set the number of samples per
+        channel, this method returns either a 1D array (1 channel to
+        read) or a 2D array (N channels to read).
+
+        Counter pulse frequency, pulse time and pulse ticks measurements
+        return a CtrFreqArray, CtrTimeArray or CtrTickArray, holding one
+        array per field, or a single CtrFreq, CtrTime or CtrTick if you do
+        not set the number of samples per channel.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See the "read" method for
+                more info.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See the
+                "read" method for more info.
+            out (Optional[numpy.ndarray]): Specifies a C-contiguous
+                NumPy array to read samples into, instead of allocating a
+                new array on every call. Its shape and data type must
+                match the array this method would otherwise allocate. For
+                counter pulse measurements, specify a tuple of two
+                arrays, such as a CtrFreqArray.
+        Returns:
+            dynamic:
+
+            The samples requested in the form of a NumPy scalar, a NumPy
+            array, or a namedtuple for counter pulse measurements.
+            See method docstring for more info.
+
+        Example:
+            >>> task = Task()
+            >>> task.ai_channels.add_ai_voltage_chan('Dev1/ai0:3')
+            >>> buffer = numpy.zeros((4, 1000), dtype=numpy.float64)
+            >>> data = task.read_into(1000, out=buffer)
+            >>> data.shape
+            (4, 1000)
+        """
+        number_of_channels = self._metadata.number_of_read_channels
         read_chan_type = self.task_type
 
         num_samples_not_set = (number_of_samples_per_channel is
@@ -546,78 +619,69 @@ class Task(object):
 
         # Analog Input
         if read_chan_type == ChannelType.ANALOG_INPUT:
-            data = numpy.zeros(array_shape, dtype=numpy.float64)
+            self._in_stream._verify_readable()
+            data = self._get_read_array(out, array_shape, numpy.float64)
             samples_read = _read_analog_f_64(
                 self._handle, data, number_of_samples_per_channel, timeout)
 
+            if num_samples_not_set:
+                self._in_stream._log_samples(data)
+            elif number_of_channels > 1:
+                self._in_stream._log_samples(data[:, :samples_read])
+            else:
+                self._in_stream._log_samples(data[:samples_read])
+
         # Digital Input or Digital Output
         elif read_chan_type == ChannelType.DIGITAL_IN:
-            # if self.in_stream.di_num_booleans_per_chan == 1:
-            #     data = numpy.zeros(array_shape, dtype=numpy.bool)
-            #     samples_read = _read_digital_lines(
-            #         self._handle, data, number_of_samples_per_channel, timeout
-            #         ).samps_per_chan_read
-            # else:
-            #     data = numpy.zeros(array_shape, dtype=numpy.uint32)
-            #     samples_read = _read_digital_u_32(
-            #         self._handle, data, number_of_samples_per_channel, timeout)
-
             if Channel.line_grouping == LineGrouping.CHAN_PER_LINE:
-                data = numpy.zeros(array_shape, dtype=numpy.bool)
+                data = self._get_read_array(out, array_shape, numpy.bool)
                 samples_read = _read_digital_lines(
                     self._handle, data, number_of_samples_per_channel, timeout
                 ).samps_per_chan_read
             else:
-                data = numpy.zeros(array_shape, dtype=numpy.uint32)
+                data = self._get_read_array(out, array_shape, numpy.uint32)
                 samples_read = _read_digital_u_32(
                     self._handle, data, number_of_samples_per_channel, timeout)
 
         # Counter Input or Digital Output
         elif read_chan_type == ChannelType.COUNTER:
-            # meas_type = channels_to_read.ci_meas_type
-
             meas_type = CIOChannel.ci_meas_type
-            if meas_type == UsageTypeCI.PULSE_FREQ:
-                frequencies = numpy.zeros(array_shape, dtype=numpy.float64)
-                duty_cycles = numpy.zeros(array_shape, dtype=numpy.float64)
-
-                samples_read = _read_ctr_freq(
-                    self._handle, frequencies, duty_cycles,
-                    number_of_samples_per_channel, timeout)
-
-                data = []
-                for f, d in zip(frequencies, duty_cycles):
-                    data.append(CtrFreq(freq=f, duty_cycle=d))
+            if meas_type in (UsageTypeCI.PULSE_FREQ, UsageTypeCI.PULSE_TIME,
+                             UsageTypeCI.PULSE_TICKS):
+                if meas_type == UsageTypeCI.PULSE_FREQ:
+                    dtype, read_function = numpy.float64, _read_ctr_freq
+                    array_type, sample_type = CtrFreqArray, CtrFreq
+                elif meas_type == UsageTypeCI.PULSE_TIME:
+                    dtype, read_function = numpy.float64, _read_ctr_time
+                    array_type, sample_type = CtrTimeArray, CtrTime
+                else:
+                    dtype, read_function = numpy.uint32, _read_ctr_ticks
+                    array_type, sample_type = CtrTickArray, CtrTick
 
-            elif meas_type == UsageTypeCI.PULSE_TIME:
-                high_times = numpy.zeros(array_shape, dtype=numpy.float64)
-                low_times = numpy.zeros(array_shape, dtype=numpy.float64)
+                first_out, second_out = out if out is not None else (None, None)
+                first = self._get_read_array(first_out, array_shape, dtype)
+                second = self._get_read_array(second_out, array_shape, dtype)
 
-                samples_read = _read_ctr_time(
-                    self._handle, high_times, low_times,
+                samples_read = read_function(
+                    self._handle, first, second,
                     number_of_samples_per_channel, timeout)
-                data = []
-                for h, l in zip(high_times, low_times):
-                    data.append(CtrTime(high_time=h, low_time=l))
 
-            elif meas_type == UsageTypeCI.PULSE_TICKS:
-                high_ticks = numpy.zeros(array_shape, dtype=numpy.uint32)
-                low_ticks = numpy.zeros(array_shape, dtype=numpy.uint32)
-
-                samples_read = _read_ctr_ticks(
-                    self._handle, high_ticks, low_ticks,
-                    number_of_samples_per_channel, timeout)
-                data = []
-                for h, l in zip(high_ticks, low_ticks):
-                    data.append(CtrTick(high_tick=h, low_tick=l))
+                if num_samples_not_set and array_shape == 1:
+                    return sample_type(first[0], second[0])
+                # Counter pulse measurements should not have N channel
+                # versions.
+                if samples_read != number_of_samples_per_channel:
+                    return array_type(
+                        first[:samples_read], second[:samples_read])
+                return array_type(first, second)
 
             elif meas_type == UsageTypeCI.COUNT_EDGES:
-                data = numpy.zeros(array_shape, dtype=numpy.uint32)
+                data = self._get_read_array(out, array_shape, numpy.uint32)
                 samples_read = _read_counter_u_32(
                     self._handle, data, number_of_samples_per_channel, timeout)
 
             else:
-                data = numpy.zeros(array_shape, dtype=numpy.float64)
+                data = self._get_read_array(out, array_shape, numpy.float64)
                 samples_read = _read_counter_f_64(
                     self._handle, data, number_of_samples_per_channel, timeout)
         else:
@@ -627,28 +691,141 @@ class Task(object):
                 Errors.READ_NO_INPUT_CHANS_IN_TASK.value,
                 task_name=self.name)
 
-        if (read_chan_type == ChannelType.COUNTER and
-                (meas_type == UsageTypeCI.PULSE_FREQ or
-                 meas_type == UsageTypeCI.PULSE_TICKS or
-                 meas_type == UsageTypeCI.PULSE_TIME)):
-
-            if num_samples_not_set and array_shape == 1:
-                return data[0]
-            # Counter pulse measurements should not have N channel versions.
-            if samples_read != number_of_samples_per_channel:
-                return data[:samples_read]
-            return data
-
         if num_samples_not_set and array_shape == 1:
-            return data.tolist()[0]
+            return data[0]
 
         if samples_read != number_of_samples_per_channel:
             if number_of_channels > 1:
-                return data[:, :samples_read].tolist()
+                return data[:, :samples_read]
             else:
-                return data[:samples_read].tolist()
+                return data[:samples_read]
 
-        return data.tolist()
+        return data
+
+    def read_async(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET,
+                   timeout=10.0):
+        """
+        Asynchronous version of the "read" method, which runs the read on
+        a bounded thread pool instead of blocking the event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "read" method for more info on the arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the samples requested.
+
+        Example:
+            >>> data = await task.read_async(1000)
+        """
+        return run_async(self.read, number_of_samples_per_channel, timeout)
+
+    def read_into_async(
+            self, number_of_samples_per_channel=NUM_SAMPLES_UNSET,
+            timeout=10.0, out=None):
+        """
+        Asynchronous version of the "read_into" method, which runs the
+        read on a bounded thread pool instead of blocking the event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "read_into" method for more info on the
+        arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the samples requested.
+        """
+        return run_async(
+            self.read_into, number_of_samples_per_channel, timeout, out)
+
+    def read_blocks_async(self, number_of_samples_per_channel,
+                          number_of_blocks=None, timeout=10.0):
+        """
+        Returns an asynchronous iterator over consecutive blocks of
+        samples, each read with the "read_into" method on a bounded
+        thread pool.
+
+        Each block is a new NumPy array, so blocks may be kept after the
+        iteration moves on.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel in each block.
+            number_of_blocks (Optional[int]): Specifies the number of
+                blocks to read. By default, continues until a read
+                returns no samples or, for a finite acquisition, until
+                fewer samples than a block remain to be acquired. A
+                continuous acquisition continues until you stop
+                iterating.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each block to become available.
+        Returns:
+            artdaq._task_modules.async_executor.AsyncBlockIterator:
+
+            Indicates the asynchronous iterator over the blocks.
+
+        Example:
+            >>> async for block in task.read_blocks_async(1000):
+            ...     process(block)
+        """
+        def read_block():
+            try:
+                return self.read_into(number_of_samples_per_channel, timeout)
+            except DaqError as e:
+                # A finite acquisition has no samples left for the block.
+                if (e.error_code ==
+                        Errors.SAMPLES_WILL_NEVER_BE_AVAILABLE.value):
+                    return numpy.zeros(0)
+                raise
+
+        return AsyncBlockIterator(read_block, number_of_blocks)
+
+    def _get_read_array(self, out, array_shape, dtype):
+        """
+        Returns the NumPy array to read samples into, allocating one if
+        the caller did not specify one.
+
+        Args:
+            out (Optional[numpy.ndarray]): Specifies the NumPy array the
+                caller specified.
+            array_shape (Union[int, Tuple[int]]): Specifies the shape of
+                the array required.
+            dtype (numpy.dtype): Specifies the data type of the array
+                required.
+        Returns:
+            numpy.ndarray: The array to read samples into.
+        """
+        if out is None:
+            return numpy.zeros(array_shape, dtype=dtype)
+
+        if not isinstance(array_shape, tuple):
+            array_shape = (array_shape,)
+
+        if out.shape != array_shape:
+            raise DaqError(
+                'Read cannot be performed because the NumPy array passed into '
+                'this function is not shaped correctly. You must pass in a '
+                'NumPy array of the correct shape based on the number of '
+                'channels in task and the number of samples per channel '
+                'requested.\n\n'
+                'Shape of NumPy Array provided: {0}\n'
+                'Shape of NumPy Array required: {1}'
+                .format(out.shape, array_shape),
+                Errors.UNKNOWN.value, task_name=self.name)
+
+        if out.dtype != dtype or not out.flags.c_contiguous:
+            raise DaqError(
+                'Read cannot be performed because the NumPy array passed into '
+                'this function is not a C-contiguous array of the data type '
+                'required by the channels in the task.\n\n'
+                'Data type of NumPy Array provided: {0}\n'
+                'Data type of NumPy Array required: {1}'
+                .format(out.dtype, numpy.dtype(dtype)),
+                Errors.UNKNOWN.value, task_name=self.name)
+
+        return out
 
     def register_done_event(self, callback_method):
         """
@@ -906,6 +1083,8 @@ class Task(object):
         error_code = cfunc(self._handle)
         check_for_error(error_code)
 
+        self._in_stream._start_logging()
+
     def stop(self):
         """
         Stops the task and returns it to the state the task was in before the
@@ -929,8 +1108,11 @@ class Task(object):
                 if cfunc.argtypes is None:
                     cfunc.argtypes = [lib_importer.task_handle]
 
-        error_code = cfunc(self._handle)
-        check_for_error(error_code)
+        try:
+            self._in_stream._stop_logging()
+        finally:
+            error_code = cfunc(self._handle)
+            check_for_error(error_code)
 
     def wait_until_done(self, timeout=10.0):
         """
@@ -957,6 +1139,27 @@ class Task(object):
         error_code = cfunc(self._handle, timeout)
         check_for_error(error_code)
 
+    def wait_until_done_async(self, timeout=10.0):
+        """
+        Asynchronous version of the "wait_until_done" method, which waits
+        on a bounded thread pool instead of blocking the event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "wait_until_done" method for more info on the
+        arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves when the measurement or
+            generation completes.
+
+        Example:
+            >>> task.start()
+            >>> await task.wait_until_done_async(timeout=30.0)
+        """
+        return run_async(self.wait_until_done, timeout)
+
     def _raise_invalid_num_lines_error(
             self, num_lines_expected, num_lines_in_data):
         raise DaqError(
@@ -986,6 +1189,51 @@ class Task(object):
             .format(number_of_channels, number_of_channels_in_data),
             Errors.WRITE_NUM_CHANS_MISMATCH.value, task_name=self.name)
 
+    def _get_ctr_write_arrays(self, data, field_names, dtype):
+        """
+        Converts counter output pulse samples to the two contiguous
+        NumPy arrays that ArtDAQ expects, without iterating over the
+        samples in Python.
+
+        Args:
+            data (dynamic): Specifies the samples, as a single CtrFreq,
+                CtrTime or CtrTick, a list of them, a CtrFreqArray,
+                CtrTimeArray or CtrTickArray, or a NumPy structured array
+                with the fields of the sample type.
+            field_names (Tuple[str]): Specifies the names of the two
+                fields of the sample type.
+            dtype (numpy.dtype): Specifies the data type of the arrays.
+        Returns:
+            Tuple[numpy.ndarray]: The arrays of the first and second
+            field of the samples.
+        """
+        if isinstance(data, _PULSE_ARRAY_TYPES):
+            first, second = data
+        elif (isinstance(data, numpy.ndarray) and
+                data.dtype.names is not None):
+            first, second = data[field_names[0]], data[field_names[1]]
+        else:
+            # A single sample or a sequence of samples; each sample is a
+            # pair of values in field order.
+            samples = numpy.asarray(data, dtype=dtype).reshape(-1, 2)
+            first, second = samples[:, 0], samples[:, 1]
+
+        first = numpy.ascontiguousarray(first, dtype=dtype).ravel()
+        second = numpy.ascontiguousarray(second, dtype=dtype).ravel()
+
+        if first.shape != second.shape:
+            raise DaqError(
+                'Write cannot be performed because the arrays of the {0} '
+                'and {1} portions of the pulse samples do not have the same '
+                'number of samples.\n\n'
+                'Number of {0} samples: {2}\n'
+                'Number of {1} samples: {3}'
+                .format(field_names[0], field_names[1], first.size,
+                        second.size),
+                Errors.UNKNOWN.value, task_name=self.name)
+
+        return first, second
+
     def write(self, data, auto_start=AUTO_START_UNSET, timeout=10.0):
         """
         Writes samples to the task or virtual channels you specify.
@@ -1010,6 +1258,10 @@ class Task(object):
         - List of CtrFreq, CtrTime, CtrTick (from artdaq.types):
           Multiple samples for 1 channel or 1 sample for multiple 
           channels.
+        - CtrFreqArray, CtrTimeArray, CtrTickArray (from artdaq.types):
+          One NumPy array per field, holding multiple samples for 1
+          channel or 1 sample for multiple channels. C-contiguous arrays
+          of the right data type are passed to ArtDAQ without a copy.
 
         If the task uses on-demand timing, this method returns only
         after the device generates all samples. On-demand is the default
@@ -1044,12 +1296,19 @@ class Task(object):
             Specifies the actual number of samples this method
             successfully wrote.
         """
-        channels_to_write = self.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_channels = self._metadata.number_of_channels
         write_chan_type = self.task_type
 
         element = None
-        if number_of_channels == 1:
+        if isinstance(data, _PULSE_ARRAY_TYPES):
+            # Columnar counter output samples hold one array per field.
+            first = numpy.asarray(data[0])
+            if first.ndim == 2 or number_of_channels == 1:
+                number_of_samples_per_channel = first.shape[-1]
+            else:
+                number_of_samples_per_channel = 1
+
+        elif number_of_channels == 1:
             if isinstance(data, list):
                 if isinstance(data[0], list):
                     self._raise_invalid_write_num_chans_error(
@@ -1133,51 +1392,27 @@ class Task(object):
 
         # Counter Input
         elif write_chan_type == ChannelType.COUNTER:
-            output_type = channels_to_write.co_output_type
-
-            if number_of_samples_per_channel == 1:
-                data = [data]
+            output_type = CIOChannel.co_output_type
 
             if output_type == UsageTypeCO.PULSE_FREQUENCY:
-                frequencies = []
-                duty_cycles = []
-                for sample in data:
-                    frequencies.append(sample.duty_cycle)
-                    duty_cycles.append(sample.freq)
-
-                frequencies = numpy.asarray(frequencies, dtype=numpy.float64)
-                duty_cycles = numpy.asarray(duty_cycles, dtype=numpy.float64)
+                frequencies, duty_cycles = self._get_ctr_write_arrays(
+                    data, CtrFreq._fields, numpy.float64)
 
                 return _write_ctr_freq(
                     self._handle, frequencies, duty_cycles,
                     number_of_samples_per_channel, auto_start, timeout)
 
             elif output_type == UsageTypeCO.PULSE_TIME:
-                high_times = []
-                low_times = []
-                for sample in data:
-                    high_times.append(sample.high_time)
-                    low_times.append(sample.low_time)
-
-                high_times = numpy.asarray(high_times, dtype=numpy.float64)
-                low_times = numpy.asarray(low_times, dtype=numpy.float64)
-
-                # return _write_ctr_time(
-                #     self._handle, high_times, low_times,
-                #     number_of_samples_per_channel, auto_start, timeout)
+                high_times, low_times = self._get_ctr_write_arrays(
+                    data, CtrTime._fields, numpy.float64)
+
                 return _write_ctr_time(
                     self._handle, high_times, low_times,
-                    number_of_samples_per_channel, timeout)
+                    number_of_samples_per_channel, auto_start, timeout)
 
             elif output_type == UsageTypeCO.PULSE_TICKS:
-                high_ticks = []
-                low_ticks = []
-                for sample in data:
-                    high_ticks.append(sample.high_tick)
-                    low_ticks.append(sample.low_tick)
-
-                high_ticks = numpy.asarray(high_ticks, dtype=numpy.uint32)
-                low_ticks = numpy.asarray(low_ticks, dtype=numpy.uint32)
+                high_ticks, low_ticks = self._get_ctr_write_arrays(
+                    data, CtrTick._fields, numpy.uint32)
 
                 return _write_ctr_ticks(
                     self._handle, high_ticks, low_ticks,
@@ -1188,3 +1423,20 @@ class Task(object):
                 'task to which data can be written.',
                 Errors.WRITE_NO_OUTPUT_CHANS_IN_TASK.value,
                 task_name=self.name)
+
+    def write_async(self, data, auto_start=AUTO_START_UNSET, timeout=10.0):
+        """
+        Asynchronous version of the "write" method, which runs the write
+        on a bounded thread pool instead of blocking the event loop.
+
+        Must be called from a coroutine or callback running on an asyncio
+        event loop. See the "write" method for more info on the
+        arguments.
+
+        Returns:
+            asyncio.Future:
+
+            Indicates the future that resolves to the number of samples
+            written per channel.
+        """
+        return run_async(self.write, data, auto_start, timeout)
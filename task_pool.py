@@ -0,0 +1,312 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import contextlib
+import threading
+import time
+
+import numpy
+from six.moves import queue
+from artdaq.constants import TaskControl
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.types import TaskPoolStatistics
+
+_POOL_STATES = (TaskControl.TASK_VERIFY, TaskControl.TASK_RESERVE,
+                TaskControl.TASK_COMMIT)
+
+__all__ = ['TaskPool']
+
+
+class TaskPool(object):
+    """
+    Keeps a number of identically configured, committed tasks and lends
+    them out, so that code that runs the same short acquisition many
+    times, such as a test suite, does not create, configure and commit a
+    task each time.
+
+    Tasks are stopped when they are returned to the pool, which leaves
+    them in the state they were brought to when created. A task that
+    fails to stop is closed and replaced.
+
+    "run" performs a finite acquisition on a pooled task and records how
+    long the task took to start and to return its first sample, which
+    "statistics" reports.
+    """
+
+    def __init__(self, template, size=1, state=TaskControl.TASK_COMMIT):
+        """
+        Args:
+            template (Union[artdaq.task_templates.TaskTemplate, Callable[[], artdaq.task.Task]]):
+                Specifies the template to create the tasks from, or a
+                function that creates and configures a task.
+            size (Optional[int]): Specifies the number of tasks to keep.
+                All of them are created before this method returns.
+            state (Optional[artdaq.constants.TaskControl]): Specifies the
+                state to bring each task to after creating it, which is
+                TASK_VERIFY, TASK_RESERVE or TASK_COMMIT. The later the
+                state, the less work "start" does, at the cost of holding
+                device resources while the task is idle. None leaves the
+                tasks unverified.
+        """
+        if size < 1:
+            raise DaqError(
+                'The size of a task pool must be at least 1.\n'
+                'Size: {0}'.format(size), Errors.UNKNOWN.value)
+        if state is not None and state not in _POOL_STATES:
+            raise DaqError(
+                'Tasks of a task pool can only be kept verified, reserved '
+                'or committed.\nRequested state: {0}'.format(state),
+                Errors.UNKNOWN.value)
+
+        if hasattr(template, 'instantiate'):
+            self._create_task = template.instantiate
+        else:
+            self._create_task = template
+        self._state = state
+        self._size = size
+        self._lock = threading.Lock()
+        self._idle = queue.Queue()
+        self._tasks = {}
+        self._closed = False
+
+        self._runs = 0
+        self._start_latency_sum = 0.0
+        self._start_latency_max = 0.0
+        self._first_sample_latency_sum = 0.0
+        self._first_sample_latency_max = 0.0
+
+        try:
+            for _ in range(size):
+                self._idle.put(self._new_task())
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def size(self):
+        """
+        int: Indicates the number of tasks in the pool.
+        """
+        return self._size
+
+    @property
+    def state(self):
+        """
+        Optional[artdaq.constants.TaskControl]: Indicates the state the
+            tasks of the pool are kept in.
+        """
+        return self._state
+
+    @property
+    def statistics(self):
+        """
+        artdaq.types.TaskPoolStatistics: Indicates the number of
+            acquisitions performed with "run" and the mean and maximum
+            time in seconds from calling "start" until "start" returned
+            and until the first sample was read.
+        """
+        with self._lock:
+            runs = self._runs
+            if runs == 0:
+                return TaskPoolStatistics(0, 0.0, 0.0, 0.0, 0.0)
+            return TaskPoolStatistics(
+                runs, self._start_latency_sum / runs,
+                self._start_latency_max,
+                self._first_sample_latency_sum / runs,
+                self._first_sample_latency_max)
+
+    def reset_statistics(self):
+        """
+        Discards the latencies recorded by "run".
+        """
+        with self._lock:
+            self._runs = 0
+            self._start_latency_sum = 0.0
+            self._start_latency_max = 0.0
+            self._first_sample_latency_sum = 0.0
+            self._first_sample_latency_max = 0.0
+
+    @property
+    def available(self):
+        """
+        int: Indicates the number of tasks not lent out.
+        """
+        return self._idle.qsize()
+
+    def acquire(self, timeout=None):
+        """
+        Takes a task from the pool, waiting for one to be returned if
+        all are lent out.
+
+        Args:
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a task. None waits indefinitely.
+        Returns:
+            artdaq.task.Task:
+
+            Indicates the task. Return it with "release"; do not close
+            it.
+        """
+        self._verify_open()
+        try:
+            task = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise DaqError(
+                'No task of the pool became available within the timeout.',
+                Errors.UNKNOWN.value)
+        if task is None:
+            # The pool was closed while waiting.
+            self._idle.put(None)
+            self._verify_open()
+        return task
+
+    def release(self, task):
+        """
+        Stops a task taken with "acquire" and returns it to the pool.
+
+        Args:
+            task (artdaq.task.Task): Specifies the task.
+        """
+        with self._lock:
+            if id(task) not in self._tasks:
+                raise DaqError(
+                    'The task does not belong to this pool.',
+                    Errors.UNKNOWN.value, task_name=task.name)
+            if self._closed:
+                self._tasks.pop(id(task), None)
+                task.close()
+                return
+
+        try:
+            task.stop()
+        except DaqError:
+            with self._lock:
+                self._tasks.pop(id(task), None)
+            try:
+                task.close()
+            except DaqError:
+                pass
+            task = self._new_task()
+        self._idle.put(task)
+
+    @contextlib.contextmanager
+    def task(self, timeout=None):
+        """
+        Lends a task from the pool for the duration of a with statement.
+
+            >>> with pool.task() as task:
+            ...     task.start()
+            ...     data = task.read(1000)
+
+        Args:
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a task. None waits indefinitely.
+        """
+        task = self.acquire(timeout)
+        try:
+            yield task
+        finally:
+            self.release(task)
+
+    def run(self, number_of_samples_per_channel, timeout=10.0):
+        """
+        Performs a finite acquisition on a task of the pool and records
+        its start and first-sample latencies.
+
+        The first sample of each channel is read on its own as soon as it
+        is available, to time it, and the remaining samples with a second
+        read.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for a task of the pool and for the samples.
+        Returns:
+            Union[numpy.ndarray, tuple]:
+
+            Indicates the samples, as "artdaq.task.Task.read_into"
+            returns them.
+        """
+        with self.task(timeout) as task:
+            start_time = time.perf_counter()
+            task.start()
+            started_time = time.perf_counter()
+            first = task.read_into(1, timeout)
+            first_sample_time = time.perf_counter()
+
+            if number_of_samples_per_channel > 1:
+                rest = task.read_into(
+                    number_of_samples_per_channel - 1, timeout)
+                if isinstance(first, tuple):
+                    # Counter pulse measurements return one array per
+                    # field.
+                    data = type(first)(*[
+                        numpy.concatenate((a, b), axis=-1)
+                        for a, b in zip(first, rest)])
+                else:
+                    data = numpy.concatenate((first, rest), axis=-1)
+            else:
+                data = first
+
+        start_latency = started_time - start_time
+        first_sample_latency = first_sample_time - start_time
+        with self._lock:
+            self._runs += 1
+            self._start_latency_sum += start_latency
+            self._start_latency_max = max(
+                self._start_latency_max, start_latency)
+            self._first_sample_latency_sum += first_sample_latency
+            self._first_sample_latency_max = max(
+                self._first_sample_latency_max, first_sample_latency)
+
+        return data
+
+    def close(self):
+        """
+        Closes the tasks of the pool. Tasks lent out are closed when they
+        are returned.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        while True:
+            try:
+                task = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if task is None:
+                continue
+            with self._lock:
+                self._tasks.pop(id(task), None)
+            task.close()
+        # Wakes up threads waiting in acquire.
+        self._idle.put(None)
+
+    def _new_task(self):
+        task = self._create_task()
+        try:
+            if self._state is not None:
+                task.control(self._state)
+        except BaseException:
+            task.close()
+            raise
+        with self._lock:
+            self._tasks[id(task)] = task
+        return task
+
+    def _verify_open(self):
+        if self._closed:
+            raise DaqError(
+                'The task pool was closed.', Errors.UNKNOWN.value)
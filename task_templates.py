@@ -0,0 +1,482 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import copy
+import inspect
+import io
+import json
+from enum import Enum
+
+import six
+from artdaq import constants
+from artdaq._task_modules.ai_channel_collection import AIChannelCollection
+from artdaq._task_modules.ao_channel_collection import AOChannelCollection
+from artdaq._task_modules.cio_channel_collection import (
+    CIOChannelCollection)
+from artdaq._task_modules.di_channel_collection import DIChannelCollection
+from artdaq._task_modules.do_channel_collection import DOChannelCollection
+from artdaq._task_modules.export_signals import ExportSignals
+from artdaq._task_modules.timing import Timing
+from artdaq._task_modules.triggering.pause_trigger import PauseTrigger
+from artdaq._task_modules.triggering.reference_trigger import (
+    ReferenceTrigger)
+from artdaq._task_modules.triggering.start_trigger import StartTrigger
+from artdaq.constants import TaskControl
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+from artdaq.task import Task
+from artdaq.utils import flatten_channel_string
+
+__all__ = ['TaskTemplate']
+
+_FORMAT_VERSION = 1
+
+_CHANNEL_COLLECTIONS = {
+    'ai_channels': AIChannelCollection,
+    'ao_channels': AOChannelCollection,
+    'cio_channels': CIOChannelCollection,
+    'di_channels': DIChannelCollection,
+    'do_channels': DOChannelCollection,
+}
+
+_TRIGGERS = {
+    'pause_trigger': PauseTrigger,
+    'reference_trigger': ReferenceTrigger,
+    'start_trigger': StartTrigger,
+}
+
+# Channels of these collections that share every setting are created with
+# one call. Counters and digital lines are not merged, because merging
+# them changes the channels the driver creates.
+_MERGEABLE_COLLECTIONS = ('ai_channels', 'ao_channels')
+
+
+def _encode_value(value):
+    """
+    Converts an argument value to a JSON-compatible value.
+    """
+    if isinstance(value, Enum):
+        return {'enum': type(value).__name__, 'name': value.name}
+    return value
+
+
+def _decode_value(value):
+    """
+    Converts a value encoded by "_encode_value" back to the argument
+    value.
+    """
+    if isinstance(value, dict) and set(value) == {'enum', 'name'}:
+        enum_type = getattr(constants, value['enum'], None)
+        if not (isinstance(enum_type, type) and issubclass(enum_type, Enum)):
+            raise DaqError(
+                'Task template refers to an unknown enumeration.\n'
+                'Enumeration: {0}'.format(value['enum']),
+                Errors.UNKNOWN.value)
+        return enum_type[value['name']]
+    return value
+
+
+def _get_parameters(cls, method):
+    """
+    Returns the parameters of a configuration method, excluding self.
+    """
+    function = getattr(cls, method, None)
+    if method.startswith('_') or not callable(function):
+        raise DaqError(
+            '{0} has no method "{1}".'.format(cls.__name__, method),
+            Errors.UNKNOWN.value)
+    return list(inspect.signature(function).parameters.values())[1:]
+
+
+def _validate_step(cls, method, args):
+    """
+    Checks that the arguments of a template step match the method that
+    replays it.
+    """
+    parameters = _get_parameters(cls, method)
+    try:
+        inspect.Signature(parameters).bind(**args)
+    except TypeError as e:
+        raise DaqError(
+            'Invalid arguments for {0}.{1}: {2}'.format(
+                cls.__name__, method, e), Errors.UNKNOWN.value)
+
+
+class TaskTemplate(object):
+    """
+    Describes the configuration of a DAQ task, so that tasks with that
+    configuration can be created repeatedly, stored and shared.
+
+    A template records the channel creation, timing, trigger and signal
+    export calls to make on a task. The calls are checked against the
+    methods of the task when they are added, and are converted once
+    into a replay plan that "instantiate" runs. Consecutive analog
+    channels that differ only in their physical channel are created with
+    one call.
+
+    Templates convert to and from JSON-compatible dictionaries.
+    Enumeration values are stored by name.
+
+        >>> template = TaskTemplate('acquisition')
+        >>> template.add_channels(
+        ...     'ai_channels', 'add_ai_voltage_chan',
+        ...     physical_channel='Dev1/ai0:3', min_val=-5.0, max_val=5.0)
+        >>> template.cfg_timing(
+        ...     rate=10000.0, sample_mode=AcquisitionType.FINITE,
+        ...     samps_per_chan=1000)
+        >>> with template.instantiate() as task:
+        ...     data = task.read(1000)
+    """
+
+    def __init__(self, name=''):
+        """
+        Args:
+            name (Optional[str]): Specifies the name of the template. The
+                name identifies the template only; tasks created from it
+                are named independently.
+        """
+        self._name = name
+        self._channels = []
+        self._timing = None
+        self._triggers = []
+        self._export_signals = []
+        self._plan = None
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.to_dict() == other.to_dict()
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'TaskTemplate(name={0}, channels={1})'.format(
+            self._name, len(self._channels))
+
+    @property
+    def name(self):
+        """
+        str: Specifies the name of the template.
+        """
+        return self._name
+
+    def add_channels(self, collection, method, **kwargs):
+        """
+        Adds a channel creation call to the template.
+
+        Args:
+            collection (str): Specifies the channel collection of the
+                task to create the channels in, such as "ai_channels".
+            method (str): Specifies the method of the collection to
+                call, such as "add_ai_voltage_chan".
+            kwargs: Specifies the arguments to pass to the method.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates this template, so that calls can be chained.
+        """
+        cls = _CHANNEL_COLLECTIONS.get(collection)
+        if cls is None:
+            raise DaqError(
+                'Unknown channel collection "{0}". Valid collections are: '
+                '{1}.'.format(collection, ', '.join(
+                    sorted(_CHANNEL_COLLECTIONS))), Errors.UNKNOWN.value)
+        if not method.startswith('add_'):
+            raise DaqError(
+                '"{0}" is not a channel creation method.'.format(method),
+                Errors.UNKNOWN.value)
+
+        self._add_step(self._channels, cls, method, kwargs,
+                       collection=collection)
+        return self
+
+    def cfg_timing(self, method='cfg_samp_clk_timing', **kwargs):
+        """
+        Sets the timing configuration call of the template, replacing
+        any set before.
+
+        Args:
+            method (Optional[str]): Specifies the method of
+                artdaq._task_modules.timing.Timing to call.
+            kwargs: Specifies the arguments to pass to the method.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates this template, so that calls can be chained.
+        """
+        steps = []
+        self._add_step(steps, Timing, method, kwargs)
+        self._timing = steps[0]
+        return self
+
+    def cfg_trigger(self, trigger, method, **kwargs):
+        """
+        Adds a trigger configuration call to the template.
+
+        Args:
+            trigger (str): Specifies the trigger to configure, which is
+                "start_trigger", "reference_trigger" or "pause_trigger".
+            method (str): Specifies the method of the trigger to call,
+                such as "cfg_dig_edge_start_trig".
+            kwargs: Specifies the arguments to pass to the method.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates this template, so that calls can be chained.
+        """
+        cls = _TRIGGERS.get(trigger)
+        if cls is None:
+            raise DaqError(
+                'Unknown trigger "{0}". Valid triggers are: {1}.'.format(
+                    trigger, ', '.join(sorted(_TRIGGERS))),
+                Errors.UNKNOWN.value)
+
+        self._add_step(self._triggers, cls, method, kwargs, trigger=trigger)
+        return self
+
+    def export_signal(self, method='export_signal', **kwargs):
+        """
+        Adds a signal export call to the template.
+
+        Args:
+            method (Optional[str]): Specifies the method of
+                artdaq._task_modules.export_signals.ExportSignals to call.
+            kwargs: Specifies the arguments to pass to the method.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates this template, so that calls can be chained.
+        """
+        self._add_step(self._export_signals, ExportSignals, method, kwargs)
+        return self
+
+    def apply(self, task):
+        """
+        Configures an existing task as the template describes.
+
+        Args:
+            task (artdaq.task.Task): Specifies the task to configure. The
+                task must not have channels that conflict with those of
+                the template.
+        """
+        for target, method, kwargs in self._get_plan():
+            obj = task
+            for attribute in target:
+                obj = getattr(obj, attribute)
+            getattr(obj, method)(**kwargs)
+
+    def instantiate(self, task_name='', commit=False):
+        """
+        Creates a task configured as the template describes.
+
+        Args:
+            task_name (Optional[str]): Specifies the name to assign to
+                the task. Leave it empty to create several tasks from
+                the same template.
+            commit (Optional[bool]): Specifies whether to commit the task
+                before returning it, so that starting it is as fast as
+                possible.
+        Returns:
+            artdaq.task.Task:
+
+            Indicates the configured task. Close it when you are done.
+        """
+        task = Task(task_name)
+        try:
+            self.apply(task)
+            if commit:
+                task.control(TaskControl.TASK_COMMIT)
+        except BaseException:
+            task.close()
+            raise
+        return task
+
+    def to_dict(self):
+        """
+        Converts the template to a JSON-compatible dictionary.
+
+        Returns:
+            dict:
+
+            Indicates the template.
+        """
+        return {
+            'format_version': _FORMAT_VERSION,
+            'name': self._name,
+            'channels': copy.deepcopy(self._channels),
+            'timing': copy.deepcopy(self._timing),
+            'triggers': copy.deepcopy(self._triggers),
+            'export_signals': copy.deepcopy(self._export_signals),
+        }
+
+    @classmethod
+    def from_dict(cls, template_dict):
+        """
+        Creates a template from a dictionary created by "to_dict".
+
+        Args:
+            template_dict (dict): Specifies the template.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        format_version = template_dict.get('format_version', _FORMAT_VERSION)
+        if format_version > _FORMAT_VERSION:
+            raise DaqError(
+                'Task template format version {0} is not supported. The '
+                'newest supported version is {1}.'.format(
+                    format_version, _FORMAT_VERSION), Errors.UNKNOWN.value)
+
+        template = cls(template_dict.get('name', ''))
+        for step in template_dict.get('channels', []):
+            template.add_channels(
+                step['collection'], step['method'],
+                **_decode_kwargs(step['args']))
+        timing = template_dict.get('timing')
+        if timing:
+            template.cfg_timing(timing['method'],
+                                **_decode_kwargs(timing['args']))
+        for step in template_dict.get('triggers', []):
+            template.cfg_trigger(step['trigger'], step['method'],
+                                 **_decode_kwargs(step['args']))
+        for step in template_dict.get('export_signals', []):
+            template.export_signal(step['method'],
+                                   **_decode_kwargs(step['args']))
+        return template
+
+    def to_json(self, **kwargs):
+        """
+        Converts the template to a JSON string.
+
+        Args:
+            kwargs: Specifies keyword arguments to pass to json.dumps,
+                such as "indent".
+        Returns:
+            str:
+
+            Indicates the template.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Creates a template from a JSON string created by "to_json".
+
+        Args:
+            text (str): Specifies the template.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        return cls.from_dict(json.loads(text))
+
+    def save(self, file_path):
+        """
+        Writes the template to a JSON file.
+
+        Args:
+            file_path (str): Specifies the path to the file.
+        """
+        with io.open(file_path, 'w', encoding='utf-8') as f:
+            f.write(six.text_type(self.to_json(indent=2)))
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Reads a template from a JSON file written by "save".
+
+        Args:
+            file_path (str): Specifies the path to the file.
+        Returns:
+            artdaq.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        with io.open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_json(f.read())
+
+    def _add_step(self, steps, cls, method, kwargs, **fields):
+        _validate_step(cls, method, kwargs)
+
+        step = dict(fields)
+        step['method'] = method
+        step['args'] = dict(
+            (key, _encode_value(value)) for key, value in six.iteritems(kwargs))
+        steps.append(step)
+        self._plan = None
+
+    def _get_plan(self):
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = self._build_plan()
+        return plan
+
+    def _build_plan(self):
+        """
+        Converts the steps of the template into the list of calls to make,
+        as (attribute path, method name, arguments) tuples.
+        """
+        plan = []
+
+        merged = None
+        for step in self._channels:
+            collection = step['collection']
+            kwargs = _decode_kwargs(step['args'])
+
+            parameters = _get_parameters(
+                _CHANNEL_COLLECTIONS[collection], step['method'])
+            channel_parameter = parameters[0].name
+            name_parameter = parameters[1].name if len(parameters) > 1 else None
+
+            mergeable = (collection in _MERGEABLE_COLLECTIONS and
+                         channel_parameter in kwargs and
+                         not kwargs.get(name_parameter))
+            if mergeable:
+                settings = dict(kwargs)
+                channels = settings.pop(channel_parameter)
+                key = (collection, step['method'], settings)
+                if merged is not None and merged[0] == key:
+                    merged[1].append(channels)
+                    continue
+
+            if merged is not None:
+                plan.append(_merged_call(merged))
+                merged = None
+
+            if mergeable:
+                merged = (key, [channels], channel_parameter)
+            else:
+                plan.append(((collection,), step['method'], kwargs))
+
+        if merged is not None:
+            plan.append(_merged_call(merged))
+
+        if self._timing is not None:
+            plan.append((('timing',), self._timing['method'],
+                         _decode_kwargs(self._timing['args'])))
+        for step in self._triggers:
+            plan.append((('triggers', step['trigger']), step['method'],
+                         _decode_kwargs(step['args'])))
+        for step in self._export_signals:
+            plan.append((('export_signals',), step['method'],
+                         _decode_kwargs(step['args'])))
+
+        return plan
+
+
+def _decode_kwargs(args):
+    return dict(
+        (key, _decode_value(value)) for key, value in six.iteritems(args))
+
+
+def _merged_call(merged):
+    (collection, method, settings), channels, channel_parameter = merged
+    kwargs = dict(settings)
+    kwargs[channel_parameter] = flatten_channel_string(channels)
+    return (collection,), method, kwargs
@@ -0,0 +1,24 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+from artdaq._lib import lib_importer
+from artdaq.task import Task
+
+
+@pytest.fixture(autouse=True)
+def simulated_library():
+    """
+    Routes the Art_DAQ calls of each test through a new simulated
+    driver whose devices run free, so that reads do not wait on the wall
+    clock.
+    """
+    return lib_importer.use_simulated_library(time_scale=None)
+
+
+@pytest.fixture
+def task():
+    with Task() as task:
+        yield task
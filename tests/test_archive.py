@@ -0,0 +1,71 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import pytest
+from artdaq.archive import ArchiveReader, ArchiveWriter
+from artdaq.errors import DaqError
+from artdaq.stream_readers import AnalogMultiChannelReader
+
+CHANNEL_NAMES = ['Dev1/ai0', 'Dev1/ai1', 'Dev1/ai2']
+
+
+def _samples(dtype, number_of_samples):
+    ramp = numpy.arange(number_of_samples) * 7 % 1000 - 500
+    return numpy.array([ramp, -ramp, ramp // 3], dtype=dtype)
+
+
+@pytest.mark.parametrize('codec, dtype', [
+    ('none', numpy.float64),
+    ('zlib', numpy.float64),
+    ('lzma', numpy.float64),
+    ('none', numpy.int16),
+    ('zlib', numpy.int16),
+    ('lzma', numpy.int16),
+    ('delta_bitshuffle', numpy.int16),
+    ('delta_bitshuffle', numpy.int32),
+])
+def test_round_trip(tmp_path, codec, dtype):
+    file_path = str(tmp_path / 'run.arch')
+    data = _samples(dtype, 2500)
+
+    with ArchiveWriter(file_path, CHANNEL_NAMES, dtype=dtype, codec=codec,
+                       chunk_size=1000) as archive:
+        for start in range(0, data.shape[1], 300):
+            archive.append(data[:, start:start + 300])
+
+    with ArchiveReader(file_path) as archive:
+        assert archive.channel_names == CHANNEL_NAMES
+        assert archive.samples_per_channel == data.shape[1]
+        numpy.testing.assert_array_equal(archive.read(), data)
+        numpy.testing.assert_array_equal(
+            archive.read(950, 2050, channels=['Dev1/ai2', 'Dev1/ai0']),
+            data[[2, 0], 950:2050])
+
+
+def test_round_trip_from_task(tmp_path, task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:1')
+    task.timing.cfg_samp_clk_timing(1000.0, samps_per_chan=500)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((2, 500))
+    file_path = str(tmp_path / 'run.arch')
+
+    with ArchiveWriter.from_task(task, file_path) as archive:
+        reader.read_many_sample(data, 500)
+        archive.append(data)
+
+    with ArchiveReader(file_path) as archive:
+        assert archive.channel_names == ['Dev1/ai0', 'Dev1/ai1']
+        numpy.testing.assert_array_equal(archive.read(), data)
+
+
+def test_append_after_close_raises(tmp_path):
+    archive = ArchiveWriter(str(tmp_path / 'run.arch'), CHANNEL_NAMES)
+    archive.close()
+
+    with pytest.raises(DaqError):
+        archive.append(numpy.zeros((3, 10)))
+    with pytest.raises(DaqError):
+        archive.flush()
@@ -0,0 +1,85 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+
+import numpy
+from artdaq.constants import AcquisitionType, LineGrouping
+from artdaq.stream_readers import (
+    AnalogMultiChannelReader, AnalogUnscaledReader,
+    DigitalSingleChannelReader)
+
+
+def _run(function, *args):
+    async def run():
+        return await function(*args)
+
+    return asyncio.run(run())
+
+
+def _configure_finite_ai(task, number_of_samples_per_channel):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:1')
+    task.timing.cfg_samp_clk_timing(
+        1000.0, sample_mode=AcquisitionType.FINITE,
+        samps_per_chan=number_of_samples_per_channel)
+
+
+def test_read_async(task):
+    _configure_finite_ai(task, 100)
+
+    data = _run(task.read_async, 100)
+
+    assert len(data) == 2
+    assert len(data[0]) == 100
+
+
+def test_read_blocks_async_ends_with_finite_acquisition(task):
+    _configure_finite_ai(task, 300)
+    task.start()
+
+    async def read_blocks():
+        return [block async for block in task.read_blocks_async(100)]
+
+    blocks = asyncio.run(read_blocks())
+
+    assert [block.shape for block in blocks] == [(2, 100)] * 3
+
+
+def test_read_blocks_async_reads_number_of_blocks(task):
+    _configure_finite_ai(task, 300)
+    task.start()
+
+    async def read_blocks():
+        return [block async for block in task.read_blocks_async(100, 2)]
+
+    assert len(asyncio.run(read_blocks())) == 2
+
+
+def test_reader_async_methods(task):
+    _configure_finite_ai(task, 100)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    unscaled_reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.zeros((2, 50))
+    unscaled_data = numpy.zeros((2, 50), dtype=numpy.int16)
+
+    async def read():
+        return (await reader.read_many_sample_async(data, 50),
+                await unscaled_reader.read_int16_async(unscaled_data, 50))
+
+    assert asyncio.run(read()) == (50, 50)
+
+
+def test_digital_reader_async(task):
+    task.di_channels.add_di_chan(
+        'Dev1/port0', line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
+    task.timing.cfg_samp_clk_timing(
+        1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=64)
+    reader = DigitalSingleChannelReader(task.in_stream)
+    data = numpy.zeros(64, dtype=numpy.uint32)
+
+    samples_read = _run(
+        reader.read_many_sample_port_uint32_async, data, 64)
+
+    assert samples_read == 64
@@ -0,0 +1,47 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+
+def test_configure_channels_groups_equal_values(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:3')
+
+    result = task.ai_channels.configure_channels({
+        'Dev1/ai0:3': {'ai_max': 5.0},
+        'Dev1/ai2:3': {'ai_min': -2.0},
+    })
+
+    assert result.calls == 2
+    assert result.values_set == 6
+    assert result.values_skipped == 0
+    assert task.ai_channels['Dev1/ai3'].ai_max == 5.0
+    assert task.ai_channels['Dev1/ai3'].ai_min == -2.0
+
+
+def test_configure_channels_skips_unchanged_values(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:3')
+    task.ai_channels.configure_channels({'Dev1/ai0:3': {'ai_max': 5.0}})
+
+    result = task.ai_channels.configure_channels({
+        'Dev1/ai0:1': {'ai_max': 5.0},
+        'Dev1/ai2:3': {'ai_max': 2.5},
+    })
+
+    assert result.calls == 1
+    assert result.values_set == 2
+    assert result.values_skipped == 2
+    assert task.ai_channels['Dev1/ai0'].ai_max == 5.0
+    assert task.ai_channels['Dev1/ai2'].ai_max == 2.5
+
+
+def test_configure_channels_sets_unchanged_values_when_asked(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:1')
+    task.ai_channels.configure_channels({'Dev1/ai0:1': {'ai_max': 5.0}})
+
+    result = task.ai_channels.configure_channels(
+        {'Dev1/ai0:1': {'ai_max': 5.0}}, skip_unchanged=False)
+
+    assert result.calls == 1
+    assert result.values_set == 2
+    assert result.values_skipped == 0
@@ -0,0 +1,43 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+from artdaq._benchmarks import (
+    _legacy_flatten_channel_string, _legacy_unflatten_channel_string)
+from artdaq.utils import flatten_channel_string, unflatten_channel_string
+
+CHANNEL_STRINGS = [
+    '',
+    'Dev1/ai0',
+    'Dev1/ai0:3',
+    'Dev1/ai3:0',
+    'Dev1/ai0:3, Dev1/ai5',
+    'Dev1/ai0,Dev2/ai1:2',
+    'Dev1/port0/line0:7',
+    'Dev1/ai8:15, Dev1/ai0:7',
+    'Dev1/ai0:2,Dev1/ai3,Dev1/ai4:5',
+    'Voltage',
+]
+
+
+@pytest.mark.parametrize('channel_string', CHANNEL_STRINGS)
+def test_unflatten_matches_legacy(channel_string):
+    assert (unflatten_channel_string(channel_string) ==
+            _legacy_unflatten_channel_string(channel_string))
+
+
+@pytest.mark.parametrize('channel_string', CHANNEL_STRINGS)
+def test_flatten_matches_legacy(channel_string):
+    channel_names = _legacy_unflatten_channel_string(channel_string)
+    assert (flatten_channel_string(channel_names) ==
+            _legacy_flatten_channel_string(channel_names))
+
+
+def test_unflatten_expands_ranges_lazily():
+    channel_names = unflatten_channel_string('Dev1/ai0:9999, Dev1/ai10000')
+
+    assert len(channel_names) == 10001
+    assert channel_names[1234] == 'Dev1/ai1234'
+    assert channel_names[-1] == 'Dev1/ai10000'
@@ -0,0 +1,108 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import pytest
+from artdaq.decimation import (
+    CICDecimator, FIRDecimator, MultiStageDecimator, design_lowpass)
+from artdaq.errors import DaqError
+from artdaq.stream_readers import AnalogMultiChannelReader
+
+BLOCK_SIZES = [1, 7, 64, 250, 999]
+
+
+def _decimators():
+    return [
+        FIRDecimator(4),
+        FIRDecimator(5, taps=design_lowpass(31, 0.08)),
+        CICDecimator(8, stages=3, differential_delay=2),
+        MultiStageDecimator.design(24, max_stage_factor=4),
+        MultiStageDecimator([CICDecimator(4), FIRDecimator(2)]),
+    ]
+
+
+def _samples():
+    random_state = numpy.random.RandomState(0)
+    return random_state.standard_normal((3, 4800))
+
+
+@pytest.mark.parametrize('index', range(len(_decimators())))
+@pytest.mark.parametrize('block_size', BLOCK_SIZES)
+def test_output_does_not_depend_on_block_boundaries(index, block_size):
+    data = _samples()
+    expected = _decimators()[index].process(data)
+
+    decimator = _decimators()[index]
+    output = numpy.concatenate(
+        [decimator.process(data[:, start:start + block_size])
+         for start in range(0, data.shape[1], block_size)], axis=1)
+
+    assert output.shape == (3, data.shape[1] // decimator.factor)
+    numpy.testing.assert_allclose(output, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_fir_matches_full_convolution():
+    data = _samples()
+    decimator = FIRDecimator(4)
+
+    expected = numpy.array([
+        numpy.convolve(row, decimator.taps)[:data.shape[1]:4]
+        for row in data])
+
+    numpy.testing.assert_allclose(
+        decimator.process(data), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_reset_restarts_the_filter():
+    data = _samples()
+    decimator = FIRDecimator(4)
+    expected = decimator.process(data)
+
+    decimator.reset()
+
+    numpy.testing.assert_allclose(decimator.process(data), expected)
+
+
+def test_attached_decimator_selects_channels_by_name(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:2')
+    reader = AnalogMultiChannelReader(task.in_stream)
+    decimator = FIRDecimator(4, channels=['Dev1/ai2', 'Dev1/ai0'])
+    decimator.attach(reader)
+    data = numpy.zeros((3, 400))
+
+    reader.read_many_sample(data, 400)
+
+    expected = FIRDecimator(4).process(data[[2, 0]])
+    numpy.testing.assert_allclose(decimator.read(), expected)
+    assert decimator.read().shape == (2, 0)
+
+
+def test_attached_decimator_follows_channels_to_read(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:2')
+    reader = AnalogMultiChannelReader(task.in_stream)
+    decimator = FIRDecimator(4, channels=['Dev1/ai2'])
+    decimator.attach(reader)
+
+    task.in_stream.channels_to_read = task.ai_channels['Dev1/ai1:2']
+    data = numpy.zeros((2, 400))
+    reader.read_many_sample(data, 400)
+
+    numpy.testing.assert_allclose(
+        decimator.read(), FIRDecimator(4).process(data[1:]))
+
+
+def test_processor_error_does_not_fail_the_read(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:2')
+    reader = AnalogMultiChannelReader(task.in_stream)
+    decimator = FIRDecimator(4, channels=['Dev1/ai2'])
+    decimator.attach(reader)
+
+    task.in_stream.channels_to_read = task.ai_channels['Dev1/ai0:1']
+    data = numpy.zeros((2, 400))
+    assert reader.read_many_sample(data, 400) == 400
+
+    with pytest.raises(DaqError):
+        decimator.read()
+    assert decimator.read().shape[1] == 0
@@ -0,0 +1,68 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+import numpy
+import pytest
+from artdaq.processing import ProcessingPool
+
+
+def _total(block):
+    return float(block.sum())
+
+
+def _fail(block):
+    raise ValueError('The block cannot be analyzed.')
+
+
+def _pool(slots, **functions):
+    pool = ProcessingPool((2, 100), slots=slots, processes=1)
+    for name, function in functions.items():
+        pool.register(name, function)
+    return pool
+
+
+def test_results_of_every_block():
+    with _pool(2, total=_total) as pool:
+
+        for value in range(5):
+            pool.submit(numpy.full((2, 100), float(value)), timeout=10.0)
+        results = [pool.get_result(timeout=10.0) for _ in range(5)]
+
+    assert [r.sequence_number for r in results] == list(range(5))
+    assert [r.results['total'] for r in results] == [
+        200.0 * value for value in range(5)]
+    assert pool.statistics.blocks_completed == 5
+
+
+def test_function_error_is_reported_in_the_result():
+    with _pool(2, fail=_fail) as pool:
+
+        pool.submit(numpy.zeros((2, 100)), timeout=10.0)
+        result = pool.get_result(timeout=10.0)
+
+    assert result.error is not None
+    assert pool.statistics.blocks_failed == 1
+
+
+def test_callback_error_is_raised_and_slots_are_recycled():
+    called = threading.Event()
+
+    def callback(result):
+        called.set()
+        raise RuntimeError('The callback failed.')
+
+    pool = _pool(1, total=_total)
+    pool.add_result_callback(callback)
+    with pool:
+
+        pool.submit(numpy.zeros((2, 100)), timeout=10.0)
+        assert called.wait(10.0)
+
+        with pytest.raises(RuntimeError):
+            pool.submit(numpy.zeros((2, 100)), timeout=10.0)
+        # The single slot was released despite the error.
+        pool.submit(numpy.zeros((2, 100)), timeout=10.0)
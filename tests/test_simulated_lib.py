@@ -0,0 +1,36 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import pytest
+from artdaq.constants import AcquisitionType
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+
+def test_finite_read_returns_requested_samples(task):
+    task.ai_channels.add_ai_voltage_chan(
+        'Dev1/ai0:1', min_val=-5.0, max_val=5.0)
+    task.timing.cfg_samp_clk_timing(
+        1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=200)
+
+    data = numpy.array(task.read(200))
+
+    assert data.shape == (2, 200)
+    assert numpy.all(numpy.abs(data) <= 5.0)
+
+
+def test_read_past_end_of_finite_acquisition_raises(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0')
+    task.timing.cfg_samp_clk_timing(
+        1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=100)
+    task.start()
+    task.read(100)
+
+    with pytest.raises(DaqError) as excinfo:
+        task.read(1)
+    assert (excinfo.value.error_code ==
+            Errors.SAMPLES_WILL_NEVER_BE_AVAILABLE.value)
+
@@ -0,0 +1,85 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import pytest
+from artdaq.errors import DaqError
+from artdaq.stream_readers import AnalogMultiChannelReader
+from artdaq.stream_statistics import StreamStatistics
+
+
+def _samples():
+    random_state = numpy.random.RandomState(0)
+    return 1000.0 + random_state.standard_normal((3, 1000))
+
+
+def _assert_statistics(statistics, data):
+    assert statistics.count == data.shape[1]
+    numpy.testing.assert_allclose(statistics.minimum, data.min(axis=1))
+    numpy.testing.assert_allclose(statistics.maximum, data.max(axis=1))
+    numpy.testing.assert_allclose(statistics.mean, data.mean(axis=1))
+    numpy.testing.assert_allclose(
+        statistics.rms, numpy.sqrt((data * data).mean(axis=1)))
+    numpy.testing.assert_allclose(
+        statistics.standard_deviation, data.std(axis=1), rtol=1e-9)
+    numpy.testing.assert_allclose(
+        statistics.peak_to_peak, numpy.ptp(data, axis=1))
+
+
+def test_statistics_match_numpy():
+    data = _samples()
+    statistics = StreamStatistics()
+
+    for start in range(0, data.shape[1], 130):
+        statistics.update(data[:, start:start + 130])
+
+    _assert_statistics(statistics.read(), data)
+
+
+def test_window_covers_most_recent_blocks():
+    data = _samples()
+    statistics = StreamStatistics(window=3)
+
+    for start in range(0, data.shape[1], 100):
+        statistics.update(data[:, start:start + 100])
+
+    _assert_statistics(statistics.read(), data[:, 700:])
+
+
+def test_reset_on_read():
+    data = _samples()
+    statistics = StreamStatistics(reset_on_read=True)
+
+    statistics.update(data[:, :500])
+    statistics.read()
+    statistics.update(data[:, 500:])
+
+    _assert_statistics(statistics.read(), data[:, 500:])
+    assert statistics.read().count == 0
+
+
+def test_reset_allows_a_different_number_of_channels():
+    data = _samples()
+    statistics = StreamStatistics()
+    statistics.update(data)
+
+    with pytest.raises(DaqError):
+        statistics.update(data[:2])
+
+    statistics.reset()
+    statistics.update(data[:2])
+    _assert_statistics(statistics.read(), data[:2])
+
+
+def test_attached_statistics_select_channels_by_name(task):
+    task.ai_channels.add_ai_voltage_chan('Dev1/ai0:2')
+    reader = AnalogMultiChannelReader(task.in_stream)
+    statistics = StreamStatistics(channels=['Dev1/ai1'])
+    statistics.attach(reader)
+    data = numpy.zeros((3, 300))
+
+    reader.read_many_sample(data, 300)
+
+    _assert_statistics(statistics.read(), data[1:2])
@@ -0,0 +1,67 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+from artdaq.constants import AcquisitionType, TaskControl
+from artdaq.task import Task
+from artdaq.task_pool import TaskPool
+from artdaq.task_templates import TaskTemplate
+
+
+def _template():
+    template = TaskTemplate()
+    template.add_channels(
+        'ai_channels', 'add_ai_voltage_chan', physical_channel='Dev1/ai0:1')
+    template.cfg_timing(
+        rate=1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=100)
+    return template
+
+
+def test_pool_reuses_tasks():
+    with TaskPool(_template(), size=1) as pool:
+        with pool.task() as first:
+            first.read(100)
+        assert pool.available == 1
+
+        with pool.task() as second:
+            data = second.read(100)
+
+    assert second is first
+    assert len(data) == 2
+    assert len(data[0]) == 100
+
+
+@pytest.mark.parametrize('state', [
+    TaskControl.TASK_VERIFY, TaskControl.TASK_RESERVE,
+    TaskControl.TASK_COMMIT])
+def test_run_reads_and_times_finite_acquisitions(state):
+    with TaskPool(TaskTemplate.from_json(_template().to_json()),
+                  state=state) as pool:
+        for _ in range(3):
+            data = pool.run(100)
+            assert data.shape == (2, 100)
+
+        statistics = pool.statistics
+        assert statistics.runs == 3
+        assert 0 <= statistics.mean_start_latency <= (
+            statistics.max_start_latency)
+        assert 0 <= statistics.mean_first_sample_latency <= (
+            statistics.max_first_sample_latency)
+
+        pool.reset_statistics()
+        assert pool.statistics.runs == 0
+
+
+def test_closed_tasks_keep_their_hash():
+    first = Task()
+    second = Task()
+    tasks = {first, second}
+    first.close()
+    second.close()
+
+    assert first != second
+    assert first == first
+    tasks.remove(first)
+    assert tasks == {second}
@@ -0,0 +1,54 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+
+from artdaq.constants import AcquisitionType, TerminalConfiguration
+from artdaq.task_templates import TaskTemplate
+
+
+def _template():
+    template = TaskTemplate('acquisition')
+    template.add_channels(
+        'ai_channels', 'add_ai_voltage_chan', physical_channel='Dev1/ai0:1',
+        terminal_config=TerminalConfiguration.RSE, min_val=-5.0, max_val=5.0)
+    template.add_channels(
+        'ai_channels', 'add_ai_voltage_chan', physical_channel='Dev1/ai2',
+        min_val=-5.0, max_val=5.0)
+    template.cfg_timing(
+        rate=1000.0, sample_mode=AcquisitionType.FINITE, samps_per_chan=100)
+    return template
+
+
+def test_json_round_trip():
+    template = _template()
+
+    text = template.to_json()
+    loaded = TaskTemplate.from_json(text)
+
+    assert json.loads(text)['name'] == 'acquisition'
+    assert loaded == template
+    assert loaded.to_json() == text
+
+
+def test_save_and_load(tmp_path):
+    template = _template()
+    file_path = str(tmp_path / 'acquisition.json')
+
+    template.save(file_path)
+
+    assert TaskTemplate.load(file_path) == template
+
+
+def test_instantiate_loaded_template():
+    template = TaskTemplate.from_json(_template().to_json())
+
+    with template.instantiate() as task:
+        assert task.channel_names == ['Dev1/ai0', 'Dev1/ai1', 'Dev1/ai2']
+        assert task.timing.samp_quant_samp_per_chan == 100
+        data = task.read(100)
+
+    assert len(data) == 3
+    assert len(data[0]) == 100
@@ -16,6 +16,18 @@ CtrTick = collections.namedtuple(
 CtrTime = collections.namedtuple(
     'CtrTime', ['high_time', 'low_time'])
 
+# Columnar counterparts of the namedtuples above, holding one NumPy array
+# per field instead of one namedtuple per sample.
+
+CtrFreqArray = collections.namedtuple(
+    'CtrFreqArray', ['freq', 'duty_cycle'])
+
+CtrTickArray = collections.namedtuple(
+    'CtrTickArray', ['high_tick', 'low_tick'])
+
+CtrTimeArray = collections.namedtuple(
+    'CtrTimeArray', ['high_time', 'low_time'])
+
 # endregion
 
 
@@ -31,3 +43,94 @@ DOResistorPowerUpState = collections.namedtuple(
     'DOResistorPowerUpState', ['physical_channel', 'power_up_state'])
 
 # endregion
+
+
+# region Stream Reader namedtuples
+
+RingBufferBlock = collections.namedtuple(
+    'RingBufferBlock', ['sequence_number', 'data'])
+
+AcquiredBlock = collections.namedtuple(
+    'AcquiredBlock', ['sequence_number', 'data', 'notification_time'])
+
+BlockPipelineStatistics = collections.namedtuple(
+    'BlockPipelineStatistics',
+    ['blocks_delivered', 'blocks_dropped', 'queue_depth', 'max_queue_depth',
+     'mean_latency', 'max_latency'])
+
+# endregion
+
+
+# region Stream Writer namedtuples
+
+StreamingWriterStatistics = collections.namedtuple(
+    'StreamingWriterStatistics',
+    ['blocks_written', 'underflow_count', 'prefetched_blocks',
+     'mean_latency', 'max_latency'])
+
+# endregion
+
+
+# region Channel Collection namedtuples
+
+ChannelConfigurationResult = collections.namedtuple(
+    'ChannelConfigurationResult',
+    ['calls', 'values_set', 'values_skipped', 'elapsed_time'])
+
+# endregion
+
+
+# region Task Pool namedtuples
+
+TaskPoolStatistics = collections.namedtuple(
+    'TaskPoolStatistics',
+    ['runs', 'mean_start_latency', 'max_start_latency',
+     'mean_first_sample_latency', 'max_first_sample_latency'])
+
+# endregion
+
+
+# region Synchronization namedtuples
+
+SynchronizedBlock = collections.namedtuple(
+    'SynchronizedBlock',
+    ['sequence_number', 'first_sample_index', 'timestamp', 'data'])
+
+# endregion
+
+
+# region Multi Device namedtuples
+
+DeviceReaderStatistics = collections.namedtuple(
+    'DeviceReaderStatistics',
+    ['device', 'blocks_read', 'lag', 'max_lag', 'mean_read_time'])
+
+MultiDeviceStatistics = collections.namedtuple(
+    'MultiDeviceStatistics',
+    ['blocks_delivered', 'blocks_dropped', 'devices'])
+
+# endregion
+
+
+# region Processing namedtuples
+
+ProcessingResult = collections.namedtuple(
+    'ProcessingResult', ['sequence_number', 'results', 'error'])
+
+ProcessingStatistics = collections.namedtuple(
+    'ProcessingStatistics',
+    ['blocks_submitted', 'blocks_completed', 'blocks_failed',
+     'backpressure_waits', 'slots_in_use', 'max_slots_in_use',
+     'mean_latency'])
+
+# endregion
+
+
+# region Stream Statistics namedtuples
+
+ChannelStatistics = collections.namedtuple(
+    'ChannelStatistics',
+    ['count', 'minimum', 'maximum', 'mean', 'rms', 'standard_deviation',
+     'peak_to_peak'])
+
+# endregion
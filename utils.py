@@ -3,10 +3,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bisect
+import collections
 import re
+import threading
 
+import six
+from six.moves import collections_abc
 from artdaq.errors import DaqError
 
+__all__ = ['flatten_channel_string', 'unflatten_channel_string',
+           'ChannelNames']
+
 # Method logic adapted from
 
 _invalid_range_syntax_message = (
@@ -17,6 +25,169 @@ _invalid_range_syntax_message = (
     "the colon. Colons are not allowed within the names of the individual "
     "objects.")
 
+# Splits a channel name into the base name and the number it ends in, if
+# any, for flattening.
+_trailing_number_pattern = re.compile('(.*[^0-9])?([0-9]+)$')
+
+# Splits each end of a range of channels into the base name and number.
+_range_endpoint_pattern = re.compile('(.*?)([0-9]+)$')
+
+_CACHE_SIZE = 1024
+
+
+class _LRUCache(object):
+    """
+    Bounded, thread-safe mapping that evicts the least recently used
+    entry when full.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._entries[key] = value
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_unflatten_cache = _LRUCache(_CACHE_SIZE)
+_flatten_cache = _LRUCache(_CACHE_SIZE)
+
+
+class ChannelNames(collections_abc.Sequence):
+    """
+    Immutable sequence of channel names returned by
+    unflatten_channel_string.
+
+    Ranges of channels, such as "Dev1/ai0:4095", are kept as ranges and
+    only expanded into names when indexed or iterated, so their length
+    and membership tests do not depend on the size of the range. The
+    sequence compares equal to a list or tuple of the same names.
+    """
+
+    __slots__ = ['_segments', '_offsets', '_length', '_hash']
+
+    def __init__(self, segments):
+        """
+        Args:
+            segments (List[Union[str, Tuple[str, int, int]]]): Specifies
+                the names and ranges of names in the sequence. A range
+                is the base name, the first number and the last number,
+                which may be lower than the first.
+        """
+        self._segments = tuple(segments)
+        self._offsets = []
+        length = 0
+        for segment in self._segments:
+            self._offsets.append(length)
+            length += _segment_length(segment)
+        self._length = length
+        self._hash = None
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._length)))
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('ChannelNames index out of range')
+
+        position = bisect.bisect_right(self._offsets, index) - 1
+        segment = self._segments[position]
+        if isinstance(segment, six.string_types):
+            return segment
+
+        base_name, first, last = segment
+        step = 1 if last >= first else -1
+        return '{0}{1}'.format(
+            base_name, first + step * (index - self._offsets[position]))
+
+    def __iter__(self):
+        for segment in self._segments:
+            if isinstance(segment, six.string_types):
+                yield segment
+            else:
+                base_name, first, last = segment
+                step = 1 if last >= first else -1
+                for number in range(first, last + step, step):
+                    yield '{0}{1}'.format(base_name, number)
+
+    def __contains__(self, item):
+        if not isinstance(item, six.string_types):
+            return False
+
+        match = None
+        for segment in self._segments:
+            if isinstance(segment, six.string_types):
+                if segment == item:
+                    return True
+                continue
+
+            if match is None:
+                match = _range_endpoint_pattern.match(item)
+                if not match:
+                    match = False
+            if not match:
+                continue
+
+            base_name, first, last = segment
+            digits = match.group(2)
+            number = int(digits)
+            if (match.group(1) == base_name and
+                    digits == '{0}'.format(number) and
+                    min(first, last) <= number <= max(first, last)):
+                return True
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, ChannelNames):
+            return (self._segments == other._segments or
+                    tuple(self) == tuple(other))
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._length and tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self):
+        return 'ChannelNames({0!r})'.format(','.join(
+            segment if isinstance(segment, six.string_types) else
+            '{0}{1}:{2}'.format(*segment) for segment in self._segments))
+
+
+def _segment_length(segment):
+    if isinstance(segment, six.string_types):
+        return 1
+    _, first, last = segment
+    return abs(last - first) + 1
+
 
 def flatten_channel_string(channel_names):
     """
@@ -35,78 +206,87 @@ def flatten_channel_string(channel_names):
         The resulting comma-delimited list of physical or virtual channel
         names.
     """
-    unflattened_channel_names = []
-    for channel_name in channel_names:
-        unflattened_channel_names.extend(unflatten_channel_string(channel_name))
+    key = tuple(channel_names)
+    flattened = _flatten_cache.get(key)
+    if flattened is None:
+        flattened = _flatten_channel_names(key)
+        _flatten_cache.put(key, flattened)
+    return flattened
 
-    # Go through the channel names and flatten them.
+
+def _flatten_channel_names(channel_names):
+    # Go through the channel names and flatten them. Each entry of
+    # flattened_channel_list is a base name, the first number and the last
+    # number, which are -1 if the name does not end in a number.
     flattened_channel_list = []
-    previous = {
-        'base_name': '',
-        'start_index': -1,
-        'end_index': -1
-        }
-    for channel_name in unflattened_channel_names:
-        m = re.search('(.*[^0-9])?([0-9]+)$', channel_name)
-        if not m:
-            # If the channel name doesn't end in a valid number, just use the
-            # channel name as-is.
-            flattened_channel_list.append(
-                _channel_info_to_flattened_name(previous))
-            previous = {
-                'base_name': channel_name,
-                'start_index': -1,
-                'end_index': -1
-                }
+    previous = ['', -1, -1]
+
+    def add_name(base_name, index):
+        start_index, end_index = previous[1], previous[2]
+        if base_name == previous[0] and (
+                (index == end_index + 1 and end_index >= start_index) or
+                (index == end_index - 1 and end_index <= start_index)):
+            # If the current channel name has the same base name as the
+            # previous and it's end index differs by 1, change the end
+            # index value. It gets flattened later.
+            previous[2] = index
         else:
-            # If the channel name ends in a valid number, we may need to flatten
-            # this channel with subsequent channels in the x:y format.
-            current_base_name = m.group(1)
-            current_index = int(m.group(2))
-
-            if current_base_name == previous['base_name'] and (
-                (current_index == previous['end_index'] + 1 and
-                 previous['end_index'] >= previous['start_index']) or
-                (current_index == previous['end_index'] - 1 and
-                 previous['end_index'] <= previous['start_index'])):
-                # If the current channel name has the same base name as the
-                # previous and it's end index differs by 1, change the end
-                # index value. It gets flattened later.
-                previous['end_index'] = current_index
+            # If the current channel name has the same base name as the
+            # previous or it's end index differs by more than 1, it doesn't
+            # get flattened with the previous channel.
+            flattened_channel_list.append(tuple(previous))
+            previous[:] = [base_name, index, index]
+
+    for channel_name in channel_names:
+        for segment in unflatten_channel_string(channel_name)._segments:
+            if not isinstance(segment, six.string_types):
+                base_name, first, last = segment
+                step = 1 if last >= first else -1
+                # Names of the form "<digits>" have no base name.
+                base_name = base_name or None
+
+                # After the first two names of a range, the previous
+                # channel runs in the direction of the range, so the
+                # remaining names only extend it.
+                add_name(base_name, first)
+                if last != first:
+                    add_name(base_name, first + step)
+                    previous[2] = last
+                continue
+
+            m = _trailing_number_pattern.search(segment)
+            if not m:
+                # If the channel name doesn't end in a valid number, just use
+                # the channel name as-is.
+                flattened_channel_list.append(tuple(previous))
+                previous[:] = [segment, -1, -1]
             else:
-                # If the current channel name has the same base name as the
-                # previous or it's end index differs by more than 1, it doesn't
-                # get flattened with the previous channel.
-                flattened_channel_list.append(
-                    _channel_info_to_flattened_name(previous))
-                previous = {
-                    'base_name': current_base_name,
-                    'start_index': current_index,
-                    'end_index': current_index
-                    }
-
-    # Convert the final channel dictionary to a flattened string
-    flattened_channel_list.append(
-        _channel_info_to_flattened_name(previous))
+                # If the channel name ends in a valid number, we may need to
+                # flatten this channel with subsequent channels in the x:y
+                # format.
+                add_name(m.group(1), int(m.group(2)))
+
+    # Convert the final channel to a flattened name
+    flattened_channel_list.append(tuple(previous))
 
     # Remove empty strings in list, convert to comma-delimited string, then trim
     # whitespace.
-    return ','.join([_f for _f in flattened_channel_list if _f]).strip()
+    flattened_names = [
+        _channel_info_to_flattened_name(*channel_info)
+        for channel_info in flattened_channel_list]
+    return ','.join([_f for _f in flattened_names if _f]).strip()
 
     
-def _channel_info_to_flattened_name(channel_info):
+def _channel_info_to_flattened_name(base_name, start_index, end_index):
     """
     Simple method to generate a flattened channel name.
     """
-    if channel_info['start_index'] == -1:
-        return channel_info['base_name']
-    elif channel_info['start_index'] == channel_info['end_index']:
-        return '{0}{1}'.format(channel_info['base_name'],
-                               channel_info['start_index'])
+    if start_index == -1:
+        return base_name
+    elif start_index == end_index:
+        return '{0}{1}'.format(base_name or '', start_index)
     else:
-        return '{0}{1}:{2}'.format(channel_info['base_name'],
-                                   channel_info['start_index'],
-                                   channel_info['end_index'])
+        return '{0}{1}:{2}'.format(base_name or '', start_index, end_index)
 
                                    
 def unflatten_channel_string(channel_names):
@@ -117,16 +297,27 @@ def unflatten_channel_string(channel_names):
     physical or virtual channels into a list of physical or virtual channel
     names.
 
+    Results are cached, so converting the same string again does not parse
+    it again.
+
     Args:
         channel_names (str): The list or range of physical or virtual channels.
         
     Returns:
-        List[str]: 
+        artdaq.utils.ChannelNames: 
         
-        The list of physical or virtual channel names. Each element of the 
-        list contains a single channel.
+        The immutable sequence of physical or virtual channel names. Each
+        element of the sequence contains a single channel.
     """
-    channel_list_to_return = []
+    unflattened = _unflatten_cache.get(channel_names)
+    if unflattened is None:
+        unflattened = ChannelNames(_parse_channel_string(channel_names))
+        _unflatten_cache.put(channel_names, unflattened)
+    return unflattened
+
+
+def _parse_channel_string(channel_names):
+    segments = []
     channel_list = [c for c in channel_names.strip().split(',') if c]
 
     for channel in channel_list:
@@ -134,13 +325,13 @@ def unflatten_channel_string(channel_names):
         colon_index = channel.find(':')
 
         if colon_index == -1:
-            channel_list_to_return.append(channel)
+            segments.append(channel)
         else:
             before = channel[:colon_index]
             after = channel[colon_index+1:]
 
-            m_before = re.match('(.*?)([0-9]+)$', before)
-            m_after = re.match('(.*?)([0-9]+)$', after)
+            m_before = _range_endpoint_pattern.match(before)
+            m_after = _range_endpoint_pattern.match(after)
 
             if not m_before or not m_after:
                 raise DaqError(_invalid_range_syntax_message,
@@ -152,22 +343,12 @@ def unflatten_channel_string(channel_names):
 
             num_before = int(m_before.group(2))
             num_after = int(m_after.group(2))
-            num_max = max([num_before, num_after])
-            num_min = min([num_before, num_after])
-            number_of_channels = (num_max - num_min) + 1
+            number_of_channels = abs(num_after - num_before) + 1
 
             if number_of_channels >= 15000:
                 raise DaqError(_invalid_range_syntax_message,
                                error_code=-200498)
 
-            colon_expanded_channel = []
-            for i in range(number_of_channels):
-                colon_expanded_channel.append(
-                    '{0}{1}'.format(m_before.group(1), num_min + i))
-
-            if num_after < num_before:
-                colon_expanded_channel.reverse()
-
-            channel_list_to_return.extend(colon_expanded_channel)
+            segments.append((m_before.group(1), num_before, num_after))
 
-    return channel_list_to_return
+    return segments
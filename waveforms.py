@@ -0,0 +1,442 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import threading
+
+import numpy
+from artdaq._task_modules.write_functions import (
+    _write_analog_f_64, _write_digital_u_32)
+from artdaq.error_codes import Errors
+from artdaq.errors import DaqError
+
+__all__ = ['sine', 'square', 'chirp', 'prbs', 'WaveformCache',
+           'get_default_cache', 'write_waveform']
+
+# Exponents of the feedback polynomials x^a + x^b + 1 of the standard
+# maximal-length pseudorandom binary sequences, keyed by order.
+_PRBS_TAPS = {
+    7: (7, 6),
+    9: (9, 5),
+    11: (11, 9),
+    15: (15, 14),
+    20: (20, 3),
+    23: (23, 18),
+    31: (31, 28),
+}
+
+
+def _freeze(array):
+    array.flags.writeable = False
+    return array
+
+
+def _phase(frequency, sample_rate, number_of_samples, phase):
+    return (2 * numpy.pi * frequency / sample_rate *
+            numpy.arange(number_of_samples, dtype=numpy.float64) + phase)
+
+
+def sine(frequency, sample_rate, number_of_samples, amplitude=1.0,
+         offset=0.0, phase=0.0):
+    """
+    Builds a sine wave.
+
+    Args:
+        frequency (float): Specifies the frequency in Hz.
+        sample_rate (float): Specifies the sample rate in samples per
+            second.
+        number_of_samples (int): Specifies the number of samples.
+        amplitude (Optional[float]): Specifies the amplitude.
+        offset (Optional[float]): Specifies the DC offset.
+        phase (Optional[float]): Specifies the phase of the first sample
+            in radians.
+    Returns:
+        numpy.ndarray:
+
+        Indicates a read-only, C-contiguous 1D float64 array.
+    """
+    data = _phase(frequency, sample_rate, number_of_samples, phase)
+    numpy.sin(data, out=data)
+    data *= amplitude
+    data += offset
+    return _freeze(data)
+
+
+def square(frequency, sample_rate, number_of_samples, amplitude=1.0,
+           offset=0.0, duty_cycle=0.5, phase=0.0):
+    """
+    Builds a square wave that alternates between offset + amplitude and
+    offset - amplitude.
+
+    Args:
+        frequency (float): Specifies the frequency in Hz.
+        sample_rate (float): Specifies the sample rate in samples per
+            second.
+        number_of_samples (int): Specifies the number of samples.
+        amplitude (Optional[float]): Specifies the amplitude.
+        offset (Optional[float]): Specifies the DC offset.
+        duty_cycle (Optional[float]): Specifies the fraction of each
+            period spent at the high level.
+        phase (Optional[float]): Specifies the phase of the first sample
+            in radians.
+    Returns:
+        numpy.ndarray:
+
+        Indicates a read-only, C-contiguous 1D float64 array.
+    """
+    cycles = _phase(frequency, sample_rate, number_of_samples, phase)
+    cycles /= 2 * numpy.pi
+    data = numpy.where(numpy.mod(cycles, 1.0) < duty_cycle, 1.0, -1.0)
+    data *= amplitude
+    data += offset
+    return _freeze(data)
+
+
+def chirp(start_frequency, end_frequency, sample_rate, number_of_samples,
+          amplitude=1.0, offset=0.0, logarithmic=False):
+    """
+    Builds a sine wave whose frequency sweeps from start_frequency to
+    end_frequency over the number of samples.
+
+    Args:
+        start_frequency (float): Specifies the frequency in Hz of the
+            first sample.
+        end_frequency (float): Specifies the frequency in Hz of the last
+            sample.
+        sample_rate (float): Specifies the sample rate in samples per
+            second.
+        number_of_samples (int): Specifies the number of samples.
+        amplitude (Optional[float]): Specifies the amplitude.
+        offset (Optional[float]): Specifies the DC offset.
+        logarithmic (Optional[bool]): Specifies whether the frequency
+            sweeps logarithmically instead of linearly. Both frequencies
+            must then be positive.
+    Returns:
+        numpy.ndarray:
+
+        Indicates a read-only, C-contiguous 1D float64 array.
+    """
+    time = numpy.arange(number_of_samples, dtype=numpy.float64) / sample_rate
+    duration = max(number_of_samples - 1, 1) / sample_rate
+
+    if logarithmic:
+        ratio = end_frequency / start_frequency
+        if ratio == 1.0:
+            data = 2 * numpy.pi * start_frequency * time
+        else:
+            rate = numpy.log(ratio) / duration
+            data = (2 * numpy.pi * start_frequency / rate *
+                    numpy.expm1(rate * time))
+    else:
+        sweep = (end_frequency - start_frequency) / duration
+        data = 2 * numpy.pi * (start_frequency + sweep / 2 * time) * time
+
+    numpy.sin(data, out=data)
+    data *= amplitude
+    data += offset
+    return _freeze(data)
+
+
+def _prbs_bits(order, number_of_bits, seed):
+    a, b = _PRBS_TAPS[order]
+    bits = numpy.empty(max(number_of_bits, a), dtype=numpy.uint8)
+    bits[:a] = (seed >> numpy.arange(a)) & 1
+
+    # A sequence that follows the recurrence of x^a + x^b + 1 also follows
+    # the recurrence of its square x^2a + x^2b + 1, so once enough bits
+    # exist, each step can produce twice as many bits as the one before.
+    position = a
+    scale = 1
+    while position < number_of_bits:
+        while position >= 2 * a * scale:
+            scale *= 2
+
+        count = min(b * scale, number_of_bits - position)
+        numpy.bitwise_xor(
+            bits[position - a * scale:position - a * scale + count],
+            bits[position - b * scale:position - b * scale + count],
+            out=bits[position:position + count])
+        position += count
+
+    return bits[:number_of_bits]
+
+
+def prbs(order, number_of_samples, number_of_lines=1, seed=1):
+    """
+    Builds a maximal-length pseudorandom binary sequence for a digital
+    port.
+
+    Consecutive bits of the sequence are assigned to the lines of each
+    sample, starting with the least significant line, so each line
+    carries the sequence decimated by the number of lines.
+
+    Args:
+        order (int): Specifies the order of the sequence, which repeats
+            every 2**order - 1 bits. Must be 7, 9, 11, 15, 20, 23 or 31.
+        number_of_samples (int): Specifies the number of samples.
+        number_of_lines (Optional[int]): Specifies the number of lines
+            of the port, from 1 to 32.
+        seed (Optional[int]): Specifies the nonzero initial state of the
+            shift register.
+    Returns:
+        numpy.ndarray:
+
+        Indicates a read-only, C-contiguous 1D uint32 array.
+    """
+    if order not in _PRBS_TAPS or seed % (1 << order) == 0:
+        raise DaqError(
+            'The pseudorandom binary sequence cannot be built, because the '
+            'order is not supported or the seed is zero.\n\n'
+            'Order: {0}\n'
+            'Supported orders: {1}\n'
+            'Seed: {2}'.format(order, sorted(_PRBS_TAPS), seed),
+            Errors.UNKNOWN.value)
+
+    bits = _prbs_bits(order, number_of_samples * number_of_lines, seed)
+    weights = numpy.left_shift(
+        numpy.uint32(1), numpy.arange(number_of_lines, dtype=numpy.uint32))
+    data = numpy.dot(
+        bits.reshape(number_of_samples, number_of_lines).astype(numpy.uint32),
+        weights).astype(numpy.uint32)
+    return _freeze(data)
+
+
+class WaveformCache(object):
+    """
+    Keeps the waveforms built most recently, keyed by their parameters,
+    within a memory budget.
+
+    When adding a waveform would exceed the budget, the least recently
+    used waveforms are evicted. Cached waveforms are read-only, so they
+    can be shared by every caller and written repeatedly with
+    "write_waveform".
+
+    Example:
+        >>> cache = get_default_cache()
+        >>> data = cache.sine(1000.0, 100000.0, 10000, amplitude=2.0)
+        >>> write_waveform(task.out_stream, data)
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (Optional[int]): Specifies the maximum number of
+                bytes of waveforms to keep.
+        """
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def max_bytes(self):
+        """
+        int: Specifies the maximum number of bytes of waveforms to keep.
+            Lowering it evicts waveforms immediately.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, val):
+        with self._lock:
+            self._max_bytes = val
+            self._evict(0)
+
+    @property
+    def nbytes(self):
+        """
+        int: Indicates the number of bytes of waveforms kept.
+        """
+        return self._nbytes
+
+    @property
+    def hits(self):
+        """
+        int: Indicates the number of waveforms returned from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        int: Indicates the number of waveforms built because they were
+            not in the cache.
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        int: Indicates the number of waveforms evicted to stay within
+            the memory budget.
+        """
+        return self._evictions
+
+    def get(self, key, build):
+        """
+        Returns the waveform cached under a key, building and caching it
+        if necessary.
+
+        Args:
+            key: Specifies a hashable key that identifies the waveform,
+                usually a tuple of its name and parameters.
+            build (function): Specifies the function, taking no
+                arguments, that builds the waveform. It is called
+                outside the lock of the cache.
+        Returns:
+            numpy.ndarray:
+
+            Indicates the read-only waveform.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries[key] = self._entries.pop(key)
+                self._hits += 1
+                return data
+            self._misses += 1
+
+        data = numpy.ascontiguousarray(build())
+        data.flags.writeable = False
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            if data.nbytes <= self._max_bytes:
+                self._evict(data.nbytes)
+                self._entries[key] = data
+                self._nbytes += data.nbytes
+        return data
+
+    def sine(self, frequency, sample_rate, number_of_samples, amplitude=1.0,
+             offset=0.0, phase=0.0):
+        """
+        Returns a cached sine wave. See the "sine" function for more
+        info.
+        """
+        return self.get(
+            ('sine', frequency, sample_rate, number_of_samples, amplitude,
+             offset, phase),
+            lambda: sine(frequency, sample_rate, number_of_samples,
+                         amplitude, offset, phase))
+
+    def square(self, frequency, sample_rate, number_of_samples,
+               amplitude=1.0, offset=0.0, duty_cycle=0.5, phase=0.0):
+        """
+        Returns a cached square wave. See the "square" function for more
+        info.
+        """
+        return self.get(
+            ('square', frequency, sample_rate, number_of_samples, amplitude,
+             offset, duty_cycle, phase),
+            lambda: square(frequency, sample_rate, number_of_samples,
+                           amplitude, offset, duty_cycle, phase))
+
+    def chirp(self, start_frequency, end_frequency, sample_rate,
+              number_of_samples, amplitude=1.0, offset=0.0,
+              logarithmic=False):
+        """
+        Returns a cached chirp. See the "chirp" function for more info.
+        """
+        return self.get(
+            ('chirp', start_frequency, end_frequency, sample_rate,
+             number_of_samples, amplitude, offset, logarithmic),
+            lambda: chirp(start_frequency, end_frequency, sample_rate,
+                          number_of_samples, amplitude, offset, logarithmic))
+
+    def prbs(self, order, number_of_samples, number_of_lines=1, seed=1):
+        """
+        Returns a cached pseudorandom binary sequence. See the "prbs"
+        function for more info.
+        """
+        return self.get(
+            ('prbs', order, number_of_samples, number_of_lines, seed),
+            lambda: prbs(order, number_of_samples, number_of_lines, seed))
+
+    def clear(self):
+        """
+        Evicts every waveform.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _evict(self, nbytes):
+        while self._entries and self._nbytes + nbytes > self._max_bytes:
+            _, data = self._entries.popitem(last=False)
+            self._nbytes -= data.nbytes
+            self._evictions += 1
+
+
+_default_cache = WaveformCache()
+
+
+def get_default_cache():
+    """
+    Returns the waveform cache shared by the whole process.
+
+    Returns:
+        WaveformCache:
+
+        Indicates the shared cache.
+    """
+    return _default_cache
+
+
+def write_waveform(task_out_stream, data, auto_start=False, timeout=10.0):
+    """
+    Writes a waveform built by this module, or any C-contiguous array,
+    straight to the driver, without the shape checks of the stream
+    writers.
+
+    float64 waveforms are written to analog output channels and uint32
+    waveforms to digital output ports, one port per channel.
+
+    Args:
+        task_out_stream: Specifies the output stream associated with an
+            ArtDAQ task to which to write samples.
+        data (numpy.ndarray): Specifies a C-contiguous float64 or uint32
+            array with one row per channel, or a 1D array if the task has
+            one channel.
+        auto_start (Optional[bool]): Specifies whether to start the task
+            if you did not start it explicitly.
+        timeout (Optional[float]): Specifies the amount of time in
+            seconds to wait for the method to write all samples.
+    Returns:
+        int:
+
+        Indicates the number of samples per channel written.
+    """
+    task = task_out_stream._task
+    number_of_channels = task._metadata.number_of_channels
+    rows = data.shape[0] if data.ndim == 2 else 1
+    if rows != number_of_channels:
+        task._raise_invalid_write_num_chans_error(number_of_channels, rows)
+
+    if data.dtype == numpy.float64:
+        write_function = _write_analog_f_64
+    elif data.dtype == numpy.uint32:
+        write_function = _write_digital_u_32
+    else:
+        raise DaqError(
+            'The waveform cannot be written, because its data type is not '
+            'float64 or uint32.\n\n'
+            'Data type: {0}'.format(data.dtype),
+            Errors.UNKNOWN.value, task_name=task.name)
+
+    return write_function(
+        task._handle, data, data.shape[-1], auto_start, timeout)